@@ -0,0 +1,130 @@
+"""Lõi tính toán của Virtual Semiconductor Lab (không phụ thuộc Streamlit/Plotly).
+
+Giao diện ``semiconductor_lab.py`` chỉ gọi vào các hàm ở đây, nhờ đó các mô
+hình có thể import, kiểm thử và chạy hàng loạt mà không cần mở trang web.
+"""
+from semilab.basic import (
+    ohm_current,
+    ohm_resistance,
+    ohm_voltage,
+    photon_energy_ev,
+    photon_wavelength_nm,
+)
+from semilab.carriers import CARRIER_MATERIALS, CarrierState, fermi_dirac_half, solve_fermi_level
+from semilab.circuits import QPointSolution, solve_diode_resistor
+from semilab.devices import (
+    DIODE_MATERIALS,
+    diode_current,
+    diode_curve,
+    diode_curve_adaptive,
+    diode_sweep,
+    diode_sweep_grid,
+    mosfet_curves,
+    mosfet_curves_adaptive,
+    mosfet_family,
+    mosfet_id,
+    thermal_voltage,
+)
+from semilab.eventsim import EventSimulator, SequentialNetlist, SimulationResult
+from semilab.fab import (
+    Beam,
+    BeamPath,
+    Box,
+    MergedMesh,
+    box_vertices,
+    merge_beams,
+    merge_boxes,
+)
+from semilab.logic import GATES, Netlist, evaluate_gate
+from semilab.montecarlo import MonteCarloResult, diode_monte_carlo, mosfet_monte_carlo
+from semilab.pn_junction import JunctionSolution, abrupt_doping, graded_doping, solve_pn_junction
+from semilab.resistor import (
+    BAND_COUNTS,
+    BAND_NAMES,
+    COLORS,
+    E_SERIES,
+    MULTIPLIER_COLORS,
+    TOLERANCE_COLORS,
+    BomCheck,
+    ResistorCode,
+    check_bom,
+    decode_4band,
+    decode_bands,
+    encode_bands,
+    format_resistance,
+    nearest_standard,
+    resistance_from_digits,
+)
+from semilab.sampling import adaptive_sample
+from semilab.store import RunStore, StoredRun, get_store
+from semilab.wiki import WikiEntry, WikiIndex, edit_distance, fold_accents, get_wiki_index, load_wiki
+
+__all__ = [
+    "BAND_COUNTS",
+    "BAND_NAMES",
+    "CARRIER_MATERIALS",
+    "COLORS",
+    "DIODE_MATERIALS",
+    "E_SERIES",
+    "GATES",
+    "MULTIPLIER_COLORS",
+    "TOLERANCE_COLORS",
+    "WikiEntry",
+    "WikiIndex",
+    "Beam",
+    "BeamPath",
+    "BomCheck",
+    "Box",
+    "CarrierState",
+    "EventSimulator",
+    "JunctionSolution",
+    "MergedMesh",
+    "MonteCarloResult",
+    "Netlist",
+    "QPointSolution",
+    "ResistorCode",
+    "RunStore",
+    "SequentialNetlist",
+    "SimulationResult",
+    "StoredRun",
+    "abrupt_doping",
+    "adaptive_sample",
+    "box_vertices",
+    "check_bom",
+    "decode_4band",
+    "decode_bands",
+    "diode_current",
+    "diode_curve",
+    "diode_curve_adaptive",
+    "diode_monte_carlo",
+    "diode_sweep",
+    "diode_sweep_grid",
+    "edit_distance",
+    "encode_bands",
+    "evaluate_gate",
+    "fermi_dirac_half",
+    "fold_accents",
+    "format_resistance",
+    "get_store",
+    "get_wiki_index",
+    "graded_doping",
+    "load_wiki",
+    "merge_beams",
+    "merge_boxes",
+    "mosfet_curves",
+    "mosfet_curves_adaptive",
+    "mosfet_family",
+    "mosfet_id",
+    "mosfet_monte_carlo",
+    "nearest_standard",
+    "ohm_current",
+    "ohm_resistance",
+    "ohm_voltage",
+    "photon_energy_ev",
+    "photon_wavelength_nm",
+    "resistance_from_digits",
+    "solve_diode_resistor",
+    "solve_fermi_level",
+    "solve_pn_junction",
+    "thermal_voltage",
+]
@@ -0,0 +1,39 @@
+"""Dòng lệnh của semilab: ``python -m semilab <lệnh> ...``."""
+import argparse
+import sys
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m semilab", description="Virtual Semiconductor Lab (headless)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="Chạy hàng loạt mô phỏng từ file công việc")
+    batch.add_argument("jobs", help="File công việc (.json hoặc .jsonl)")
+    batch.add_argument("-o", "--output", default="results", help="Thư mục ghi kết quả (mặc định: results)")
+    batch.add_argument("-f", "--format", choices=["csv", "parquet"], default="csv")
+    batch.add_argument("-w", "--workers", type=int, default=None, help="Số tiến trình (mặc định: số CPU)")
+    batch.add_argument("-q", "--quiet", action="store_true", help="Không in tiến độ từng công việc")
+
+    bench = commands.add_parser("bench", help="Đo hiệu năng các mô hình và phần dựng hình")
+    bench.add_argument("-s", "--size", choices=["quick", "realistic", "stress"], default="realistic")
+    bench.add_argument("-k", "--only", default="*", help="Chỉ chạy bài đo khớp mẫu glob (vd: 'diode.*')")
+    bench.add_argument("-n", "--repeats", type=int, default=None, help="Số lần lặp (mặc định: tự chọn)")
+    bench.add_argument("--baseline", help="File baseline JSON để so sánh")
+    bench.add_argument("--save-baseline", help="Ghi kết quả vào file baseline JSON")
+    bench.add_argument("--tolerance", type=float, default=0.25, help="Ngưỡng chậm hơn cho phép (mặc định 0.25 = 25%%)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "batch":
+        from semilab.batch import main as batch_main
+        return batch_main(args)
+    if args.command == "bench":
+        from semilab.bench import main as bench_main
+        return bench_main(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
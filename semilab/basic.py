@@ -0,0 +1,45 @@
+"""Các phép tính cơ bản: định luật Ohm và chuyển đổi năng lượng photon."""
+import numpy as np
+
+HC_EV_NM = 1240.0  # h*c tính theo eV·nm (E[eV] = 1240 / λ[nm])
+
+
+def _safe_divide(a, b):
+    # Chia từng phần tử, trả về 0 khi mẫu số <= 0 (giống quy ước trên giao diện)
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    out = np.zeros(np.broadcast(a, b).shape)
+    np.divide(a, b, out=out, where=b > 0)
+    return _unwrap(out)
+
+
+def _unwrap(out):
+    # Đầu vào vô hướng -> trả về float thường thay vì mảng 0 chiều
+    return out if out.ndim else float(out)
+
+
+# --- ĐỊNH LUẬT OHM: V = I x R ---
+def ohm_voltage(i, r):
+    """V = I * R."""
+    return _unwrap(np.multiply(i, r, dtype=float))
+
+
+def ohm_current(v, r):
+    """I = V / R (0 nếu R <= 0)."""
+    return _safe_divide(v, r)
+
+
+def ohm_resistance(v, i):
+    """R = V / I (0 nếu I <= 0)."""
+    return _safe_divide(v, i)
+
+
+# --- PHOTON: E (eV) <-> λ (nm) ---
+def photon_energy_ev(wavelength_nm):
+    """Năng lượng photon (eV) từ bước sóng (nm); 0 nếu bước sóng <= 0."""
+    return _safe_divide(HC_EV_NM, wavelength_nm)
+
+
+def photon_wavelength_nm(energy_ev):
+    """Bước sóng (nm) từ năng lượng photon (eV); 0 nếu năng lượng <= 0."""
+    return _safe_divide(HC_EV_NM, energy_ev)
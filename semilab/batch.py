@@ -0,0 +1,218 @@
+"""Chạy hàng loạt mô phỏng (không cần giao diện) trên nhiều tiến trình.
+
+File công việc là JSON (danh sách) hoặc JSON Lines, mỗi công việc có dạng::
+
+    {"id": "si-25C", "kind": "diode", "temp_c": 25, "n": 1.0, "material": "Silicon (Si)"}
+    {"kind": "diode_circuit", "v_source": [1, 5, 10], "r": 1000, "temp_c": 25}
+    {"kind": "mosfet", "v_gs": [1, 2, 3, 4], "v_th": 0.7, "k_n": 1.0, "lambda_": 0.02}
+    {"kind": "logic", "netlist": "INPUT A B\\nOUTPUT Y\\nY = XOR(A, B)"}
+
+Các loại công việc và tham số (mặc định) của chúng nằm ở ``semilab.jobs``;
+tham số lạ là lỗi của công việc đó. Kết quả của mỗi loại được ghi dần (theo
+thứ tự hoàn thành) vào ``<thư mục ra>/<kind>.csv`` hoặc ``.parquet``, kèm cột
+``job_id``.
+"""
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from semilab.jobs import JOB_KINDS, job_params
+
+
+class JobResult(NamedTuple):
+    job_id: str
+    kind: str
+    columns: dict     # Rỗng nếu lỗi
+    error: str        # None nếu thành công
+    seconds: float
+
+
+def run_job(spec):
+    """Chạy một công việc (trong tiến trình con); lỗi được trả về thay vì ném ra."""
+    job_id = str(spec.get("id", ""))
+    kind = spec.get("kind", "")
+    start = time.perf_counter()
+    try:
+        params = {key: value for key, value in spec.items() if key not in ("id", "kind")}
+        columns = JOB_KINDS[kind](**job_params(kind, params))
+        return JobResult(job_id, kind, columns, None, time.perf_counter() - start)
+    except Exception as exc:  # Một công việc hỏng không làm dừng cả lô
+        return JobResult(job_id, kind, {}, f"{type(exc).__name__}: {exc}", time.perf_counter() - start)
+
+
+def load_jobs(path):
+    """Đọc file công việc: JSON (một công việc hoặc danh sách, viết gọn hay xuống
+    dòng đều được) hoặc JSON Lines; gán ``id`` nếu thiếu. File sai định dạng cho
+    ``ValueError`` kèm vị trí lỗi."""
+    text = Path(path).read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as exc:
+        if text.lstrip().startswith("["):
+            raise ValueError(f"{path}: JSON không hợp lệ ({exc})") from None
+        # Không phải một tài liệu JSON duy nhất: đọc như JSON Lines
+        data = []
+        for line_no, line in enumerate(text.splitlines(), 1):
+            if line.strip():
+                try:
+                    data.append(json.loads(line))
+                except json.JSONDecodeError as line_exc:
+                    raise ValueError(f"{path}:{line_no}: dòng JSON Lines không hợp lệ ({line_exc})") from None
+    jobs = [data] if isinstance(data, dict) else data
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        raise ValueError(f"{path}: mỗi công việc phải là một object JSON")
+    for index, job in enumerate(jobs):
+        job.setdefault("id", f"job-{index:05d}")
+    return jobs
+
+
+# ==============================================================================
+# GHI KẾT QUẢ
+# ==============================================================================
+class CsvSink:
+    """Mỗi loại công việc một file CSV, ghi nối tiếp khi có kết quả."""
+
+    suffix = ".csv"
+
+    def __init__(self, out_dir):
+        self.out_dir = Path(out_dir)
+        self._files = {}
+
+    def write(self, result):
+        entry = self._files.get(result.kind)
+        if entry is None:
+            f = open(self.out_dir / f"{result.kind}{self.suffix}", "w", newline="", encoding="utf-8")
+            writer = csv.writer(f)
+            writer.writerow(["job_id", *result.columns])
+            entry = self._files[result.kind] = (f, writer)
+        f, writer = entry
+        columns = [np.asarray(col).tolist() for col in result.columns.values()]
+        n_rows = len(columns[0]) if columns else 0
+        writer.writerows(zip([result.job_id] * n_rows, *columns))
+
+    def close(self):
+        for f, _ in self._files.values():
+            f.close()
+        self._files.clear()
+
+
+class ParquetSink:
+    """Mỗi loại công việc một file Parquet; mỗi kết quả là một row group (cần ``pyarrow``)."""
+
+    suffix = ".parquet"
+
+    def __init__(self, out_dir):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:
+            raise RuntimeError("Ghi Parquet cần cài pyarrow: pip install pyarrow") from exc
+        self.out_dir = Path(out_dir)
+        self._writers = {}
+
+    def write(self, result):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.table({"job_id": [result.job_id] * len(next(iter(result.columns.values()), [])),
+                          **{name: np.asarray(col) for name, col in result.columns.items()}})
+        writer = self._writers.get(result.kind)
+        if writer is None:
+            writer = self._writers[result.kind] = pq.ParquetWriter(
+                self.out_dir / f"{result.kind}{self.suffix}", table.schema)
+        writer.write_table(table)
+
+    def close(self):
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+
+SINKS = {"csv": CsvSink, "parquet": ParquetSink}
+
+
+class BatchReport(NamedTuple):
+    jobs: int
+    failed: int
+    rows: int
+    seconds: float
+    errors: list  # [(job_id, thông báo lỗi)]
+
+    @property
+    def jobs_per_second(self):
+        return self.jobs / self.seconds if self.seconds > 0 else float("inf")
+
+
+def run_batch(jobs, out_dir, fmt="csv", workers=None, progress=None):
+    """Chạy danh sách công việc trên ``workers`` tiến trình (1 = chạy tuần tự trong
+    tiến trình hiện tại) và ghi kết quả theo thứ tự hoàn thành."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    sink = SINKS[fmt](out_dir)
+    workers = workers or os.cpu_count() or 1
+    rows = 0
+    errors = []
+    start = time.perf_counter()
+
+    def handle(result, done):
+        nonlocal rows
+        if not result.error:
+            # Lỗi khi ghi (ví dụ schema Parquet khác với các công việc trước cùng loại)
+            # chỉ hỏng công việc này, không bỏ dở các kết quả còn lại
+            try:
+                sink.write(result)
+            except Exception as exc:
+                result = result._replace(columns={}, error=f"ghi kết quả lỗi: {type(exc).__name__}: {exc}")
+            else:
+                rows += len(next(iter(result.columns.values()), []))
+        if result.error:
+            errors.append((result.job_id, result.error))
+        if progress:
+            progress(done, len(jobs), result)
+
+    try:
+        if workers == 1:
+            for done, spec in enumerate(jobs, 1):
+                handle(run_job(spec), done)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(run_job, spec): spec for spec in jobs}
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        result = future.result()
+                    except Exception as exc:  # tiến trình con chết, không pickle được...
+                        spec = futures[future]
+                        result = JobResult(str(spec.get("id", "")), spec.get("kind", ""), {},
+                                           f"{type(exc).__name__}: {exc}", 0.0)
+                    handle(result, done)
+    finally:
+        sink.close()
+    return BatchReport(len(jobs), len(errors), rows, time.perf_counter() - start, errors)
+
+
+def main(args):
+    """Điểm vào của lệnh ``python -m semilab batch``."""
+    try:
+        jobs = load_jobs(args.jobs)
+    except (OSError, ValueError) as exc:
+        print(f"Không đọc được file công việc: {exc}", file=sys.stderr)
+        return 2
+
+    def progress(done, total, result):
+        status = "LỖI" if result.error else "ok"
+        print(f"[{done}/{total}] {result.kind} {result.job_id}: {status} ({result.seconds*1000:.1f} ms)",
+              file=sys.stderr)
+
+    report = run_batch(jobs, args.output, fmt=args.format, workers=args.workers,
+                       progress=None if args.quiet else progress)
+    for job_id, error in report.errors:
+        print(f"  {job_id}: {error}", file=sys.stderr)
+    print(f"{report.jobs} công việc ({report.failed} lỗi), {report.rows:,} dòng, "
+          f"{report.seconds:.2f} s -> {report.jobs_per_second:,.1f} công việc/giây")
+    return 1 if report.failed else 0
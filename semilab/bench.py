@@ -0,0 +1,439 @@
+"""Bộ đo hiệu năng (benchmark) cho các đường tính toán và dựng hình của từng module.
+
+Mỗi bài đo nhận một cỡ (``quick``, ``realistic``, ``stress``), chuẩn bị dữ liệu
+ngoài vùng đo và trả về hàm cần đo. Kết quả (thời gian min/trung vị, bộ nhớ đỉnh
+qua ``tracemalloc``) có thể lưu làm baseline và so sánh ở lần chạy sau::
+
+    python -m semilab bench --size realistic --save-baseline bench_baseline.json
+    python -m semilab bench --size realistic --baseline bench_baseline.json
+
+Một số bài đo còn có ngân sách tuyệt đối (``BUDGETS``, ví dụ thời gian khởi
+động lạnh của giao diện); vượt ngân sách cũng trả mã lỗi 1.
+"""
+import fnmatch
+import importlib.util
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+SIZES = ("quick", "realistic", "stress")
+
+# Ngân sách tuyệt đối (giây, trung vị), kiểm tra ở mọi lần chạy kể cả khi không có baseline
+BUDGETS = {
+    "app.cold_start": 1.5,  # tiến trình mới: import Streamlit + giao diện + module mặc định
+}
+
+_BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Đăng ký bài đo: ``func(size)`` trả về hàm không tham số cần đo, hoặc ``None``
+    nếu bỏ qua (ví dụ thiếu thư viện tùy chọn)."""
+    def decorator(func):
+        _BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def _pick(size, quick, realistic, stress):
+    return {"quick": quick, "realistic": realistic, "stress": stress}[size]
+
+
+# ==============================================================================
+# MODULE 1 - 3: MÔ HÌNH LINH KIỆN
+# ==============================================================================
+@benchmark("basic.photon_energy")
+def _bench_photon(size):
+    from semilab.basic import photon_energy_ev
+
+    wavelengths = np.linspace(200, 2000, _pick(size, 10**3, 10**5, 10**7))
+    return lambda: photon_energy_ev(wavelengths)
+
+
+@benchmark("resistor.bom")
+def _bench_resistor_bom(size):
+    from semilab.resistor import check_bom, encode_bands, nearest_standard
+
+    rng = np.random.default_rng(0)
+    n_parts = _pick(size, 10_000, 50_000, 1_000_000)
+    values = nearest_standard(10 ** rng.uniform(0, 7, 500), "E96")
+    reel = [encode_bands(v, 5) for v in values]
+    bands = np.array(reel, dtype=object)[rng.integers(0, len(reel), n_parts)]
+    measured = rng.normal(1.0, 0.01, n_parts) * 1000
+    return lambda: check_bom(bands, measured, "E96")
+
+
+@benchmark("resistor.nearest")
+def _bench_resistor_nearest(size):
+    from semilab.resistor import nearest_standard
+
+    values = 10 ** np.random.default_rng(0).uniform(0, 9, _pick(size, 10_000, 1_000_000, 10_000_000))
+    return lambda: nearest_standard(values, "E192")
+
+
+@benchmark("diode.current")
+def _bench_diode_current(size):
+    from semilab.devices import diode_current
+
+    v = np.linspace(-1.0, 1.0, _pick(size, 10**3, 10**5, 10**7))
+    return lambda: diode_current(v, 25.0, 1.0, 1e-12)
+
+
+@benchmark("diode.sweep")
+def _bench_diode_sweep(size):
+    from semilab.devices import DIODE_MATERIALS, diode_sweep
+
+    n_t, n_n, n_v = _pick(size, (5, 3, 200), (20, 11, 500), (50, 11, 5000))
+    v = np.linspace(-1.0, 1.0, n_v)
+    temps = np.linspace(-50, 150, n_t)
+    ns = np.linspace(1.0, 2.0, n_n)
+    materials = list(DIODE_MATERIALS)
+    return lambda: diode_sweep(v, temps, ns, materials)
+
+
+@benchmark("diode.circuit_newton")
+def _bench_diode_circuit(size):
+    from semilab.circuits import solve_diode_resistor
+
+    rng = np.random.default_rng(0)
+    n = _pick(size, 10**3, 10**5, 10**6)
+    v_source = rng.uniform(-5, 20, n)
+    r = 10 ** rng.uniform(1, 5, n)
+    temp_c = rng.uniform(-50, 150, n)
+    return lambda: solve_diode_resistor(v_source, r, temp_c, 1.5, 1e-12)
+
+
+@benchmark("mosfet.family")
+def _bench_mosfet(size):
+    from semilab.devices import mosfet_family
+
+    n_gs, n_ds = _pick(size, (4, 100), (200, 1000), (1000, 10000))
+    v_gs = np.linspace(0, 5, n_gs)
+    v_ds = np.linspace(0, 5, n_ds)
+    return lambda: mosfet_family(v_gs, v_ds, v_th=0.7, k_n=1.0, lambda_=0.02)
+
+
+@benchmark("mc.diode")
+def _bench_mc_diode(size):
+    from semilab.montecarlo import diode_monte_carlo
+
+    n_devices = _pick(size, 10_000, 100_000, 1_000_000)
+    return lambda: diode_monte_carlo(n_devices, specs={"v_f": (0.55, 0.65), "i_leak": (None, 3e-12)})
+
+
+@benchmark("mc.mosfet")
+def _bench_mc_mosfet(size):
+    from semilab.montecarlo import mosfet_monte_carlo
+
+    n_devices = _pick(size, 10_000, 100_000, 1_000_000)
+    return lambda: mosfet_monte_carlo(n_devices, specs={"i_on": (4.5, None), "v_th": (0.65, 0.75)})
+
+
+@benchmark("junction.sweep")
+def _bench_junction(size):
+    from semilab.pn_junction import abrupt_doping, solve_pn_junction
+
+    nodes, n_bias = _pick(size, (1_000, 11), (10_000, 41), (100_000, 41))
+    x = np.linspace(0, 4e-4, nodes)
+    doping = abrupt_doping(x, 1e16, 1e17)
+    biases = np.linspace(-5, 0.5, n_bias)
+    return lambda: solve_pn_junction(x, doping, biases)
+
+
+@benchmark("carriers.fermi_map")
+def _bench_fermi_map(size):
+    from semilab.carriers import fermi_dirac_table, solve_fermi_level
+
+    side = _pick(size, 100, 300, 1_000)
+    fermi_dirac_table()
+    doping = np.logspace(12, 20, side)[None, :]
+    temps = np.linspace(50, 600, side)[:, None]
+    return lambda: solve_fermi_level(doping, 0.0, temps)
+
+
+# ==============================================================================
+# MODULE 2: LOGIC
+# ==============================================================================
+@benchmark("logic.truth_table")
+def _bench_truth_table(size):
+    from semilab.logic import random_netlist
+
+    n_inputs, n_gates = _pick(size, (10, 100), (16, 1000), (20, 20000))
+    netlist = random_netlist(n_inputs, n_gates, seed=1)
+    netlist.levelize()
+    return netlist.simulate_all
+
+
+@benchmark("logic.event_sim")
+def _bench_event_sim(size):
+    from semilab.eventsim import EventSimulator, SequentialNetlist, random_stimulus
+    from semilab.logic import random_netlist
+
+    n_inputs, n_gates, end_time = _pick(size, (8, 100, 500.0), (32, 1000, 5000.0), (64, 5000, 20000.0))
+    base = random_netlist(n_inputs, n_gates, seed=2)
+    netlist = SequentialNetlist(base.inputs, base.outputs)
+    for out, gate_type, ins in base.gates:
+        netlist.add_gate(out, gate_type, *ins)
+    simulator = EventSimulator(netlist, inertial=True)
+    stimulus = random_stimulus(netlist.inputs, 100.0, end_time)
+    return lambda: simulator.run(stimulus)
+
+
+# ==============================================================================
+# MODULE 4: WIKI
+# ==============================================================================
+def synthetic_wiki(n_entries, seed=0):
+    """Bộ wiki giả lập ``n_entries`` bài, từ vựng ngẫu nhiên cỡ vài chục nghìn từ."""
+    from semilab.wiki import WikiEntry
+
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("abcdeghiklmnopqrstuvxy"))
+    vocab = ["".join(rng.choice(letters, rng.integers(3, 10))) for _ in range(max(200, n_entries * 2))]
+    tags = ["Vật lý chất rắn", "Quy trình Fab", "Sản xuất", "Lịch sử"]
+    entries = []
+    for i in range(n_entries):
+        words = rng.choice(len(vocab), 60)
+        entries.append(WikiEntry(f"{vocab[words[0]]} {vocab[words[1]]} ({i})",
+                                 " ".join(vocab[w] for w in words), tags[i % len(tags)]))
+    return entries, vocab
+
+
+@benchmark("wiki.build_index")
+def _bench_wiki_build(size):
+    from semilab.wiki import WikiIndex
+
+    entries, _ = synthetic_wiki(_pick(size, 100, 2000, 10000))
+    return lambda: WikiIndex(entries)
+
+
+@benchmark("wiki.search")
+def _bench_wiki_search(size):
+    from semilab.wiki import WikiIndex
+
+    entries, vocab = synthetic_wiki(_pick(size, 100, 2000, 10000))
+    index = WikiIndex(entries)
+    rng = np.random.default_rng(1)
+    queries = [vocab[i] for i in rng.choice(len(vocab), 50)]
+    # Một nửa truy vấn gõ sai một ký tự để đi qua nhánh tìm gần đúng
+    queries += [q[:1] + q[2:] for q in queries[:25]]
+    return lambda: [index.search(q, limit=20) for q in queries]
+
+
+# ==============================================================================
+# MODULE 5: QUY TRÌNH FAB
+# ==============================================================================
+@benchmark("fab.recipe")
+def _bench_recipe(size):
+    from semilab.process import grid_boxes, load_recipe, simulate
+
+    recipe = load_recipe(resolution=_pick(size, 0.2, 0.05, 0.02))
+    return lambda: grid_boxes(simulate(recipe), recipe.grid)
+
+
+@benchmark("fab.recipe_scrub")
+def _bench_recipe_scrub(size):
+    from semilab.process import RecipeRun, load_recipe
+
+    run = RecipeRun(load_recipe(resolution=_pick(size, 0.2, 0.05, 0.02)))
+    run.grid(len(run) - 1)
+    # Kéo thanh trượt tới cuối rồi quay về đầu: mỗi lần chỉ áp một diff
+    order = list(range(len(run))) + list(range(len(run) - 1, -1, -1))
+    return lambda: [run.grid(k) for k in order]
+
+
+# ==============================================================================
+# MODULE 3 + 5: DỰNG HÌNH (cần Plotly)
+# ==============================================================================
+def _figures():
+    try:
+        from semilab import figures
+    except ImportError:
+        return None
+    return figures
+
+
+@benchmark("render.diode_figure")
+def _bench_diode_figure(size):
+    figures = _figures()
+    if figures is None:
+        return None
+    # __wrapped__: gọi thẳng hàm gốc, bỏ qua cache
+    return lambda: figures.diode_figure.__wrapped__(25, 1.0, "Silicon (Si)").to_json()
+
+
+@benchmark("render.mosfet_figure")
+def _bench_mosfet_figure(size):
+    figures = _figures()
+    if figures is None:
+        return None
+    return lambda: figures.mosfet_figure.__wrapped__(0.7, 1.0, 0.0).to_json()
+
+
+@benchmark("render.fab_steps")
+def _bench_fab(size):
+    figures = _figures()
+    if figures is None:
+        return None
+    from semilab.process import DEFAULT_RECIPE_PATH, recipe_from_json, recipe_run
+
+    # Mọi bước của recipe mặc định như ở chế độ "Từng bước" (bỏ qua cache hình;
+    # lưới các bước đã tính sẵn trong ``recipe_run`` nên chủ yếu đo phần dựng hình)
+    recipe_text = DEFAULT_RECIPE_PATH.read_text(encoding="utf-8")
+    resolution = _pick(size, 0.2, 0.1, 0.05)
+    n_steps = len(recipe_from_json(recipe_text, resolution=resolution).steps)
+    recipe_run(recipe_text, resolution).grid(n_steps - 1)
+    return lambda: [figures.recipe_step_figure.__wrapped__(recipe_text, step, resolution).to_json()
+                    for step in range(n_steps)]
+
+
+# ==============================================================================
+# KHO KẾT QUẢ
+# ==============================================================================
+@benchmark("store.reload")
+def _bench_store_reload(size):
+    import tempfile
+
+    from semilab.store import RunStore
+
+    points = _pick(size, 1_000, 100_000, 1_000_000)
+    tmp = tempfile.TemporaryDirectory()
+    store = RunStore(tmp.name)
+    params = {"temp_c": 25.0, "n": 1.0, "points": points}
+    store.run("diode", params)
+
+    def reload(tmp=tmp):  # giữ thư mục tạm sống cùng hàm đo
+        columns = store.get("diode", params).load()
+        return float(columns["i"].sum())
+    return reload
+
+
+# ==============================================================================
+# KHỞI ĐỘNG GIAO DIỆN (tiến trình Python mới, như container vừa được bật)
+# ==============================================================================
+_APP_ROOT = Path(__file__).resolve().parent.parent
+
+
+@benchmark("app.cold_start")
+def _bench_cold_start(size):
+    if importlib.util.find_spec("streamlit") is None or not (_APP_ROOT / "ui").is_dir():
+        return None
+    command = [sys.executable, "-c", "import streamlit, ui; ui.load(ui.DEFAULT_MODULE)"]
+    return lambda: subprocess.run(command, cwd=_APP_ROOT, check=True)
+
+
+@benchmark("app.warmup")
+def _bench_warmup(size):
+    # Tiến trình mới, cache rỗng: chạy hết warm-up, lỗi nếu có view không làm nóng được
+    if importlib.util.find_spec("streamlit") is None or not (_APP_ROOT / "ui").is_dir():
+        return None
+    command = [sys.executable, "-c", "import sys, ui; sys.exit(ui.start_warmup().join().coverage < 1)"]
+    return lambda: subprocess.run(command, cwd=_APP_ROOT, check=True)
+
+
+# ==============================================================================
+# CHẠY VÀ SO SÁNH
+# ==============================================================================
+class BenchResult(NamedTuple):
+    name: str
+    size: str
+    repeats: int
+    min_s: float
+    median_s: float
+    peak_mb: float
+
+
+def run_benchmarks(size="realistic", pattern="*", repeats=None, min_time=0.2):
+    """Chạy các bài đo khớp ``pattern`` (glob trên tên)."""
+    if size not in SIZES:
+        raise ValueError(f"size phải là một trong {SIZES}")
+    results = []
+    for name, factory in _BENCHMARKS.items():
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        func = factory(size)
+        if func is None:
+            continue
+
+        # Lần chạy đầu: đo bộ nhớ đỉnh (tracemalloc làm chậm nên không tính giờ)
+        tracemalloc.start()
+        start = time.perf_counter()
+        func()
+        first = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Số lần lặp: đủ ~min_time giây, tối thiểu 3, tối đa 50
+        n = repeats or int(min(50, max(3, min_time / max(first, 1e-6))))
+        timings = []
+        for _ in range(n):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        results.append(BenchResult(name, size, n, min(timings), statistics.median(timings), peak / 2**20))
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """Các bài đo chậm hơn baseline quá ``tolerance``: ``[(tên, hiện tại, baseline)]``."""
+    regressions = []
+    for result in results:
+        ref = baseline.get(result.size, {}).get(result.name)
+        if ref and result.median_s > ref["median_s"] * (1 + tolerance):
+            regressions.append((result.name, result.median_s, ref["median_s"]))
+    return regressions
+
+
+def over_budget(results, budgets=None):
+    """Các bài đo vượt ngân sách tuyệt đối: ``[(tên, hiện tại, ngân sách)]``."""
+    budgets = BUDGETS if budgets is None else budgets
+    return [(r.name, r.median_s, budgets[r.name]) for r in results
+            if r.name in budgets and r.median_s > budgets[r.name]]
+
+
+def save_baseline(results, path):
+    """Ghi (gộp) kết quả vào file baseline JSON, nhóm theo cỡ."""
+    path = Path(path)
+    data = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    for result in results:
+        data.setdefault(result.size, {})[result.name] = {
+            "median_s": result.median_s, "min_s": result.min_s, "peak_mb": result.peak_mb}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def format_table(results, baseline=None):
+    lines = [f"{'benchmark':<24} {'size':<10} {'n':>3} {'min':>10} {'median':>10} {'peak MB':>9} {'vs base':>8}"]
+    for r in results:
+        ref = (baseline or {}).get(r.size, {}).get(r.name)
+        ratio = f"{r.median_s / ref['median_s']:.2f}x" if ref else "-"
+        lines.append(f"{r.name:<24} {r.size:<10} {r.repeats:>3} {r.min_s*1000:>8.2f}ms "
+                     f"{r.median_s*1000:>8.2f}ms {r.peak_mb:>9.1f} {ratio:>8}")
+    return "\n".join(lines)
+
+
+def main(args):
+    """Điểm vào của lệnh ``python -m semilab bench``."""
+    results = run_benchmarks(args.size, args.only, repeats=args.repeats)
+    baseline = None
+    if args.baseline and Path(args.baseline).exists():
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    print(format_table(results, baseline))
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+        print(f"Đã lưu baseline: {args.save_baseline}")
+    failed = False
+    for name, current, budget in over_budget(results):
+        print(f"VƯỢT NGÂN SÁCH: {name}: {current*1000:.2f} ms (ngân sách {budget*1000:.0f} ms)", file=sys.stderr)
+        failed = True
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        for name, current, ref in regressions:
+            print(f"CHẬM HƠN: {name}: {current*1000:.2f} ms (baseline {ref*1000:.2f} ms)", file=sys.stderr)
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
@@ -0,0 +1,148 @@
+"""Bộ nhớ đệm LRU dùng chung giữa các lần rerun (và các phiên) của Streamlit.
+
+Mỗi lần người dùng tương tác, Streamlit chạy lại toàn bộ script; các kết quả
+tính toán và hình vẽ được lưu theo bộ tham số để lần sau trả về ngay. Các cache
+được đăng ký theo tên để có thể xem số lần hit/miss trên giao diện.
+"""
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+_MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache:
+    """Cache LRU có giới hạn kích thước, an toàn khi dùng từ nhiều thread."""
+
+    def __init__(self, name, maxsize=128):
+        if maxsize <= 0:
+            raise ValueError("maxsize phải > 0")
+        self.name = name
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, func):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # Tính ngoài khóa: hai thread cùng miss có thể tính trùng, nhưng
+            # không chặn các thread đang đọc những khóa khác.
+            value = func()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return CacheStats(self.name, self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+
+_REGISTRY = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_cache(name, maxsize=128):
+    """Lấy (hoặc tạo mới) cache dùng chung theo tên."""
+    with _REGISTRY_LOCK:
+        cache = _REGISTRY.get(name)
+        if cache is None:
+            cache = _REGISTRY[name] = LRUCache(name, maxsize)
+        return cache
+
+
+def cache_stats():
+    """Thống kê của mọi cache đã đăng ký, sắp theo tên."""
+    with _REGISTRY_LOCK:
+        caches = list(_REGISTRY.values())
+    return sorted((c.stats() for c in caches), key=lambda s: s.name)
+
+
+def clear_caches():
+    with _REGISTRY_LOCK:
+        caches = list(_REGISTRY.values())
+    for cache in caches:
+        cache.clear()
+
+
+def freeze(value):
+    """Chuyển tham số thành khóa hashable (list -> tuple, mảng NumPy -> bytes)."""
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.shape, value.dtype.str, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def memoize(name=None, maxsize=128):
+    """Decorator lưu kết quả của hàm vào cache LRU dùng chung, khóa theo tham số.
+
+    Tham số được chuẩn hóa qua chữ ký hàm (gồm cả giá trị mặc định), nên
+    ``f(1, b=2)`` và ``f(1, 2)`` dùng chung một mục. Kết quả trả về được chia sẻ
+    giữa các lần gọi và phải được coi là chỉ đọc.
+    """
+    def decorator(func):
+        cache = get_cache(name or f"{func.__module__}.{func.__qualname__}", maxsize)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = freeze(tuple(bound.arguments.values()))
+            return cache.get_or_compute(key, lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
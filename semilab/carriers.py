@@ -0,0 +1,218 @@
+"""Thống kê hạt dẫn và mức Fermi theo pha tạp và nhiệt độ (vector hóa).
+
+Mật độ electron / lỗ trống dùng tích phân Fermi-Dirac bậc 1/2 (đúng cả khi
+suy biến, pha tạp rất nặng):
+
+    n = N_c F_1/2((E_F - E_c) / kT),   p = N_v F_1/2((E_v - E_F) / kT)
+
+F_1/2 được tính sẵn một lần thành bảng trên lưới η đều rồi nội suy Hermite bậc
+ba (đạo hàm chính xác dF_1/2/dη = F_-1/2), thay cho tích phân số tại từng điểm;
+ngoài bảng dùng tiệm cận Boltzmann (η < -20) và Sommerfeld (η > 60).
+Mức Fermi là nghiệm của phương trình trung hòa điện tích
+
+    n + N_A^- = p + N_D^+
+
+giải cùng lúc cho cả mảng (pha tạp × nhiệt độ) bằng Newton có khoảng chặn.
+Năng lượng tính bằng eV, gốc tại đỉnh vùng hóa trị (E_v = 0).
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from semilab.cache import memoize
+from semilab.devices import EXP_MAX, K_B, Q_E
+
+# Varshni: Eg(T) = Eg0 - alpha T^2 / (T + beta); N_c, N_v tại 300 K (cm^-3), tỉ lệ T^1.5;
+# mức tạp chất nông tính từ mép vùng tương ứng (eV, P / B cho Si, As / Ga ...)
+CARRIER_MATERIALS = {
+    "Silicon (Si)": {"eg0": 1.170, "alpha": 4.73e-4, "beta": 636.0, "nc_300": 2.8e19, "nv_300": 1.04e19,
+                     "e_donor": 0.045, "e_acceptor": 0.045},
+    "Germanium (Ge)": {"eg0": 0.7437, "alpha": 4.77e-4, "beta": 235.0, "nc_300": 1.04e19, "nv_300": 6.0e18,
+                       "e_donor": 0.012, "e_acceptor": 0.010},
+    "Gallium Arsenide (GaAs)": {"eg0": 1.519, "alpha": 5.405e-4, "beta": 204.0, "nc_300": 4.7e17,
+                                "nv_300": 7.0e18, "e_donor": 0.006, "e_acceptor": 0.028},
+}
+
+# Bảng F_1/2: lưới η đều; ngoài bảng dùng tiệm cận (Boltzmann / Sommerfeld)
+FD_ETA_MIN, FD_ETA_MAX, FD_STEP = -20.0, 60.0, 0.02
+
+
+def thermal_energy(temp_k):
+    """kT (eV) theo nhiệt độ Kelvin."""
+    return K_B * np.asarray(temp_k, dtype=float) / Q_E
+
+
+def band_gap(material, temp_k=300.0):
+    """Độ rộng vùng cấm Eg(T) (eV) theo công thức Varshni."""
+    params = CARRIER_MATERIALS[material]
+    temp_k = np.asarray(temp_k, dtype=float)
+    return params["eg0"] - params["alpha"] * temp_k ** 2 / (temp_k + params["beta"])
+
+
+def effective_densities(material, temp_k=300.0):
+    """Mật độ trạng thái hiệu dụng ``(N_c, N_v)`` (cm^-3), tỉ lệ T^1.5."""
+    params = CARRIER_MATERIALS[material]
+    scale = (np.asarray(temp_k, dtype=float) / 300.0) ** 1.5
+    return params["nc_300"] * scale, params["nv_300"] * scale
+
+
+def intrinsic_level(material, temp_k=300.0):
+    """``(E_i, n_i)``: mức Fermi thuần (eV) và mật độ hạt dẫn thuần (cm^-3), gần đúng Boltzmann."""
+    kt = thermal_energy(temp_k)
+    e_g = band_gap(material, temp_k)
+    nc, nv = effective_densities(material, temp_k)
+    return 0.5 * e_g + 0.5 * kt * np.log(nv / nc), np.sqrt(nc * nv) * np.exp(-0.5 * e_g / kt)
+
+
+# ==============================================================================
+# TÍCH PHÂN FERMI-DIRAC (BẢNG + NỘI SUY)
+# ==============================================================================
+@memoize("fermi_dirac_table", maxsize=1)
+def fermi_dirac_table(chunk=500):
+    """Hệ số đa thức bậc ba của ln F_1/2 trên từng khoảng ``FD_STEP`` của lưới η.
+
+    Trả về mảng ``(4, khoảng)``: ln F_1/2(η_k + s h) = c0 + c1 s + c2 s^2 + c3 s^3,
+    0 <= s < 1 (Hermite, khớp cả giá trị lẫn đạo hàm F_-1/2 / F_1/2 tại hai nút).
+    Đổi biến x = t^2 cho hàm dưới dấu tích phân chẵn, trơn trên [0, ∞), nên quy
+    tắc hình thang hội tụ rất nhanh. Chỉ tính một lần mỗi tiến trình (~0.1 s).
+    """
+    eta = np.linspace(FD_ETA_MIN, FD_ETA_MAX, int(round((FD_ETA_MAX - FD_ETA_MIN) / FD_STEP)) + 1)
+    t = np.linspace(0.0, np.sqrt(FD_ETA_MAX + 40.0), 2001)
+    # Trọng số quy tắc hình thang trên lưới t đều
+    weights = np.full(t.shape, t[1] - t[0])
+    weights[[0, -1]] *= 0.5
+    half = np.empty_like(eta)
+    minus_half = np.empty_like(eta)
+    for lo in range(0, len(eta), chunk):
+        occupancy = 1.0 / (1.0 + np.exp(np.minimum(t[None, :] ** 2 - eta[lo:lo + chunk, None], EXP_MAX)))
+        half[lo:lo + chunk] = 4 / np.sqrt(np.pi) * occupancy @ (t ** 2 * weights)
+        minus_half[lo:lo + chunk] = 2 / np.sqrt(np.pi) * occupancy @ weights
+
+    y, dy = np.log(half), FD_STEP * minus_half / half
+    y0, y1, d0, d1 = y[:-1], y[1:], dy[:-1], dy[1:]
+    return np.array([y0, d0, 3 * (y1 - y0) - 2 * d0 - d1, 2 * (y0 - y1) + d0 + d1])
+
+
+def fermi_dirac_half(eta):
+    """``(F_1/2(η), F_-1/2(η))`` chuẩn hóa (F_j -> e^η khi η -> -∞), η là số hoặc mảng."""
+    scalar = np.ndim(eta) == 0
+    eta = np.atleast_1d(np.asarray(eta, dtype=float))
+    # Không suy biến (η < FD_ETA_MIN): Boltzmann, khỏi tra bảng
+    f = np.exp(np.minimum(eta, FD_ETA_MAX))
+    df = f.copy()
+    table = eta >= FD_ETA_MIN
+    if table.any():
+        coef = fermi_dirac_table()
+        pos = (np.minimum(eta[table], FD_ETA_MAX) - FD_ETA_MIN) / FD_STEP
+        i = np.minimum(pos.astype(np.intp), coef.shape[1] - 1)
+        s = pos - i
+        c0, c1, c2, c3 = (row.take(i) for row in coef)
+        f_t = np.exp(((c3 * s + c2) * s + c1) * s + c0)
+        f[table] = f_t
+        df[table] = f_t * ((3 * c3 * s + 2 * c2) * s + c1) / FD_STEP
+        high = eta > FD_ETA_MAX
+        if high.any():
+            # Sommerfeld, suy biến mạnh
+            e = eta[high]
+            f[high] = 4 / (3 * np.sqrt(np.pi)) * e ** 1.5 * (1 + np.pi ** 2 / (8 * e ** 2))
+            df[high] = 2 / np.sqrt(np.pi) * e ** 0.5 * (1 - np.pi ** 2 / (24 * e ** 2))
+    return (float(f[0]), float(df[0])) if scalar else (f, df)
+
+
+# ==============================================================================
+# TRUNG HÒA ĐIỆN TÍCH
+# ==============================================================================
+class CarrierState(NamedTuple):
+    e_f: np.ndarray          # mức Fermi (eV, tính từ E_v)
+    e_g: np.ndarray          # E_c - E_v (eV)
+    e_i: np.ndarray          # mức Fermi thuần (eV)
+    n: np.ndarray            # electron (cm^-3)
+    p: np.ndarray            # lỗ trống (cm^-3)
+    n_i: np.ndarray          # mật độ hạt dẫn thuần (cm^-3)
+    donors_ionized: np.ndarray     # N_D^+ (cm^-3)
+    acceptors_ionized: np.ndarray  # N_A^- (cm^-3)
+    iterations: np.ndarray
+    converged: np.ndarray
+
+
+def solve_fermi_level(n_d=0.0, n_a=0.0, temp_k=300.0, material="Silicon (Si)", ionization=True,
+                      tol=1e-9, max_iter=100):
+    """Giải trung hòa điện tích cho E_F, broadcast ``n_d``, ``n_a`` (cm^-3) và ``temp_k`` (K).
+
+    ``ionization=False``: coi tạp chất ion hóa hoàn toàn (bỏ qua đóng băng hạt dẫn
+    ở nhiệt độ thấp). Newton có khoảng chặn [E_v - 1 eV, E_c + 1 eV]: bước nào ra
+    ngoài khoảng thì thay bằng chia đôi, nên luôn hội tụ. ``tol`` tính bằng eV.
+    """
+    n_d, n_a, temp_k = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (n_d, n_a, temp_k)))
+    if np.any(temp_k <= 0):
+        raise ValueError("nhiệt độ phải > 0 K")
+    if np.any(n_d < 0) or np.any(n_a < 0):
+        raise ValueError("nồng độ pha tạp không được âm")
+    params = CARRIER_MATERIALS[material]
+    kt = thermal_energy(temp_k)
+    e_g = band_gap(material, temp_k)
+    nc, nv = effective_densities(material, temp_k)
+    e_i, n_i = intrinsic_level(material, temp_k)
+    e_d = e_g - params["e_donor"]
+    e_a = params["e_acceptor"]
+
+    def ionized(e_f, kt, e_d, e_a, n_d, n_a):
+        # N_D^+ = N_D u, u = 1 / (1 + 2 e^((E_F - E_D)/kT)); N_A^- = N_A w, w = 1 / (1 + 4 e^((E_A - E_F)/kT))
+        # và đạo hàm theo E_F: -N_D u (1 - u) / kT, N_A w (1 - w) / kT
+        if not ionization:
+            return n_d, n_a, 0.0, 0.0
+        u = 1 / (1 + 2 * np.exp(np.minimum((e_f - e_d) / kt, EXP_MAX)))
+        w = 1 / (1 + 4 * np.exp(np.minimum((e_a - e_f) / kt, EXP_MAX)))
+        return n_d * u, n_a * w, -n_d * u * (1 - u) / kt, n_a * w * (1 - w) / kt
+
+    # Khởi tạo theo gần đúng Boltzmann, ion hóa hoàn toàn
+    x = np.clip(e_i + kt * np.arcsinh((n_d - n_a) / (2 * n_i)), -1.0, e_g + 1.0).ravel()
+    lo = np.full(x.shape, -1.0)
+    hi = np.broadcast_to(e_g + 1.0, n_d.shape).ravel()
+    work = [np.broadcast_to(a, n_d.shape).ravel() for a in (kt, e_g, nc, nv, e_d, e_a, n_d, n_a)]
+    e_f = x.copy()
+    iterations = np.zeros(x.shape, dtype=int)
+    rows = np.arange(x.size)  # các điểm chưa hội tụ; mảng làm việc được nén dần theo rows
+    for iteration in range(1, max_iter + 1):
+        kt_r, eg_r, nc_r, nv_r, ed_r, ea_r, nd_r, na_r = work
+        f_n, df_n = fermi_dirac_half((x - eg_r) / kt_r)
+        f_p, df_p = fermi_dirac_half(-x / kt_r)
+        nd_plus, na_minus, d_nd, d_na = ionized(x, kt_r, ed_r, ea_r, nd_r, na_r)
+        # g(E_F) = n + N_A^- - p - N_D^+ tăng đơn điệu theo E_F
+        g = nc_r * f_n + na_minus - nv_r * f_p - nd_plus
+        dg = (nc_r * df_n + nv_r * df_p) / kt_r + d_na - d_nd
+        lo = np.where(g < 0, x, lo)
+        hi = np.where(g > 0, x, hi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_new = x - g / dg
+        x_new = np.where((x_new >= lo) & (x_new <= hi), x_new, 0.5 * (lo + hi))
+        e_f[rows] = x_new
+        iterations[rows] = iteration
+        keep = (np.abs(x_new - x) > tol) & (hi - lo > tol)
+        rows, x, lo, hi = rows[keep], x_new[keep], lo[keep], hi[keep]
+        if not len(rows):
+            break
+        work = [a[keep] for a in work]
+
+    converged = np.ones(e_f.shape, dtype=bool)
+    converged[rows] = False
+    e_f = e_f.reshape(n_d.shape)
+    n = nc * fermi_dirac_half((e_f - e_g) / kt)[0]
+    p = nv * fermi_dirac_half(-e_f / kt)[0]
+    nd_plus, na_minus, _, _ = ionized(e_f, kt, e_d, e_a, n_d, n_a)
+    return CarrierState(e_f, e_g, e_i, n, p, n_i, np.broadcast_to(nd_plus, n_d.shape),
+                        np.broadcast_to(na_minus, n_d.shape), iterations.reshape(n_d.shape),
+                        converged.reshape(n_d.shape))
+
+
+# Phiên bản có cache cho giao diện: bản đồ (nhiệt độ × pha tạp) của một loại pha tạp
+@memoize("fermi_map", maxsize=4)
+def fermi_level_map(material, n_type=True, log_doping=(12.0, 20.0), temp_range=(50.0, 600.0),
+                    resolution=300, ionization=True):
+    """Lưới ``resolution`` × ``resolution``: trả về ``(doping, temps, CarrierState)``,
+    mảng trạng thái có dạng ``(len(temps), len(doping))``."""
+    doping = np.logspace(*log_doping, resolution)
+    temps = np.linspace(*temp_range, resolution)
+    n_d = doping[None, :] if n_type else 0.0
+    n_a = 0.0 if n_type else doping[None, :]
+    return doping, temps, solve_fermi_level(n_d, n_a, temps[:, None], material, ionization)
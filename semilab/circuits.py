@@ -0,0 +1,87 @@
+"""Giải mạch Diode nối tiếp điện trở (tìm điểm làm việc Q bằng đường tải).
+
+    Vs = I·R + Vd,   I = Is (exp(Vd / (n V_T)) - 1)
+
+Mọi tham số được broadcast, nên hàng nghìn tổ hợp (Vs, R, T, ...) được giải
+trong cùng một lần gọi.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from semilab.devices import EXP_MAX, safe_expm1, thermal_voltage
+
+
+class QPointSolution(NamedTuple):
+    v_d: np.ndarray         # Điện áp trên diode (V)
+    i_d: np.ndarray         # Dòng qua mạch (A)
+    iterations: np.ndarray  # Số vòng lặp của từng phần tử
+    converged: np.ndarray   # Mặt nạ hội tụ
+    residual: np.ndarray    # |Is(e^(Vd/nVt) - 1) - (Vs - Vd)/R| (A)
+    method: str
+
+    def stats(self):
+        """Thống kê hội tụ của cả lô."""
+        iterations = np.asarray(self.iterations)
+        return {
+            "method": self.method,
+            "size": int(np.size(self.v_d)),
+            "converged": float(np.mean(self.converged)) if np.size(self.converged) else 1.0,
+            "max_iterations": int(iterations.max()) if iterations.size else 0,
+            "mean_iterations": float(iterations.mean()) if iterations.size else 0.0,
+            "max_residual": float(np.max(self.residual)) if np.size(self.residual) else 0.0,
+        }
+
+
+def solve_diode_resistor(v_source, r, temp_c=25.0, n=1.0, i_s=1e-12, method="newton",
+                         tol=1e-12, max_iter=100, max_step=0.1):
+    """Tìm điểm Q của mạch Vs - R - Diode.
+
+    ``method="newton"``: Newton có giới hạn bước (``max_step`` V mỗi vòng). Điểm
+    xuất phát nằm bên phải nghiệm (giả sử toàn bộ dòng Vs/R chạy qua diode, hoặc
+    Vs + R·Is khi phân cực ngược, gần như đúng nghiệm) và hàm dư lồi, đồng biến,
+    nên dãy lặp giảm đơn điệu về nghiệm, không vọt lố.
+
+    ``method="lambertw"``: nghiệm dạng đóng qua hàm Wright omega
+    (ω(x) = W(e^x)), tránh tràn số khi e^x rất lớn. Cần SciPy.
+    """
+    v_source, r, temp_c, n, i_s = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (v_source, r, temp_c, n, i_s)))
+    if np.any(r <= 0):
+        raise ValueError("Điện trở R phải > 0")
+    n_vt = n * thermal_voltage(temp_c)
+
+    if method == "lambertw":
+        from scipy.special import wrightomega
+
+        x = np.log(i_s * r / n_vt) + (v_source + i_s * r) / n_vt
+        i_d = n_vt / r * np.real(wrightomega(x)) - i_s
+        v_d = v_source - i_d * r
+        iterations = np.zeros(v_d.shape, dtype=int)
+    elif method == "newton":
+        # Cận trên của nghiệm: Vd0 = nVt·ln(1 + Vs/(R·Is)) (với Vs <= 0 dùng 0) và
+        # Vd0 = Vs + R·Is (vì I >= -Is); khi Vs << 0 cận sau gần như là nghiệm, nên
+        # giới hạn bước không làm Newton kẹt quanh -max_step·max_iter V
+        v_d = np.minimum(n_vt * np.log1p(np.maximum(v_source, 0.0) / (r * i_s)), v_source + r * i_s)
+        iterations = np.zeros(v_d.shape, dtype=int)
+        active = np.ones(v_d.shape, dtype=bool)
+        for _ in range(max_iter):
+            if not active.any():
+                break
+            arg = np.minimum(v_d / n_vt, EXP_MAX)
+            f = i_s * np.expm1(arg) + (v_d - v_source) / r
+            df = i_s * np.exp(arg) / n_vt + 1.0 / r
+            step = np.clip(f / df, -max_step, max_step)
+            v_d = np.where(active, v_d - step, v_d)
+            iterations += active
+            active &= np.abs(step) > tol
+        i_d = (v_source - v_d) / r
+    else:
+        raise ValueError(f"method không hợp lệ: {method!r} (dùng 'newton' hoặc 'lambertw')")
+
+    residual = np.abs(i_s * safe_expm1(v_d / n_vt) - (v_source - v_d) / r)
+    # Hội tụ khi dòng qua diode và dòng qua R khớp nhau trong sai số tương đối; cộng
+    # thêm sai số làm tròn của (Vs - Vd)/R, đáng kể khi phân cực ngược sâu với R nhỏ
+    rounding = 4 * np.finfo(float).eps * (np.abs(v_source) + np.abs(v_d)) / r
+    converged = residual <= 1e-9 * np.maximum(np.abs(i_d), i_s) + 1e-15 + rounding
+    return QPointSolution(v_d, i_d, iterations, converged, residual, method)
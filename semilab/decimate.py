@@ -0,0 +1,74 @@
+"""Giảm số điểm của chuỗi dữ liệu lớn trước khi gửi lên trình duyệt.
+
+Đồ thị rộng ~1000 px không hiển thị được nhiều hơn vài điểm trên mỗi pixel, nên
+chuỗi hàng trăm nghìn điểm được rút gọn theo "ngân sách pixel" trước khi dựng
+hình. Dữ liệu đầy đủ vẫn giữ ở phía server (để xuất file).
+
+- ``minmax_indices``: mỗi ô giữ điểm nhỏ nhất và lớn nhất, nên không làm mất
+  đỉnh nhọn / gai nhiễu (bao đường cong giữ nguyên).
+- ``lttb_indices``: Largest-Triangle-Three-Buckets, giữ hình dáng đường cong
+  với số điểm ít hơn (mỗi ô một điểm).
+"""
+import numpy as np
+
+# Số điểm tối đa mỗi đường trên đồ thị (~2 điểm / pixel ngang)
+PIXEL_BUDGET = 2000
+
+
+def minmax_indices(y, n_out):
+    """Chỉ số các điểm giữ lại theo min-max (tối đa ``n_out`` điểm, tăng dần)."""
+    y = np.asarray(y)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    width = -(-n // max((n_out - 2) // 2, 1))
+    n_bins = -(-n // width)
+    # Đệm bằng phần tử cuối để mọi ô cùng độ rộng rồi xử lý cả mảng một lần
+    block = np.pad(y, (0, n_bins * width - n), mode="edge").reshape(n_bins, width)
+    starts = np.arange(n_bins) * width
+    lo = np.minimum(starts + np.argmin(block, axis=1), n - 1)
+    hi = np.minimum(starts + np.argmax(block, axis=1), n - 1)
+    return np.unique(np.concatenate(([0], lo, hi, [n - 1])))
+
+
+def lttb_indices(x, y, n_out):
+    """Chỉ số các điểm giữ lại theo thuật toán LTTB (đúng ``n_out`` điểm, tăng dần)."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    # Điểm đầu/cuối luôn giữ; phần giữa chia thành n_out - 2 ô
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    # Trọng tâm của từng ô (dùng làm đỉnh thứ ba của tam giác)
+    counts = np.diff(edges)
+    cx = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    cy = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    cx = np.append(cx, x[-1])
+    cy = np.append(cy, y[-1])
+
+    out = np.empty(n_out, dtype=np.intp)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # Diện tích (x2) tam giác (điểm đã chọn, điểm ứng viên, trọng tâm ô kế tiếp)
+        area = np.abs((x[a] - cx[b + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy[b + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        out[b + 1] = a
+    return out
+
+
+def decimate(x, y, max_points=PIXEL_BUDGET, method="minmax"):
+    """Rút gọn ``(x, y)`` còn tối đa ``max_points`` điểm; chuỗi nhỏ được trả nguyên."""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(y) <= max_points:
+        return x, y
+    if method == "minmax":
+        idx = minmax_indices(y, max_points)
+    elif method == "lttb":
+        idx = lttb_indices(x, y, max_points)
+    else:
+        raise ValueError("method phải là 'minmax' hoặc 'lttb'")
+    return x[idx], y[idx]
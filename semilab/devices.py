@@ -0,0 +1,151 @@
+"""Mô hình linh kiện bán dẫn (Diode, MOSFET) tính bằng NumPy.
+
+Module này không phụ thuộc Streamlit/Plotly để có thể dùng lại ngoài giao diện
+(script, notebook, worker process).
+"""
+import numpy as np
+
+from semilab.cache import memoize
+from semilab.sampling import adaptive_sample
+
+K_B = 1.38e-23  # Hằng số Boltzmann (J/K)
+Q_E = 1.6e-19   # Điện tích electron (C)
+
+# Dòng bão hòa ngược (Is) giả định thay đổi theo vật liệu
+DIODE_MATERIALS = {
+    "Silicon (Si)": {"Is": 1e-12, "v_on": 0.7},    # pA range
+    "Germanium (Ge)": {"Is": 1e-6, "v_on": 0.3},   # uA range (Ge rò nhiều hơn)
+}
+
+
+# Số mũ lớn nhất trước khi exp() tràn float64 (~709.78)
+EXP_MAX = float(np.log(np.finfo(float).max))
+
+
+def safe_expm1(x):
+    """exp(x) - 1 không tràn số: số mũ bị kẹp tại ``EXP_MAX`` (kết quả hữu hạn)."""
+    return np.expm1(np.minimum(x, EXP_MAX))
+
+
+# ==============================================================================
+# DIODE (phương trình Shockley)
+# ==============================================================================
+def thermal_voltage(temp_c):
+    """Điện áp nhiệt V_T = kT/q (V) theo nhiệt độ °C (số hoặc mảng)."""
+    temp_k = np.asarray(temp_c, dtype=float) + 273.15
+    v_t = (K_B * temp_k) / Q_E
+    return v_t if v_t.ndim else float(v_t)
+
+
+def diode_current(v, temp_c=25.0, n=1.0, i_s=1e-12):
+    """Dòng qua diode I = Is (exp(V / (n V_T)) - 1), broadcast trên mọi tham số."""
+    v = np.asarray(v, dtype=float)
+    return i_s * safe_expm1(v / (n * thermal_voltage(temp_c)))
+
+
+def diode_sweep(v, temps_c, ns, materials):
+    """Quét toàn bộ lưới (nhiệt độ × n × vật liệu × V) trong một lần broadcast.
+
+    Trả về mảng ``(len(temps_c), len(ns), len(materials), len(v))``; ``materials``
+    là các khóa của ``DIODE_MATERIALS``.
+    """
+    v = np.asarray(v, dtype=float).reshape(1, 1, 1, -1)
+    v_t = thermal_voltage(np.asarray(temps_c, dtype=float)).reshape(-1, 1, 1, 1)
+    n = np.asarray(ns, dtype=float).reshape(1, -1, 1, 1)
+    i_s = np.array([DIODE_MATERIALS[m]["Is"] for m in materials], dtype=float).reshape(1, 1, -1, 1)
+    return i_s * safe_expm1(v / (n * v_t))
+
+
+# Lưới quét có thể tới hàng chục triệu điểm: chỉ giữ vài lưới gần nhất
+@memoize("diode_sweep_grid", maxsize=2)
+def diode_sweep_grid(temps_c, ns, materials, v_min=-1.0, v_max=1.0, points=400):
+    """Lưới quét đầy đủ độ phân giải ``(v, i)`` với ``i`` như ``diode_sweep`` (có cache, chỉ đọc)."""
+    v = np.linspace(v_min, v_max, points)
+    return _readonly(v), _readonly(diode_sweep(v, temps_c, ns, materials))
+
+
+@memoize("diode_curve", maxsize=64)
+def diode_curve(temp_c, n, material, v_min=-1.0, v_max=1.0, points=500):
+    """Đường I-V của diode theo vật liệu trong ``DIODE_MATERIALS`` (có cache, chỉ đọc)."""
+    v = np.linspace(v_min, v_max, points)
+    i = diode_current(v, temp_c, n, DIODE_MATERIALS[material]["Is"])
+    return _readonly(v), _readonly(i)
+
+
+@memoize("diode_curve_adaptive", maxsize=64)
+def diode_curve_adaptive(temp_c, n, material, v_min=-1.0, v_max=1.0, tol=1e-3, i_range=(-1e-3, 0.05)):
+    """Như ``diode_curve`` nhưng lấy mẫu thích nghi: dày ở khuỷu, thưa ở vùng phẳng.
+
+    Sai số được đo trong khung nhìn ``i_range`` (A) của đồ thị; ``None`` để dùng
+    toàn bộ dải dòng.
+    """
+    i_s = DIODE_MATERIALS[material]["Is"]
+    v, i = adaptive_sample(lambda x: diode_current(x, temp_c, n, i_s), v_min, v_max, tol,
+                           breakpoints=(0.0,), y_range=i_range)
+    return _readonly(v), _readonly(i)
+
+
+# ==============================================================================
+# MOSFET (mô hình bậc hai - square law)
+# ==============================================================================
+def mosfet_id(v_gs, v_ds, v_th=0.7, k_n=1.0, lambda_=0.0):
+    """Dòng I_D của N-MOSFET (cùng đơn vị với ``k_n``, ví dụ mA khi K tính bằng mA/V^2).
+
+    ``v_gs`` và ``v_ds`` được broadcast theo quy tắc NumPy, vì vậy có thể truyền
+    số vô hướng, hai mảng cùng kích thước, hoặc lưới Vgs × Vds
+    (``v_gs[:, None]``, ``v_ds[None, :]`` hay kết quả của ``np.meshgrid``).
+
+    - Cắt (cutoff):   Vgs < Vth                -> I_D = 0
+    - Tuyến tính:     Vds < Vgs - Vth          -> I_D = K (2 (Vgs - Vth) Vds - Vds^2)
+    - Bão hòa:        Vds >= Vgs - Vth         -> I_D = K (Vgs - Vth)^2
+    - ``lambda_`` > 0 thêm hiệu ứng điều biến chiều dài kênh: nhân với (1 + λ Vds).
+    """
+    v_gs = np.asarray(v_gs, dtype=float)
+    v_ds = np.asarray(v_ds, dtype=float)
+
+    v_ov = v_gs - v_th
+    # Kẹp Vds tại Vgs - Vth: công thức vùng tuyến tính tại điểm này cho đúng
+    # giá trị bão hòa, nên cả hai vùng được tính trong một biểu thức duy nhất.
+    v_eff = np.minimum(v_ds, v_ov)
+    i_d = k_n * (2 * v_ov - v_eff) * v_eff
+    if lambda_:
+        i_d = i_d * (1 + lambda_ * v_ds)
+    return np.where(v_ov < 0, 0.0, i_d)
+
+
+def mosfet_family(v_gs_list, v_ds, v_th=0.7, k_n=1.0, lambda_=0.0):
+    """Họ đặc tuyến đầu ra: mảng 2 chiều ``(len(v_gs_list), len(v_ds))``."""
+    v_gs = np.asarray(v_gs_list, dtype=float).reshape(-1, 1)
+    v_ds = np.asarray(v_ds, dtype=float).reshape(1, -1)
+    return mosfet_id(v_gs, v_ds, v_th=v_th, k_n=k_n, lambda_=lambda_)
+
+
+@memoize("mosfet_curves", maxsize=64)
+def mosfet_curves(v_gs_list, v_th=0.7, k_n=1.0, lambda_=0.0, v_ds_max=5.0, points=100):
+    """Họ đặc tuyến trên lưới ``linspace(0, v_ds_max, points)`` (có cache, chỉ đọc)."""
+    v_ds = np.linspace(0, v_ds_max, points)
+    i_d = mosfet_family(v_gs_list, v_ds, v_th=v_th, k_n=k_n, lambda_=lambda_)
+    return _readonly(v_ds), _readonly(i_d)
+
+
+@memoize("mosfet_curves_adaptive", maxsize=64)
+def mosfet_curves_adaptive(v_gs_list, v_th=0.7, k_n=1.0, lambda_=0.0, v_ds_max=5.0, tol=1e-3):
+    """Họ đặc tuyến lấy mẫu thích nghi: mỗi Vgs một cặp ``(v_ds, i_d)`` riêng (chỉ đọc).
+
+    Ranh giới tuyến tính / bão hòa Vds = Vgs - Vth luôn là một điểm mẫu. Sai số
+    tính theo dải Id của cả họ, giống khi các đường được vẽ chung một đồ thị.
+    """
+    i_max = float(mosfet_family(v_gs_list, [0.0, v_ds_max], v_th=v_th, k_n=k_n, lambda_=lambda_).max())
+    curves = []
+    for v_gs in v_gs_list:
+        v_ds, i_d = adaptive_sample(
+            lambda x: mosfet_id(v_gs, x, v_th=v_th, k_n=k_n, lambda_=lambda_), 0.0, v_ds_max, tol,
+            breakpoints=(v_gs - v_th,), y_range=(0.0, i_max) if i_max > 0 else None)
+        curves.append((_readonly(v_ds), _readonly(i_d)))
+    return tuple(curves)
+
+
+def _readonly(arr):
+    # Kết quả trong cache được chia sẻ giữa các phiên: khóa ghi để tránh bị sửa nhầm
+    arr.flags.writeable = False
+    return arr
@@ -0,0 +1,117 @@
+"""Hình học 3D của quy trình Fab dưới dạng dữ liệu thuần.
+
+Mỗi bước của công thức (``semilab.process``) được mô tả bằng danh sách hình
+hộp (``Box``) và tia (``Beam``); ``merge_boxes``/``merge_beams`` gộp chúng
+thành vài lưới lớn để phần giao diện chỉ phải dựng một số ít trace Plotly.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+
+class Box(NamedTuple):
+    x0: float
+    x1: float
+    y0: float
+    y1: float
+    z0: float
+    z1: float
+    color: str
+    name: str = ""
+    opacity: float = 1.0
+
+
+class Beam(NamedTuple):
+    x: float
+    y: float
+    z0: float
+    z1: float
+    color: str
+    width: int
+    name: str
+    dash: str = "solid"
+
+
+class MergedMesh(NamedTuple):
+    """Nhiều hình hộp gộp thành một lưới tam giác (một trace ``Mesh3d``)."""
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    i: np.ndarray
+    j: np.ndarray
+    k: np.ndarray
+    face_colors: list   # màu của từng mặt tam giác
+    vertex_names: list  # tên lớp của từng đỉnh (hiện khi rê chuột)
+    opacity: float
+
+
+class BeamPath(NamedTuple):
+    """Các tia cùng kiểu nét gộp thành một đường gấp khúc, ngắt bằng ``None``."""
+    x: list
+    y: list
+    z: list
+    color: str
+    width: int
+    name: str
+    dash: str
+
+
+# Các mặt tam giác (i, j, k) nối 8 đỉnh của hình hộp
+BOX_FACES_I = np.array([7, 0, 0, 0, 4, 4, 6, 6, 4, 0, 3, 2])
+BOX_FACES_J = np.array([3, 4, 1, 2, 5, 6, 5, 2, 0, 1, 6, 3])
+BOX_FACES_K = np.array([0, 7, 2, 3, 6, 7, 1, 1, 5, 5, 7, 6])
+BOX_FACES = np.stack([BOX_FACES_I, BOX_FACES_J, BOX_FACES_K])  # (3, 12)
+
+# Đỉnh thứ v của hình hộp lấy x1 (thay vì x0) khi mẫu = 1; tương tự cho y, z
+_CORNER_X = np.array([0, 0, 1, 1, 0, 0, 1, 1], dtype=bool)
+_CORNER_Y = np.array([0, 1, 1, 0, 0, 1, 1, 0], dtype=bool)
+_CORNER_Z = np.array([0, 0, 0, 0, 1, 1, 1, 1], dtype=bool)
+
+
+def box_vertices(box):
+    """8 đỉnh của hình hộp, trả về ba mảng ``(x, y, z)``."""
+    x = np.where(_CORNER_X, box.x1, box.x0).astype(float)
+    y = np.where(_CORNER_Y, box.y1, box.y0).astype(float)
+    z = np.where(_CORNER_Z, box.z1, box.z0).astype(float)
+    return x, y, z
+
+
+def merge_boxes(boxes):
+    """Gộp các hình hộp thành ``MergedMesh``, mỗi mức ``opacity`` một lưới.
+
+    Đỉnh được tính cho mọi hộp trong một lần broadcast; chỉ số mặt lấy từ mẫu
+    ``BOX_FACES`` cộng độ lệch 8 đỉnh của từng hộp.
+    """
+    meshes = []
+    for opacity in dict.fromkeys(box.opacity for box in boxes):
+        group = [box for box in boxes if box.opacity == opacity]
+        bounds = np.array([box[:6] for box in group], dtype=float)  # (n, 6): x0 x1 y0 y1 z0 z1
+        x = np.where(_CORNER_X, bounds[:, 1:2], bounds[:, 0:1]).ravel()
+        y = np.where(_CORNER_Y, bounds[:, 3:4], bounds[:, 2:3]).ravel()
+        z = np.where(_CORNER_Z, bounds[:, 5:6], bounds[:, 4:5]).ravel()
+        faces = (BOX_FACES[:, None, :] + 8 * np.arange(len(group))[None, :, None]).reshape(3, -1)
+        n_faces = BOX_FACES.shape[1]
+        meshes.append(MergedMesh(
+            x, y, z, faces[0], faces[1], faces[2],
+            [box.color for box in group for _ in range(n_faces)],
+            [box.name for box in group for _ in range(8)],
+            opacity,
+        ))
+    return meshes
+
+
+def merge_beams(beams):
+    """Gộp các tia cùng (màu, độ dày, tên, nét) thành một ``BeamPath``."""
+    groups = {}
+    for beam in beams:
+        groups.setdefault((beam.color, beam.width, beam.name, beam.dash), []).append(beam)
+    paths = []
+    for (color, width, name, dash), group in groups.items():
+        x, y, z = [], [], []
+        for beam in group:
+            x += [beam.x, beam.x, None]
+            y += [beam.y, beam.y, None]
+            z += [beam.z0, beam.z1, None]
+        paths.append(BeamPath(x[:-1], y[:-1], z[:-1], color, width, name, dash))
+    return paths
+
@@ -0,0 +1,393 @@
+"""Dựng hình Plotly cho các module (có cache theo tham số).
+
+Khác với phần còn lại của ``semilab``, module này import Plotly nên chỉ được
+giao diện import. Hình trả về được chia sẻ giữa các lần rerun: không sửa trực
+tiếp, hãy ``go.Figure(fig)`` nếu cần một bản riêng.
+"""
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from semilab.cache import memoize
+from semilab.carriers import CARRIER_MATERIALS, fermi_level_map, solve_fermi_level
+from semilab.circuits import solve_diode_resistor
+from semilab.devices import (
+    DIODE_MATERIALS,
+    diode_current,
+    diode_curve_adaptive,
+    diode_sweep_grid,
+    mosfet_curves_adaptive,
+)
+from semilab.decimate import PIXEL_BUDGET, decimate
+from semilab.fab import BeamPath, MergedMesh, merge_beams, merge_boxes
+from semilab.pn_junction import pn_junction_sweep
+from semilab.process import grid_boxes, recipe_run, step_decorations
+from semilab.sampling import adaptive_sample
+
+# Khung nhìn dòng điện của các đồ thị diode (A) và sai số lấy mẫu cho phép
+DIODE_I_RANGE = (-1e-3, 0.05)
+CURVE_TOL = 1e-3
+# Từ số điểm này một đường được vẽ bằng WebGL (Scattergl) thay cho SVG
+WEBGL_MIN_POINTS = 1000
+
+
+def line_trace(x, y, name, max_points=PIXEL_BUDGET, method="minmax", **kwargs):
+    """Đường cho chuỗi cỡ bất kỳ: rút gọn theo ngân sách pixel, WebGL khi nhiều điểm.
+
+    Dữ liệu được truyền dạng mảng float32 để Plotly mã hóa nhị phân (typed array)
+    thay vì danh sách số JSON.
+    """
+    x, y = decimate(x, y, max_points, method)
+    trace = go.Scattergl if len(x) >= WEBGL_MIN_POINTS else go.Scatter
+    return trace(x=np.asarray(x, dtype=np.float32), y=np.asarray(y, dtype=np.float32),
+                 mode='lines', name=name, **kwargs)
+
+
+# ==============================================================================
+# MODULE 2: CỔNG LOGIC
+# ==============================================================================
+def waveform_figure(waveforms, end_time):
+    """Dạng sóng số: mỗi net một làn, vẽ dạng bậc thang."""
+    fig = go.Figure()
+    nets = list(waveforms)
+    for lane, net in enumerate(reversed(nets)):
+        times = [t for t, _ in waveforms[net]] + [end_time]
+        levels = [v for _, v in waveforms[net]]
+        levels.append(levels[-1])
+        fig.add_trace(go.Scatter(
+            x=times, y=[lane * 1.5 + 0.9 * v for v in levels], mode='lines', line_shape='hv',
+            name=net, hovertemplate=f"{net}: t=%{{x}}<extra></extra>"
+        ))
+    fig.update_layout(
+        title="Dạng sóng (Waveform)",
+        xaxis_title="Thời gian (đơn vị trễ)",
+        yaxis=dict(tickvals=[lane * 1.5 + 0.45 for lane in range(len(nets))], ticktext=nets[::-1],
+                   showgrid=False, zeroline=False),
+        height=max(250, 60 * len(nets)),
+        showlegend=False,
+        template="plotly_white"
+    )
+    return fig
+
+
+# ==============================================================================
+# MODULE 3: ĐẶC TUYẾN V-A
+# ==============================================================================
+@memoize("fig_diode", maxsize=64)
+def diode_figure(temp_c, n_val, material):
+    # Lấy mẫu thích nghi: vài chục điểm dồn vào khuỷu thay cho 500 điểm đều
+    v, i = diode_curve_adaptive(temp_c, n_val, material, tol=CURVE_TOL, i_range=DIODE_I_RANGE)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=v, y=i, mode='lines', name=f'Diode {material}'))
+
+    fig.update_layout(
+        title=f"Đặc tuyến I-V của Diode tại {temp_c}°C",
+        xaxis_title="Điện áp V (Volt)",
+        yaxis_title="Dòng điện I (Ampe)",
+        yaxis_range=list(DIODE_I_RANGE), # Zoom vào vùng hoạt động
+        xaxis_range=[-1, 1],
+        template="plotly_white"
+    )
+    # Thêm đường 0
+    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+    fig.add_vline(x=0, line_dash="dash", line_color="gray")
+    return fig
+
+
+@memoize("fig_load_line", maxsize=64)
+def load_line_figure(temp_c, n_val, material, v_source, r):
+    """Đường đặc tuyến diode, đường tải Vs - R và điểm làm việc Q."""
+    i_s = DIODE_MATERIALS[material]["Is"]
+    q = solve_diode_resistor(v_source, r, temp_c, n_val, i_s)
+    v_d, i_q = float(q.v_d), float(q.i_d)
+
+    v_lo, v_hi = min(0.0, v_source), max(v_source, v_d) * 1.05 + 1e-3
+    i_max = max(abs(v_source) / r, abs(i_q)) * 1.2 + 1e-12
+    v, i = adaptive_sample(lambda x: diode_current(x, temp_c, n_val, i_s), v_lo, v_hi, CURVE_TOL,
+                           breakpoints=(0.0, v_d), y_range=(-0.1 * i_max, i_max))
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=v, y=i, mode='lines', name=f'Diode {material}'))
+    # Đường tải là đường thẳng: hai đầu mút là đủ
+    fig.add_trace(go.Scatter(x=[v_lo, v_hi], y=[(v_source - v_lo) / r, (v_source - v_hi) / r], mode='lines',
+                             name='Đường tải (Vs - V)/R', line=dict(dash='dash')))
+    fig.add_trace(go.Scatter(x=[v_d], y=[i_q], mode='markers', name='Điểm Q',
+                             marker=dict(size=12, color='red')))
+
+    fig.update_layout(
+        title=f"Điểm làm việc Q: Vd = {v_d:.4f} V, I = {i_q*1000:.4f} mA",
+        xaxis_title="Điện áp V (Volt)",
+        yaxis_title="Dòng điện I (Ampe)",
+        yaxis_range=[-0.1 * i_max, i_max],
+        template="plotly_white"
+    )
+    return fig, q
+
+
+def sweep_labels(temps_c, ns, materials):
+    """Nhãn của từng đường trong lưới quét, cùng thứ tự với ``diode_sweep``."""
+    return [f"{t:g}°C, n={n:g}, {m.split(' ')[0]}" for t in temps_c for n in ns for m in materials]
+
+
+@memoize("fig_diode_sweep", maxsize=32)
+def diode_sweep_figure(temps_c, ns, materials, view="family", points=400):
+    """Hình của cả lưới quét: ``view="family"`` (họ đường cong) hoặc ``"heatmap"``.
+
+    Lưới ``points`` điểm đầy đủ nằm trong cache ``diode_sweep_grid`` (để xuất
+    file); hình chỉ nhận bản rút gọn theo ngân sách pixel.
+    """
+    labels = sweep_labels(temps_c, ns, materials)
+    v, i = diode_sweep_grid(temps_c, ns, materials, points=points)
+    rows = i.reshape(len(labels), points)
+
+    fig = go.Figure()
+    if view == "heatmap":
+        # Giữ tối đa một nửa ngân sách pixel cột (cách đều) cho heatmap
+        cols = np.unique(np.linspace(0, points - 1, min(points, PIXEL_BUDGET // 2)).astype(np.intp))
+        v, rows = v[cols], rows[:, cols]
+        # log10|I| để thấy cả vùng ngược (pA) lẫn vùng thuận (mA) trên cùng thang màu
+        z = np.log10(np.abs(rows) + 1e-18).astype(np.float32)
+        fig.add_trace(go.Heatmap(x=v, y=labels, z=z, colorscale="Viridis", colorbar=dict(title="log10|I|")))
+        fig.update_layout(
+            title="Bản đồ log10|I| theo (Nhiệt độ, n, Vật liệu) × V",
+            xaxis_title="Điện áp V (Volt)",
+            height=max(400, 18 * len(labels)),
+            template="plotly_white"
+        )
+    else:
+        for label, row in zip(labels, rows):
+            fig.add_trace(line_trace(v, row, label))
+        fig.update_layout(
+            title="Họ đặc tuyến I-V của Diode (quét tham số)",
+            xaxis_title="Điện áp V (Volt)",
+            yaxis_title="Dòng điện I (Ampe)",
+            yaxis_range=list(DIODE_I_RANGE), # Zoom vào vùng hoạt động
+            xaxis_range=[-1, 1],
+            template="plotly_white"
+        )
+        fig.add_hline(y=0, line_dash="dash", line_color="gray")
+        fig.add_vline(x=0, line_dash="dash", line_color="gray")
+    return fig
+
+
+@memoize("fig_mosfet", maxsize=64)
+def mosfet_figure(v_th, k_n, lambda_=0.0, v_gs_list=(1.0, 2.0, 3.0, 4.0)):
+    # Họ đặc tuyến lấy mẫu thích nghi, luôn có điểm tại ranh giới Vds = Vgs - Vth
+    curves = mosfet_curves_adaptive(v_gs_list, v_th=v_th, k_n=k_n, lambda_=lambda_, tol=CURVE_TOL)
+
+    fig = go.Figure()
+    for v_gs, (v_ds, i_d) in zip(v_gs_list, curves):
+        fig.add_trace(go.Scatter(x=v_ds, y=i_d, mode='lines', name=f'Vgs = {v_gs}V'))
+
+    fig.update_layout(
+        title="Đặc tuyến đầu ra MOSFET (Id vs Vds)",
+        xaxis_title="Vds (Volt)",
+        yaxis_title="Id (mA)",
+        template="plotly_white"
+    )
+    return fig
+
+
+def mc_histogram_figure(result, metric, title, x_title, scale=1.0, bins=80):
+    """Histogram một chỉ số Monte Carlo (đếm sẵn ở server) kèm vạch giới hạn spec."""
+    values = result.metrics[metric].astype(float) * scale
+    counts, edges = np.histogram(values, bins=bins)
+    fig = go.Figure(go.Bar(x=0.5 * (edges[:-1] + edges[1:]), y=counts, width=np.diff(edges),
+                           marker_color="#0056b3", name=metric))
+    for limit in result.specs.get(metric, (None, None)):
+        if limit is not None:
+            fig.add_vline(x=limit * scale, line_dash="dash", line_color="red")
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title="Số linh kiện",
+                      bargap=0, showlegend=False, template="plotly_white")
+    return fig
+
+
+def mc_percentile_figure(result, title, x_title, y_title, log_y=False):
+    """Đường cong phân vị: dải p5-p95 tô màu, p1/p99 nét đứt, trung vị nét liền."""
+    curves = dict(zip(result.percentiles, result.curves))
+    fig = go.Figure()
+    if 5 in curves and 95 in curves:
+        fig.add_trace(go.Scatter(x=result.x, y=curves[95], mode='lines', line=dict(width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=result.x, y=curves[5], mode='lines', line=dict(width=0), fill='tonexty',
+                                 fillcolor='rgba(0, 86, 179, 0.25)', name='p5 - p95'))
+    for p, style in ((1, 'dot'), (99, 'dot'), (50, 'solid')):
+        if p in curves:
+            fig.add_trace(go.Scatter(x=result.x, y=curves[p], mode='lines', name=f'p{p}',
+                                     line=dict(color='#0056b3', dash=style)))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title,
+                      yaxis_type="log" if log_y else "linear", template="plotly_white")
+    return fig
+
+
+@memoize("fig_junction", maxsize=32)
+def junction_figure(profile, na, nd, length_um, nodes, biases, material, temp_c, bias_index):
+    """Thế ψ(x), điện trường E(x) và mật độ hạt dẫn tại một điểm phân cực; vùng nghèo được tô màu."""
+    sol = pn_junction_sweep(profile, na, nd, length_um, nodes, biases, material, temp_c)
+    k = bias_index
+    x_um = sol.x * 1e4
+    x_p, x_n = (edge[k] * 1e4 for edge in sol.depletion_edges())
+
+    fig = make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.06,
+                        subplot_titles=("Thế tĩnh điện ψ (V)", "Điện trường E (kV/cm)", "Mật độ (cm⁻³)"))
+    fig.add_trace(line_trace(x_um, sol.psi[k], "ψ", line=dict(color="#0056b3")), row=1, col=1)
+    fig.add_trace(line_trace(x_um, sol.field()[k] / 1e3, "E", line=dict(color="#B22222")), row=2, col=1)
+    fig.add_trace(line_trace(x_um, sol.electrons()[k], "n (electron)", line=dict(color="#0056b3")), row=3, col=1)
+    fig.add_trace(line_trace(x_um, sol.holes()[k], "p (lỗ trống)", line=dict(color="#B22222")), row=3, col=1)
+    fig.add_trace(line_trace(x_um, np.abs(sol.net_doping), "|N_D - N_A|",
+                             line=dict(color="gray", dash="dash")), row=3, col=1)
+    if np.isfinite(x_p):
+        for row in (1, 2, 3):
+            fig.add_vrect(x0=x_p, x1=x_n, fillcolor="orange", opacity=0.15, line_width=0, row=row, col=1)
+    fig.update_yaxes(type="log", range=[0, np.log10(np.abs(sol.net_doping).max()) + 1], row=3, col=1)
+    fig.update_xaxes(title_text="x (µm)", row=3, col=1)
+    fig.update_layout(title=f"Tiếp giáp PN tại V = {sol.bias[k]:.2f} V (phía P bên trái)",
+                      height=750, template="plotly_white")
+    return fig
+
+
+@memoize("fig_junction_cv", maxsize=16)
+def junction_cv_figure(profile, na, nd, length_um, nodes, biases, material, temp_c):
+    """Điện dung vùng nghèo C(V) và 1/C² (đường thẳng với tiếp giáp đột ngột)."""
+    sol = pn_junction_sweep(profile, na, nd, length_um, nodes, biases, material, temp_c)
+    cap = sol.capacitance() * 1e9
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Scatter(x=sol.bias, y=cap, mode='lines+markers', name='C (nF/cm²)'))
+    fig.add_trace(go.Scatter(x=sol.bias, y=1 / cap ** 2, mode='lines', name='1/C²',
+                             line=dict(dash='dash')), secondary_y=True)
+    fig.update_layout(title="Điện dung vùng nghèo theo điện áp (C-V)", xaxis_title="Điện áp V (Volt)",
+                      template="plotly_white")
+    fig.update_yaxes(title_text="C (nF/cm²)", secondary_y=False)
+    fig.update_yaxes(title_text="1/C² (cm⁴/nF²)", secondary_y=True)
+    return fig
+
+
+@memoize("fig_fermi_temp", maxsize=32)
+def fermi_temperature_figure(material, n_type, doping, temp_range=(50.0, 600.0), ionization=True, points=400):
+    """Giản đồ năng lượng theo nhiệt độ: E_c, E_v, E_i, mức tạp chất và E_F (đóng băng -> ngoại lai -> thuần)."""
+    temps = np.linspace(*temp_range, points)
+    state = solve_fermi_level(doping if n_type else 0.0, 0.0 if n_type else doping, temps, material, ionization)
+    params = CARRIER_MATERIALS[material]
+    e_dopant = state.e_g - params["e_donor"] if n_type else np.full(points, params["e_acceptor"])
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=temps, y=state.e_g, mode='lines', name='E_c', line=dict(color='#0056b3')))
+    fig.add_trace(go.Scatter(x=temps, y=np.zeros(points), mode='lines', name='E_v', line=dict(color='#B22222')))
+    fig.add_trace(go.Scatter(x=temps, y=state.e_i, mode='lines', name='E_i', line=dict(color='gray', dash='dot')))
+    fig.add_trace(go.Scatter(x=temps, y=e_dopant, mode='lines', name='E_D' if n_type else 'E_A',
+                             line=dict(color='gray', dash='dash')))
+    fig.add_trace(go.Scatter(x=temps, y=state.e_f, mode='lines', name='E_F', line=dict(color='black', width=3)))
+    fig.update_layout(title=f"Mức Fermi theo nhiệt độ ({'N' if n_type else 'P'} = {doping:.0e} cm⁻³)",
+                      xaxis_title="Nhiệt độ T (K)", yaxis_title="Năng lượng (eV, gốc E_v)",
+                      template="plotly_white")
+    return fig
+
+
+@memoize("fig_fermi_map", maxsize=8)
+def fermi_map_figure(material, n_type, log_doping, temp_range, resolution, quantity="e_f", ionization=True):
+    """Heatmap (nhiệt độ × pha tạp) của ``quantity``: ``"e_f"`` (E_F - E_i), ``"n"``,
+    ``"p"`` (log10, cm⁻³) hoặc ``"ionized"`` (tỉ lệ tạp chất bị ion hóa)."""
+    doping, temps, state = fermi_level_map(material, n_type, log_doping, temp_range, resolution, ionization)
+    if quantity == "e_f":
+        z, label, extra = state.e_f - state.e_i, "E_F - E_i (eV)", dict(colorscale="RdBu_r", zmid=0.0)
+    elif quantity == "ionized":
+        ionized = state.donors_ionized if n_type else state.acceptors_ionized
+        z, label, extra = ionized / doping, "N⁺/N", dict(colorscale="Viridis", zmin=0.0, zmax=1.0)
+    else:
+        z, label, extra = np.log10(getattr(state, quantity)), f"log10 {quantity} (cm⁻³)", dict(colorscale="Viridis")
+    # float32: Plotly gửi z dạng mảng nhị phân, 10^6 ô ~4 MB
+    fig = go.Figure(go.Heatmap(x=np.log10(doping).astype(np.float32), y=temps.astype(np.float32),
+                               z=z.astype(np.float32), colorbar=dict(title=label), **extra))
+    fig.update_layout(title=f"Bản đồ {label} theo pha tạp {'N_D' if n_type else 'N_A'} × nhiệt độ "
+                            f"({resolution}×{resolution} điểm)",
+                      xaxis_title="log10 nồng độ pha tạp (cm⁻³)", yaxis_title="Nhiệt độ T (K)",
+                      height=550, template="plotly_white")
+    return fig
+
+
+# ==============================================================================
+# MODULE 5: QUY TRÌNH FAB
+# ==============================================================================
+def _fab_scene_layout(fig, width=10, depth=6, height=7):
+    # Cấu hình Camera và Khung cảnh
+    fig.update_layout(
+        title="Mô phỏng 3D Quy trình Fab (Kéo chuột để xoay)",
+        scene=dict(
+            xaxis=dict(range=[0, width], showbackground=False, visible=False),
+            yaxis=dict(range=[0, depth], showbackground=False, visible=False),
+            zaxis=dict(range=[0, height], showbackground=False, visible=False),
+            aspectmode='manual',
+            aspectratio=dict(x=1, y=0.5, z=0.5), # Tỉ lệ hình hộp chữ nhật đẹp
+            camera=dict(
+                eye=dict(x=1.5, y=1.5, z=1.2) # Góc nhìn Isometric
+            )
+        ),
+        margin=dict(l=0, r=0, t=30, b=0),
+        height=500
+    )
+    return fig
+
+
+def _recipe_step_geometry(run, step_index):
+    # Lưới gộp theo mức opacity và đường tia theo kiểu (màu, độ dày, tên, nét) của một bước
+    grid = run.grid(step_index)
+    mask_boxes, beams = step_decorations(run.recipe, step_index, grid)
+    meshes = {mesh.opacity: mesh for mesh in merge_boxes(grid_boxes(grid, run.recipe.grid) + mask_boxes)}
+    paths = {path[3:]: path for path in merge_beams(beams)}
+    return meshes, paths
+
+
+def _recipe_step_traces(meshes, paths, mesh_keys, path_keys):
+    # Mỗi mức opacity một Mesh3d, mỗi kiểu tia một Scatter3d, theo thứ tự khóa cho trước;
+    # nhóm không có ở bước này (kể cả lưới trống) là trace rỗng để mọi frame của hoạt
+    # ảnh có cùng số trace, cùng thứ tự
+    traces = []
+    for opacity in mesh_keys:
+        mesh = meshes.get(opacity) or MergedMesh([], [], [], [], [], [], [], [], opacity)
+        traces.append(go.Mesh3d(x=mesh.x, y=mesh.y, z=mesh.z, i=mesh.i, j=mesh.j, k=mesh.k,
+                                facecolor=mesh.face_colors, opacity=mesh.opacity,
+                                hovertext=mesh.vertex_names, hoverinfo="text", name="Layers", showscale=False))
+    for key in path_keys:
+        path = paths.get(key) or BeamPath([], [], [], *key)
+        traces.append(go.Scatter3d(x=path.x, y=path.y, z=path.z, mode='lines', showlegend=key in paths,
+                                   line=dict(color=path.color, width=path.width, dash=path.dash), name=path.name))
+    return traces
+
+
+@memoize("fig_recipe_step", maxsize=32)
+def recipe_step_figure(recipe_json, step_index, resolution=None):
+    """Hình 3D của bước ``step_index`` khi chạy công thức (nội dung JSON) trên lưới voxel.
+
+    Trạng thái lưới lấy từ ``recipe_run`` (tính tăng dần từ bước trước đã lưu).
+    """
+    run = recipe_run(recipe_json, resolution)
+    meshes, paths = _recipe_step_geometry(run, step_index)
+    fig = go.Figure(_recipe_step_traces(meshes, paths, list(meshes) or [1.0], list(paths)))
+    return _fab_scene_layout(fig, run.recipe.grid.width, run.recipe.grid.depth, run.recipe.grid.height)
+
+
+@memoize("fig_recipe_animation", maxsize=4)
+def recipe_animation_figure(recipe_json, resolution=None, frame_ms=800):
+    """Hoạt ảnh cả công thức: mỗi bước một frame Plotly, kèm nút Play/Pause và thanh trượt."""
+    run = recipe_run(recipe_json, resolution)
+    labels = [step.get("label", step["op"]) for step in run.recipe.steps]
+    geometry = [_recipe_step_geometry(run, k) for k in range(len(run))]
+    # Hợp các nhóm của mọi bước: frame nào cũng có đủ trace (rỗng nếu bước đó không có nhóm)
+    mesh_keys = list(dict.fromkeys(key for meshes, _ in geometry for key in meshes)) or [1.0]
+    path_keys = list(dict.fromkeys(key for _, paths in geometry for key in paths))
+    frames = [go.Frame(data=_recipe_step_traces(meshes, paths, mesh_keys, path_keys), name=str(k))
+              for k, (meshes, paths) in enumerate(geometry)]
+    fig = go.Figure(data=frames[0].data, frames=frames)
+    _fab_scene_layout(fig, run.recipe.grid.width, run.recipe.grid.depth, run.recipe.grid.height)
+
+    play = dict(frame=dict(duration=frame_ms, redraw=True), transition=dict(duration=0), fromcurrent=True)
+    pause = dict(frame=dict(duration=0, redraw=False), mode="immediate")
+    fig.update_layout(
+        height=560,
+        updatemenus=[dict(type="buttons", direction="left", x=0, y=0, xanchor="left", yanchor="top",
+                          buttons=[dict(label="▶ Play", method="animate", args=[None, play]),
+                                   dict(label="⏸ Pause", method="animate", args=[[None], pause])])],
+        sliders=[dict(active=0, x=0.15, len=0.85, y=0, currentvalue=dict(prefix="Bước: "),
+                      steps=[dict(label=label, method="animate",
+                                  args=[[str(k)], dict(frame=dict(duration=0, redraw=True), mode="immediate")])
+                             for k, label in enumerate(labels)])]
+    )
+    return fig
@@ -0,0 +1,78 @@
+"""Các loại công việc mô phỏng, dùng chung cho ``semilab.batch`` và ``semilab.store``.
+
+Mỗi loại là một hàm nhận tham số dạng keyword (đều có giá trị mặc định, trừ
+logic) và trả về bảng cột: dict tên cột -> mảng 1-D cùng độ dài. ``job_params``
+gắn tham số vào chữ ký hàm và điền giá trị mặc định, nên một công việc ghi
+thiếu hay ghi đủ các tham số mặc định vẫn là cùng một bộ tham số.
+"""
+import inspect
+from pathlib import Path
+
+import numpy as np
+
+from semilab.circuits import solve_diode_resistor
+from semilab.devices import DIODE_MATERIALS, diode_current, mosfet_family
+from semilab.logic import Netlist
+
+
+def _diode_job(v_min=-1.0, v_max=1.0, points=500, temp_c=25.0, n=1.0, material="Silicon (Si)", i_s=None):
+    v = np.linspace(v_min, v_max, int(points))
+    i_s = DIODE_MATERIALS[material]["Is"] if i_s is None else i_s
+    return {"v": v, "i": diode_current(v, temp_c, n, i_s)}
+
+
+def _diode_circuit_job(v_source=5.0, r=1000.0, temp_c=25.0, n=1.0, material="Silicon (Si)", i_s=None,
+                       method="newton"):
+    i_s = DIODE_MATERIALS[material]["Is"] if i_s is None else i_s
+    v_source, r, temp_c, n = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(value, dtype=float)) for value in (v_source, r, temp_c, n)))
+    q = solve_diode_resistor(v_source, r, temp_c, n, i_s, method=method)
+    return {"v_source": v_source, "r": r, "temp_c": temp_c, "n": n, "v_d": q.v_d, "i_d": q.i_d,
+            "iterations": q.iterations, "converged": q.converged}
+
+
+def _mosfet_job(v_gs=(1.0, 2.0, 3.0, 4.0), v_ds_max=5.0, points=100, v_th=0.7, k_n=1.0, lambda_=0.0):
+    v_gs = np.atleast_1d(np.asarray(v_gs, dtype=float))
+    v_ds = np.linspace(0, v_ds_max, int(points))
+    i_d = mosfet_family(v_gs, v_ds, v_th=v_th, k_n=k_n, lambda_=lambda_)
+    vgs_grid, vds_grid = np.meshgrid(v_gs, v_ds, indexing="ij")
+    return {"v_gs": vgs_grid.ravel(), "v_ds": vds_grid.ravel(), "i_d": i_d.ravel()}
+
+
+def _logic_job(netlist=None, netlist_file=None):
+    if (netlist is None) == (netlist_file is None):
+        raise ValueError("công việc logic cần đúng một trong hai: netlist, netlist_file")
+    text = netlist if netlist is not None else Path(netlist_file).read_text(encoding="utf-8")
+    parsed = Netlist.parse(text)
+    table = parsed.truth_table()
+    n_rows = 1 << len(parsed.inputs)
+
+    # Các mạch khác nhau có số cột khác nhau: gộp bit vào chuỗi ("011") để mọi
+    # công việc logic dùng chung một bảng
+    def bits(nets):
+        if not nets:
+            return np.full(n_rows, "")
+        digits = np.ascontiguousarray(np.stack([table[net] for net in nets], axis=1) + ord("0"), dtype=np.uint8)
+        return digits.view(f"S{len(nets)}").ravel().astype(str)
+
+    return {"vector": np.arange(n_rows), "inputs": bits(parsed.inputs), "outputs": bits(parsed.outputs)}
+
+
+JOB_KINDS = {
+    "diode": _diode_job,
+    "diode_circuit": _diode_circuit_job,
+    "mosfet": _mosfet_job,
+    "logic": _logic_job,
+}
+
+
+def job_params(kind, params):
+    """Tham số đầy đủ (đã điền giá trị mặc định) của công việc ``kind``; ``ValueError`` nếu sai."""
+    if kind not in JOB_KINDS:
+        raise ValueError(f"kind không hợp lệ: {kind!r} (hỗ trợ: {', '.join(JOB_KINDS)})")
+    try:
+        bound = inspect.signature(JOB_KINDS[kind]).bind(**params)
+    except TypeError as exc:
+        raise ValueError(f"tham số công việc {kind}: {exc}") from None
+    bound.apply_defaults()
+    return dict(bound.arguments)
@@ -0,0 +1,259 @@
+"""Cổng logic và mô phỏng mạch tổ hợp (netlist) song song theo bit.
+
+Mỗi net được biểu diễn bằng một mảng ``uint64``: bit thứ k của mảng là giá
+trị của net tại vector đầu vào thứ k. Với N đầu vào, cả 2^N vector được tính
+cùng lúc bằng các phép toán bit của NumPy (64 vector mỗi phép trên một từ).
+"""
+import functools
+import operator
+import re
+
+import numpy as np
+
+from semilab.cache import memoize
+
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+MAX_INPUTS = 24  # 2^24 vector = 2 MB mỗi net
+
+
+# Các hàm dùng toán tử bit của Python nên chạy được trên cả mảng uint64 đã
+# đóng gói lẫn số nguyên 0/1 thường (khi đó lấy kết quả & 1).
+def _and(*xs):
+    return functools.reduce(operator.and_, xs)
+
+
+def _or(*xs):
+    return functools.reduce(operator.or_, xs)
+
+
+def _xor(*xs):
+    return functools.reduce(operator.xor, xs)
+
+
+# Tên cổng -> (hàm trên từ đã đóng gói, số đầu vào tối thiểu, tối đa, biểu thức Boolean)
+GATES = {
+    "AND": (_and, 2, None, "Y = A . B"),
+    "OR": (_or, 2, None, "Y = A + B"),
+    "NOT": (operator.invert, 1, 1, "Y = ~A"),
+    "NAND": (lambda *xs: ~_and(*xs), 2, None, "Y = ~(A . B)"),
+    "NOR": (lambda *xs: ~_or(*xs), 2, None, "Y = ~(A + B)"),
+    "XOR": (_xor, 2, None, "Y = A ⊕ B"),
+}
+
+# Phần tử tuần tự (chỉ dùng trong mô phỏng theo thời gian, xem ``semilab.eventsim``)
+SEQUENTIAL_GATES = {
+    "DFF": (None, 2, 2, "Q = D tại sườn lên của CLK"),     # Q = DFF(D, CLK)
+    "DLATCH": (None, 2, 2, "Q = D khi EN = 1"),           # Q = DLATCH(D, EN)
+}
+
+
+def evaluate_gate(gate_type, *bits):
+    """Giá trị (0/1) của một cổng với các đầu vào 0/1."""
+    return GATES[gate_type][0](*(int(b) for b in bits)) & 1
+
+
+class Netlist:
+    """Mạch tổ hợp gồm các đầu vào, các cổng ``out = TYPE(in1, in2, ...)`` và đầu ra."""
+
+    gate_types = GATES
+
+    def __init__(self, inputs=(), outputs=()):
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.gates = []  # (net ra, loại cổng, tuple net vào)
+        self.delays = {}  # net ra -> độ trễ truyền của cổng (nếu có khai báo)
+        self._drivers = {}
+        self._order = None
+        self.depth = 0  # Số mức logic, cập nhật sau levelize()
+
+    def add_gate(self, output, gate_type, *inputs, delay=None):
+        gate_type = gate_type.upper()
+        if gate_type not in self.gate_types:
+            raise ValueError(f"Cổng không hỗ trợ: {gate_type}")
+        _, min_in, max_in, _ = self.gate_types[gate_type]
+        if len(inputs) < min_in or (max_in is not None and len(inputs) > max_in):
+            raise ValueError(f"{gate_type} ({output}): số đầu vào không hợp lệ ({len(inputs)})")
+        if output in self._drivers or output in self.inputs:
+            raise ValueError(f"Net {output} được điều khiển nhiều lần")
+        if delay is not None:
+            if delay < 0:
+                raise ValueError(f"{output}: độ trễ phải >= 0")
+            self.delays[output] = float(delay)
+        self._drivers[output] = len(self.gates)
+        self.gates.append((output, gate_type, tuple(inputs)))
+        self._order = None
+        return self
+
+    @classmethod
+    def single_gate(cls, gate_type):
+        """Mạch chỉ có một cổng: đầu vào A (và B), đầu ra Y."""
+        inputs = ["A"] if GATES[gate_type][1] == 1 else ["A", "B"]
+        return cls(inputs, ["Y"]).add_gate("Y", gate_type, *inputs)
+
+    @classmethod
+    def parse(cls, text):
+        """Đọc netlist dạng văn bản::
+
+            INPUT A B CIN
+            OUTPUT S COUT
+            N1 = XOR(A, B)
+            S = XOR(N1, CIN) @ 2
+
+        ``@ d`` (tùy chọn) khai báo độ trễ truyền của cổng. Dòng trống và phần
+        sau ``#`` bị bỏ qua.
+        """
+        netlist = cls()
+        gate_re = re.compile(r"^(\w+)\s*=\s*(\w+)\s*\(([^)]*)\)\s*(?:@\s*([0-9.eE+-]+))?$")
+        for lineno, line in enumerate(text.splitlines(), 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            head, _, rest = line.partition(" ")
+            if head.upper() == "INPUT":
+                netlist.inputs += rest.replace(",", " ").split()
+            elif head.upper() == "OUTPUT":
+                netlist.outputs += rest.replace(",", " ").split()
+            else:
+                match = gate_re.match(line)
+                if not match:
+                    raise ValueError(f"Dòng {lineno}: không đọc được '{line}'")
+                output, gate_type, args, delay = match.groups()
+                netlist.add_gate(output, gate_type, *(a.strip() for a in args.split(",") if a.strip()),
+                                 delay=float(delay) if delay else None)
+        return netlist
+
+    def levelize(self):
+        """Sắp xếp topo các cổng tổ hợp (chỉ tính một lần cho đến khi mạch thay đổi).
+
+        Đầu ra của phần tử tuần tự (nếu có) được coi như đầu vào của phần tổ hợp.
+        """
+        if self._order is not None:
+            return self._order
+        combinational = [idx for idx, (_, gate_type, _) in enumerate(self.gates) if gate_type in GATES]
+        sources = self.inputs + [out for out, gate_type, _ in self.gates if gate_type not in GATES]
+        known = set(sources)
+        level = {net: 0 for net in sources}
+        order = []
+        pending = {}
+        waiting_on = {}
+        ready = []
+        for idx in combinational:
+            out, _, ins = self.gates[idx]
+            missing = {net for net in ins if net not in known}
+            for net in missing:
+                if net not in self._drivers:
+                    raise ValueError(f"Net {net} (đầu vào của {out}) không có nguồn")
+                waiting_on.setdefault(net, []).append(idx)
+            pending[idx] = len(missing)
+            if not missing:
+                ready.append(idx)
+        while ready:
+            idx = ready.pop()
+            out, _, ins = self.gates[idx]
+            level[out] = 1 + max(level[net] for net in ins)
+            order.append(idx)
+            for nxt in waiting_on.pop(out, ()):
+                pending[nxt] -= 1
+                if pending[nxt] == 0:
+                    ready.append(nxt)
+        if len(order) != len(combinational):
+            raise ValueError("Netlist có vòng lặp hồi tiếp (không phải mạch tổ hợp)")
+        for net in self.outputs:
+            if net not in level:
+                raise ValueError(f"Đầu ra {net} không có nguồn")
+        order.sort(key=lambda idx: level[self.gates[idx][0]])
+        self._order = order
+        self.depth = max((level[self.gates[idx][0]] for idx in order), default=0)
+        return order
+
+    def simulate_all(self, nets=None):
+        """Giá trị đóng gói (mảng ``uint64``) của các net ``nets`` (mặc định: đầu ra)
+        trên toàn bộ 2^N vector đầu vào."""
+        n_inputs = len(self.inputs)
+        if any(gate_type not in GATES for _, gate_type, _ in self.gates):
+            raise ValueError("simulate_all chỉ áp dụng cho mạch tổ hợp")
+        if n_inputs > MAX_INPUTS:
+            raise ValueError(f"Tối đa {MAX_INPUTS} đầu vào (mạch có {n_inputs})")
+        order = self.levelize()
+        keep = set(self.outputs if nets is None else nets)
+
+        values = {net: exhaustive_input_words(n_inputs, i) for i, net in enumerate(self.inputs)}
+        # Đếm số lần net còn được dùng để giải phóng bộ nhớ sớm
+        fanout = {}
+        for idx in order:
+            for net in self.gates[idx][2]:
+                fanout[net] = fanout.get(net, 0) + 1
+        for idx in order:
+            out, gate_type, ins = self.gates[idx]
+            values[out] = GATES[gate_type][0](*(values[net] for net in ins))
+            for net in ins:
+                fanout[net] -= 1
+                if fanout[net] == 0 and net not in keep:
+                    del values[net]
+        return {net: values[net] for net in (self.outputs if nets is None else nets)}
+
+    def truth_table(self):
+        """Bảng chân trị đầy đủ: dict tên cột -> mảng 0/1 dài 2^N (đầu vào rồi đầu ra)."""
+        n_vectors = 1 << len(self.inputs)
+        nets = list(dict.fromkeys(self.inputs + self.outputs))
+        packed = self.simulate_all(nets)
+        return {net: unpack_bits(packed[net], n_vectors) for net in nets}
+
+
+EXAMPLE_NETLIST = """# Bộ cộng toàn phần (Full Adder)
+INPUT A B CIN
+OUTPUT S COUT
+N1 = XOR(A, B)
+S = XOR(N1, CIN)
+N2 = AND(A, B)
+N3 = AND(N1, CIN)
+COUT = OR(N2, N3)
+"""
+
+
+@memoize("netlist_truth_table", maxsize=8)
+def netlist_truth_table(text):
+    """Đọc netlist văn bản và tính bảng chân trị (có cache theo nội dung)."""
+    netlist = Netlist.parse(text)
+    return netlist, netlist.truth_table()
+
+
+def exhaustive_input_words(n_inputs, index):
+    """Các từ ``uint64`` của đầu vào thứ ``index`` khi liệt kê 2^N vector
+    (đầu vào đầu tiên là bit có trọng số lớn nhất, giống thứ tự bảng chân trị)."""
+    n_words = max(1, (1 << n_inputs) >> 6)
+    bit = n_inputs - 1 - index
+    if bit >= 6:
+        # Chu kỳ >= 64 vector: mỗi từ toàn 0 hoặc toàn 1
+        word_start = np.arange(n_words, dtype=np.uint64) << np.uint64(6)
+        on = (word_start >> np.uint64(bit)) & np.uint64(1)
+        return np.where(on.astype(bool), ALL_ONES, np.uint64(0))
+    # Chu kỳ < 64: cùng một mẫu bit lặp lại trong mọi từ
+    lanes = np.arange(64, dtype=np.uint64)
+    pattern = np.bitwise_or.reduce(((lanes >> np.uint64(bit)) & np.uint64(1)) << lanes)
+    return np.full(n_words, pattern, dtype=np.uint64)
+
+
+def unpack_bits(words, n_bits):
+    """Mảng ``uint64`` đóng gói -> mảng 0/1 (``uint8``) gồm ``n_bits`` phần tử đầu."""
+    raw = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    return np.unpackbits(raw, bitorder="little")[:n_bits]
+
+
+def random_netlist(n_inputs, n_gates, n_outputs=8, seed=0):
+    """Sinh mạch tổ hợp ngẫu nhiên (dùng để đo hiệu năng)."""
+    rng = np.random.default_rng(seed)
+    netlist = Netlist([f"I{i}" for i in range(n_inputs)])
+    nets = list(netlist.inputs)
+    types = list(GATES)
+    for g in range(n_gates):
+        gate_type = types[rng.integers(len(types))]
+        arity = 1 if gate_type == "NOT" else 2
+        # Ưu tiên các net gần đây để mạch có độ sâu đáng kể
+        lo = max(0, len(nets) - 4 * n_inputs)
+        ins = [nets[rng.integers(lo, len(nets))] for _ in range(arity)]
+        out = f"G{g}"
+        netlist.add_gate(out, gate_type, *ins)
+        nets.append(out)
+    netlist.outputs = nets[-min(n_outputs, n_gates):] if n_gates else nets[:n_outputs]
+    return netlist
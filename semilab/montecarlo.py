@@ -0,0 +1,230 @@
+"""Monte Carlo biến thiên công nghệ và hiệu suất (yield) cho Diode / MOSFET.
+
+Mỗi tham số (Is, n, Vth, K, nhiệt độ...) được lấy mẫu từ một phân bố; hàng
+trăm nghìn linh kiện ảo được tính theo từng lô (``chunk_size``) nên bộ nhớ
+không phụ thuộc số linh kiện:
+
+- Các chỉ số vô hướng (ví dụ Vf tại 1 mA) được giữ đủ cho mọi linh kiện
+  (float32, 4 byte/linh kiện) để tính phân vị chính xác và so với giới hạn spec.
+- Đường cong phân vị I-V dùng histogram log10|I| cộng dồn qua các lô (độ phân
+  giải ~0.01 decade), không lưu cả ma trận linh kiện × điểm V.
+"""
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from semilab.cache import memoize
+from semilab.devices import diode_current, mosfet_id, thermal_voltage
+
+DEFAULT_PERCENTILES = (1, 5, 50, 95, 99)
+CHUNK_SIZE = 20_000  # ~50 MB đỉnh với lưới 60 điểm
+
+
+class Distribution(NamedTuple):
+    """Phân bố của một tham số: ``normal`` (a=trung bình, b=độ lệch chuẩn),
+    ``lognormal`` (a=trung vị, b=độ lệch chuẩn của ln), ``uniform`` (a..b)."""
+    kind: str
+    a: float
+    b: float = 0.0
+
+    def sample(self, rng, size):
+        if self.kind == "normal":
+            return rng.normal(self.a, self.b, size) if self.b else np.full(size, float(self.a))
+        if self.kind == "lognormal":
+            return self.a * np.exp(rng.normal(0.0, self.b, size)) if self.b else np.full(size, float(self.a))
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b, size)
+        raise ValueError(f"phân bố {self.kind!r} không hợp lệ (normal, lognormal, uniform)")
+
+
+def normal(mean, sigma=0.0):
+    return Distribution("normal", mean, sigma)
+
+
+def lognormal(median, sigma_ln=0.0):
+    return Distribution("lognormal", median, sigma_ln)
+
+
+def uniform(lo, hi):
+    return Distribution("uniform", lo, hi)
+
+
+class _LogHistogram:
+    """Phân vị theo cột của dữ liệu cộng dồn qua nhiều lô (histogram log10 của ``|giá trị|``).
+
+    Giá trị âm được lấy trị tuyệt đối (đường cong chỉ có một chiều dòng, ví dụ
+    Id khi Vds > 0); giá trị 0 (MOSFET tắt) và mọi ``|giá trị|`` < 10^``lo`` rơi
+    vào bin thấp nhất (~1e-18). Giá trị > 10^``hi`` được dồn vào bin cao nhất và
+    đếm trong ``clipped``.
+    """
+
+    def __init__(self, n_cols, lo=-18.0, hi=12.0, bins=3000):
+        self.lo, self.hi, self.bins = lo, hi, bins
+        self.counts = np.zeros((n_cols, bins), dtype=np.int64)
+        self.clipped = 0
+
+    def add(self, values):
+        logs = np.log10(np.maximum(np.abs(values), 10.0 ** self.lo))
+        idx = ((logs - self.lo) * (self.bins / (self.hi - self.lo))).astype(np.int64)
+        self.clipped += int(np.count_nonzero(idx >= self.bins))
+        idx = np.clip(idx, 0, self.bins - 1) + self.bins * np.arange(self.counts.shape[0])
+        self.counts += np.bincount(idx.ravel(), minlength=self.counts.size).reshape(self.counts.shape)
+
+    def percentiles(self, percentiles):
+        cdf = np.cumsum(self.counts, axis=1)
+        total = cdf[:, -1:]
+        centers = self.lo + (np.arange(self.bins) + 0.5) * (self.hi - self.lo) / self.bins
+        out = np.empty((len(percentiles), self.counts.shape[0]))
+        for row, p in enumerate(percentiles):
+            first = np.argmax(cdf >= np.ceil(p / 100 * total), axis=1)
+            out[row] = 10.0 ** centers[first]
+        return out
+
+
+class MonteCarloResult(NamedTuple):
+    n_devices: int
+    metrics: dict          # tên -> mảng float32 (mỗi linh kiện một giá trị)
+    specs: dict            # tên -> (min, max), None = không giới hạn
+    passed: np.ndarray     # bool, linh kiện đạt mọi spec
+    x: np.ndarray          # trục của đường cong phân vị (V hoặc Vds)
+    percentiles: tuple
+    curves: np.ndarray     # (len(percentiles), len(x))
+    clipped: int           # số điểm (linh kiện × x) vượt trần histogram 1e12, bị dồn vào bin cao nhất
+    seconds: float
+
+    @property
+    def yield_(self):
+        return float(self.passed.mean())
+
+    def spec_yield(self):
+        """Tỉ lệ đạt của từng spec riêng lẻ."""
+        return {name: float(_within(self.metrics[name], limits).mean()) for name, limits in self.specs.items()}
+
+    def summary(self):
+        """Thống kê từng chỉ số: trung bình, độ lệch chuẩn và các phân vị."""
+        rows = {}
+        for name, values in self.metrics.items():
+            values = values.astype(float)
+            pct = np.percentile(values, self.percentiles)
+            rows[name] = {"mean": float(values.mean()), "std": float(values.std()),
+                          **{f"p{p:g}": float(v) for p, v in zip(self.percentiles, pct)}}
+        return rows
+
+
+def _within(values, limits):
+    lo, hi = limits
+    ok = np.ones(values.shape, dtype=bool)
+    if lo is not None:
+        ok &= values >= lo
+    if hi is not None:
+        ok &= values <= hi
+    return ok
+
+
+def _check_sizes(n_devices, chunk_size):
+    if n_devices < 1:
+        raise ValueError("n_devices phải >= 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size phải >= 1")
+
+
+def _run(n_devices, chunk_size, seed, sample_chunk, x, specs, percentiles):
+    # Khung chung: lấy mẫu theo lô, gom chỉ số, cộng dồn histogram đường cong
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    metrics = {}
+    hist = _LogHistogram(len(x))
+    for offset in range(0, n_devices, chunk_size):
+        size = min(chunk_size, n_devices - offset)
+        chunk_metrics, chunk_curves = sample_chunk(rng, size)
+        for name, values in chunk_metrics.items():
+            metrics.setdefault(name, np.empty(n_devices, dtype=np.float32))[offset:offset + size] = values
+        hist.add(chunk_curves)
+
+    passed = np.ones(n_devices, dtype=bool)
+    for name, limits in specs.items():
+        passed &= _within(metrics[name], limits)
+    return MonteCarloResult(n_devices, metrics, dict(specs), passed, x, tuple(percentiles),
+                            hist.percentiles(percentiles), hist.clipped, time.perf_counter() - start)
+
+
+# ==============================================================================
+# DIODE
+# ==============================================================================
+def diode_monte_carlo(n_devices, i_s=lognormal(1e-12, 0.5), n=normal(1.0, 0.02), temp_c=normal(25.0, 0.0),
+                      i_test=1e-3, v_reverse=-1.0, specs=None, v=None, percentiles=DEFAULT_PERCENTILES,
+                      chunk_size=CHUNK_SIZE, seed=0):
+    """Monte Carlo cho diode Shockley.
+
+    Chỉ số của mỗi linh kiện: ``v_f`` - điện áp thuận tại dòng ``i_test`` (V),
+    ``i_leak`` - dòng rò tại ``v_reverse`` (A, giá trị tuyệt đối). ``specs`` là
+    dict ``{chỉ số: (min, max)}``. Đường cong phân vị là I(V) trên lưới ``v``
+    (mặc định 0.05..1 V, vùng thuận). ``n_devices`` phải >= 1.
+    """
+    _check_sizes(n_devices, chunk_size)
+    v = np.linspace(0.05, 1.0, 60) if v is None else np.asarray(v, dtype=float)
+
+    def sample_chunk(rng, size):
+        i_s_k = i_s.sample(rng, size)
+        n_k = n.sample(rng, size)
+        t_k = temp_c.sample(rng, size)
+        n_vt = n_k * thermal_voltage(t_k)
+        metrics = {
+            "v_f": n_vt * np.log1p(i_test / i_s_k),
+            "i_leak": np.abs(diode_current(v_reverse, t_k, n_k, i_s_k)),
+        }
+        curves = diode_current(v[None, :], t_k[:, None], n_k[:, None], i_s_k[:, None])
+        return metrics, curves
+
+    return _run(n_devices, chunk_size, seed, sample_chunk, v, specs or {}, percentiles)
+
+
+# ==============================================================================
+# MOSFET
+# ==============================================================================
+VTH_TEMPCO = -2e-3     # Hệ số nhiệt của Vth (V/°C)
+MOBILITY_EXPONENT = -1.5  # K ~ mu ~ (T / T0)^-1.5
+
+
+def mosfet_monte_carlo(n_devices, v_th=normal(0.7, 0.03), k_n=normal(1.0, 0.05), lambda_=0.0,
+                       temp_c=normal(25.0, 0.0), v_gs_on=3.0, v_ds_on=3.0, specs=None, v_ds=None,
+                       percentiles=DEFAULT_PERCENTILES, chunk_size=CHUNK_SIZE, seed=0):
+    """Monte Carlo cho N-MOSFET (square law, cùng đơn vị ``k_n`` như ``mosfet_id``).
+
+    Nhiệt độ làm Vth giảm ``VTH_TEMPCO`` V/°C và K giảm theo (T/T0)^-1.5 (linh
+    động hạt dẫn). Chỉ số: ``v_th`` (tại nhiệt độ làm việc) và ``i_on`` = Id tại
+    (``v_gs_on``, ``v_ds_on``). Đường cong phân vị là Id(Vds) tại ``v_gs_on``.
+    ``n_devices`` phải >= 1.
+    """
+    _check_sizes(n_devices, chunk_size)
+    v_ds = np.linspace(0.0, 5.0, 60) if v_ds is None else np.asarray(v_ds, dtype=float)
+
+    def sample_chunk(rng, size):
+        t_k = temp_c.sample(rng, size)
+        vth_k = v_th.sample(rng, size) + VTH_TEMPCO * (t_k - 25.0)
+        k_k = k_n.sample(rng, size) * ((t_k + 273.15) / 298.15) ** MOBILITY_EXPONENT
+        metrics = {
+            "v_th": vth_k,
+            "i_on": mosfet_id(v_gs_on, v_ds_on, vth_k, k_k, lambda_),
+        }
+        curves = mosfet_id(v_gs_on, v_ds[None, :], vth_k[:, None], k_k[:, None], lambda_)
+        return metrics, curves
+
+    return _run(n_devices, chunk_size, seed, sample_chunk, v_ds, specs or {}, percentiles)
+
+
+# Phiên bản có cache cho giao diện: tham số là số/tuple (hashable)
+@memoize("mc_diode", maxsize=8)
+def diode_yield(n_devices, is_median, is_sigma_ln, n_mean, n_sigma, t_mean, t_sigma, vf_spec, leak_max, seed=0):
+    return diode_monte_carlo(n_devices, lognormal(is_median, is_sigma_ln), normal(n_mean, n_sigma),
+                             normal(t_mean, t_sigma), specs={"v_f": vf_spec, "i_leak": (None, leak_max)},
+                             seed=seed)
+
+
+@memoize("mc_mosfet", maxsize=8)
+def mosfet_yield(n_devices, vth_mean, vth_sigma, k_mean, k_sigma, lambda_, t_mean, t_sigma, ion_spec,
+                 vth_spec, v_gs_on=3.0, v_ds_on=3.0, seed=0):
+    return mosfet_monte_carlo(n_devices, normal(vth_mean, vth_sigma), normal(k_mean, k_sigma), lambda_,
+                              normal(t_mean, t_sigma), v_gs_on, v_ds_on,
+                              specs={"i_on": ion_spec, "v_th": vth_spec}, seed=seed)
@@ -0,0 +1,240 @@
+"""Tĩnh điện lớp tiếp giáp PN 1 chiều: phương trình Poisson giải bằng sai phân hữu hạn.
+
+    d/dx (ε dψ/dx) = -q (p - n + N_D - N_A)
+    n = n_i exp((ψ - φ_n) / V_T),   p = n_i exp((φ_p - ψ) / V_T)
+
+Phía P nằm ở x = 0, phía N ở x = L. Điện áp phân cực V đặt vào tiếp điểm P với
+mức quasi-Fermi không đổi trong cả linh kiện (φ_p = V, φ_n = 0; gần đúng cân
+bằng từng phần, đúng cho vùng nghèo khi dòng nhỏ). Hai tiếp điểm là biên
+Dirichlet theo điều kiện trung hòa điện tích.
+
+Newton trên thế chuẩn hóa u = ψ / V_T: Jacobian là ma trận ba đường chéo đối
+xứng, nên mỗi vòng lặp là một lần giải băng O(N). Các điểm phân cực được gom
+thành lô và xếp thành một hệ khối ba đường chéo giải chung (vector hóa theo V);
+mỗi lô xuất phát từ nghiệm đã hội tụ gần nhất (warm start), đi dần từ V = 0 ra
+hai phía.
+"""
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from semilab.cache import memoize
+from semilab.devices import EXP_MAX, K_B, Q_E, thermal_voltage
+
+EPS_0 = 8.854e-14  # Hằng số điện môi chân không (F/cm)
+
+# Tham số vật liệu tại 300 K (đơn vị cm, eV)
+JUNCTION_MATERIALS = {
+    "Silicon (Si)": {"eps_r": 11.7, "ni_300": 1.0e10, "eg": 1.12},
+    "Germanium (Ge)": {"eps_r": 16.0, "ni_300": 2.0e13, "eg": 0.66},
+}
+
+
+def intrinsic_density(material, temp_c=26.85):
+    """Mật độ hạt dẫn thuần n_i (cm^-3), ngoại suy từ 300 K: n_i ~ T^1.5 exp(-Eg / 2kT)."""
+    params = JUNCTION_MATERIALS[material]
+    temp_k = np.asarray(temp_c, dtype=float) + 273.15
+    eg_over_k = params["eg"] * Q_E / K_B
+    ni = params["ni_300"] * (temp_k / 300.0) ** 1.5 * np.exp(-0.5 * eg_over_k * (1.0 / temp_k - 1.0 / 300.0))
+    return ni if ni.ndim else float(ni)
+
+
+# ==============================================================================
+# PHÂN BỐ PHA TẠP (N_D - N_A, cm^-3)
+# ==============================================================================
+def abrupt_doping(x, na, nd, x_j=None):
+    """Tiếp giáp đột ngột: N_A ở x < x_j, N_D ở x >= x_j (mặc định x_j = giữa đoạn)."""
+    x = np.asarray(x, dtype=float)
+    x_j = 0.5 * (x[0] + x[-1]) if x_j is None else x_j
+    return np.where(x < x_j, -float(na), float(nd))
+
+
+def graded_doping(x, gradient, x_j=None, background=0.0):
+    """Tiếp giáp biến đổi tuyến tính: N_D - N_A = a (x - x_j), ``gradient`` a (cm^-4).
+
+    ``background`` (cm^-3) là nồng độ tối thiểu mỗi phía, tránh vùng gần thuần ở hai đầu.
+    """
+    x = np.asarray(x, dtype=float)
+    x_j = 0.5 * (x[0] + x[-1]) if x_j is None else x_j
+    net = gradient * (x - x_j)
+    return np.where(x < x_j, np.minimum(net, -background), np.maximum(net, background))
+
+
+def abrupt_depletion(na, nd, bias=0.0, material="Silicon (Si)", temp_c=26.85):
+    """Gần đúng vùng nghèo cho tiếp giáp đột ngột: ``(V_bi, W, x_p, x_n, E_max)``.
+
+    Đơn vị V, cm, V/cm; dùng để đối chiếu với lời giải số.
+    """
+    ni = intrinsic_density(material, temp_c)
+    eps = JUNCTION_MATERIALS[material]["eps_r"] * EPS_0
+    v_bi = thermal_voltage(temp_c) * np.log(na * nd / ni ** 2)
+    drop = np.maximum(v_bi - np.asarray(bias, dtype=float), 0.0)
+    width = np.sqrt(2 * eps * drop / Q_E * (1 / na + 1 / nd))
+    x_p = width * nd / (na + nd)
+    x_n = width * na / (na + nd)
+    return v_bi, width, x_p, x_n, Q_E * na * x_p / eps
+
+
+# ==============================================================================
+# LỜI GIẢI
+# ==============================================================================
+class JunctionSolution(NamedTuple):
+    x: np.ndarray            # lưới (cm), N điểm
+    net_doping: np.ndarray   # N_D - N_A (cm^-3)
+    bias: np.ndarray         # điện áp phân cực (V), B điểm, theo thứ tự đã cho
+    psi: np.ndarray          # thế tĩnh điện (V), (B, N)
+    v_bi: float              # thế tiếp xúc (V) tính từ lời giải cân bằng
+    ni: float                # cm^-3
+    eps: float               # F/cm
+    v_t: float               # V
+    iterations: np.ndarray   # số vòng Newton của từng điểm phân cực
+    converged: np.ndarray
+    seconds: float
+
+    def electrons(self):
+        return self.ni * np.exp(np.minimum(self.psi / self.v_t, EXP_MAX))
+
+    def holes(self):
+        return self.ni * np.exp(np.minimum((self.bias[:, None] - self.psi) / self.v_t, EXP_MAX))
+
+    def field(self):
+        """Điện trường E = -dψ/dx (V/cm), (B, N)."""
+        return -np.gradient(self.psi, self.x, axis=1)
+
+    def charge_density(self):
+        """Mật độ điện tích ρ = q (p - n + N_D - N_A) (C/cm^3), (B, N)."""
+        return Q_E * (self.holes() - self.electrons() + self.net_doping)
+
+    def depletion_edges(self, threshold=0.5):
+        """Biên vùng nghèo ``(x_p, x_n)`` (cm): vùng có |ρ| > ``threshold`` · q|N_D - N_A|."""
+        depleted = np.abs(self.charge_density()) > threshold * Q_E * np.abs(self.net_doping)
+        first = np.argmax(depleted, axis=1)
+        last = depleted.shape[1] - 1 - np.argmax(depleted[:, ::-1], axis=1)
+        x_p = np.where(depleted.any(axis=1), self.x[first], np.nan)
+        x_n = np.where(depleted.any(axis=1), self.x[last], np.nan)
+        return x_p, x_n
+
+    def depletion_charge(self):
+        """Điện tích dương của vùng nghèo (phía N) trên một đơn vị diện tích (C/cm^2)."""
+        rho = np.maximum(self.charge_density(), 0.0)
+        return np.sum(0.5 * (rho[:, 1:] + rho[:, :-1]) * np.diff(self.x), axis=1)
+
+    def capacitance(self):
+        """Điện dung vùng nghèo C = |dQ/dV| (F/cm^2); cần ít nhất 2 điểm phân cực."""
+        order = np.argsort(self.bias)
+        c = np.empty(len(self.bias))
+        c[order] = np.abs(np.gradient(self.depletion_charge()[order], self.bias[order]))
+        return c
+
+
+def _neutral_potential(c, vp):
+    # u trung hòa: e^(vp - u) - e^(u) + c = 0 (c = (N_D - N_A)/n_i, φ_n = 0)
+    half = 0.5 * np.asarray(vp, dtype=float)
+    return half + np.arcsinh(c / (2.0 * np.exp(half)))
+
+
+def _newton(u, vp, c, h, k_delta, tol, max_iter, max_step):
+    # u: (B, N) đã đặt sẵn giá trị biên; các điểm chưa hội tụ được giải chung trong một hệ băng
+    from scipy.linalg import solveh_banded  # SciPy chỉ nạp khi cần giải
+
+    n_bias, n_nodes = u.shape
+    m = n_nodes - 2
+    inv_h = 1.0 / h
+    # -J đối xứng xác định dương: băng trên = -1/h, số 0 ở đầu mỗi khối tách các điểm phân cực
+    upper = np.concatenate(([0.0], -inv_h[1:m]))
+    coupling = inv_h[1:] + inv_h[:-1]
+    vp = np.asarray(vp, dtype=float)[:, None]
+
+    iterations = np.zeros(n_bias, dtype=int)
+    active = np.ones(n_bias, dtype=bool)
+    for _ in range(max_iter):
+        rows = np.flatnonzero(active)
+        if not len(rows):
+            break
+        sub = u[rows]
+        electrons = np.exp(np.minimum(sub[:, 1:-1], EXP_MAX))
+        holes = np.exp(np.minimum(vp[rows] - sub[:, 1:-1], EXP_MAX))
+        flux = np.diff(sub, axis=1) * inv_h
+        residual = flux[:, 1:] - flux[:, :-1] + k_delta * (holes - electrons + c)
+        ab = np.empty((2, len(rows) * m))
+        ab[0] = np.tile(upper, len(rows))
+        ab[1] = (coupling + k_delta * (holes + electrons)).ravel()
+        step = solveh_banded(ab, residual.ravel(), check_finite=False).reshape(len(rows), m)
+        step = np.clip(step, -max_step, max_step)
+        u[rows, 1:-1] += step
+        iterations[rows] += 1
+        active[rows] = np.max(np.abs(step), axis=1) > tol
+    return iterations, ~active
+
+
+def solve_pn_junction(x, net_doping, bias=(0.0,), material="Silicon (Si)", temp_c=26.85,
+                      tol=1e-9, max_iter=200, max_step=5.0, batch=8):
+    """Giải Poisson cho tiếp giáp PN trên lưới ``x`` (cm, tăng dần, có thể không đều).
+
+    ``net_doping`` = N_D - N_A (cm^-3) tại từng nút, âm ở phía P (x = 0). ``bias``
+    là dãy điện áp (V, dương = phân cực thuận); các điểm được giải theo lô
+    ``batch`` điểm, từ V = 0 ra hai phía, mỗi lô khởi tạo từ nghiệm gần nhất.
+    ``tol``, ``max_step`` tính theo V_T.
+    """
+    x = np.asarray(x, dtype=float)
+    net_doping = np.asarray(net_doping, dtype=float)
+    bias = np.atleast_1d(np.asarray(bias, dtype=float))
+    if x.ndim != 1 or len(x) < 3 or net_doping.shape != x.shape:
+        raise ValueError("x và net_doping phải là mảng 1 chiều cùng độ dài (>= 3 điểm)")
+    h = np.diff(x)
+    if np.any(h <= 0):
+        raise ValueError("lưới x phải tăng dần")
+    if not (net_doping[0] < 0 < net_doping[-1]):
+        raise ValueError("cần phía P (N_D - N_A < 0) ở x = 0 và phía N ở x = L")
+
+    start = time.perf_counter()
+    v_t = thermal_voltage(temp_c)
+    ni = intrinsic_density(material, temp_c)
+    eps = JUNCTION_MATERIALS[material]["eps_r"] * EPS_0
+    c = net_doping / ni
+    # Hệ số của số hạng điện tích sau khi nhân mỗi hàng với ô thể tích (h_{i-1} + h_i) / 2
+    k_delta = Q_E * ni / (eps * v_t) * 0.5 * (h[1:] + h[:-1])
+    solve = lambda u, vp: _newton(u, vp, c[1:-1], h, k_delta, tol, max_iter, max_step)  # noqa: E731
+
+    # Cân bằng nhiệt: khởi tạo bằng thế trung hòa cục bộ
+    u_eq = _neutral_potential(c, 0.0)[None, :].copy()
+    solve(u_eq, np.zeros(1))
+    u_eq = u_eq[0]
+
+    psi = np.empty((len(bias), len(x)))
+    iterations = np.zeros(len(bias), dtype=int)
+    converged = np.zeros(len(bias), dtype=bool)
+    # Hai nhánh: thuận (V >= 0, tăng dần) và ngược (V < 0, giảm dần); mỗi nhánh đi từ V = 0
+    for branch in (np.flatnonzero(bias >= 0), np.flatnonzero(bias < 0)):
+        branch = branch[np.argsort(np.abs(bias[branch]), kind="stable")]
+        prev, prev_vp = u_eq, 0.0
+        for lo in range(0, len(branch), batch):
+            idx = branch[lo:lo + batch]
+            vp = bias[idx] / v_t
+            # Dịch nghiệm trước theo hình dạng của chính nó: 1 ở tiếp điểm P, 0 ở tiếp điểm N
+            shape = (prev[-1] - prev) / (prev[-1] - prev[0])
+            u = prev[None, :] + (vp - prev_vp)[:, None] * shape[None, :]
+            u[:, 0] = _neutral_potential(c[0], vp)
+            u[:, -1] = _neutral_potential(c[-1], vp)
+            iterations[idx], converged[idx] = solve(u, vp)
+            psi[idx] = u * v_t
+            prev, prev_vp = u[-1], vp[-1]
+
+    return JunctionSolution(x, net_doping, bias, psi, v_t * (u_eq[-1] - u_eq[0]), ni, eps, v_t,
+                            iterations, converged, time.perf_counter() - start)
+
+
+# Phiên bản có cache cho giao diện: lưới đều, tham số là số/tuple (hashable)
+@memoize("pn_junction", maxsize=8)
+def pn_junction_sweep(profile, na, nd, length_um, nodes, biases, material="Silicon (Si)", temp_c=26.85):
+    """``profile``: ``"abrupt"`` (``na``, ``nd`` cm^-3) hoặc ``"graded"`` (tuyến tính, nồng độ
+    hai đầu = (``na`` + ``nd``) / 2). Độ dài tính bằng µm."""
+    x = np.linspace(0.0, length_um * 1e-4, nodes)
+    if profile == "abrupt":
+        doping = abrupt_doping(x, na, nd)
+    elif profile == "graded":
+        doping = graded_doping(x, (na + nd) / x[-1], background=min(na, nd) * 1e-3)
+    else:
+        raise ValueError(f"profile không hợp lệ: {profile!r} (abrupt, graded)")
+    return solve_pn_junction(x, doping, biases, material, temp_c)
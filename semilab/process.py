@@ -0,0 +1,540 @@
+"""Mô phỏng quy trình Fab trên lưới voxel, điều khiển bằng file công thức (recipe).
+
+Phiến wafer là mảng ``uint8`` ``(nx, ny, nz)``, mỗi ô chứa mã vật liệu
+(``AIR`` = 0). Mỗi bước công nghệ (oxy hóa, phủ PR, chiếu qua mặt nạ, hiện
+hình, ăn mòn, bóc PR, cấy ion...) là một phép toán NumPy trên cả lưới. Công
+thức là file JSON::
+
+    {"grid": {"width": 10, "depth": 6, "height": 7, "resolution": 0.1},
+     "masks": {"window": {"open": [[3, 7, 0, 6]]}},
+     "steps": [{"op": "substrate", "thickness": 2, "label": "..."}, ...]}
+
+Mặt nạ là mảng 2 chiều ``(nx, ny)``, ``True`` = vùng chắn sáng; có thể khai báo
+bằng hình chữ nhật (``open``/``opaque``, đơn vị như ``grid``), bằng ``pattern``
+(danh sách chuỗi, ``#`` = chắn, được co giãn theo lưới) hoặc file ``.npy`` (chỉ
+khi công thức đọc từ file, đường dẫn tính từ thư mục chứa công thức).
+
+Mọi lỗi của công thức (thiếu tham số, vật liệu hay mặt nạ lạ...) được báo bằng
+``ValueError`` ngay khi đọc, không phải lúc chạy bước tương ứng.
+"""
+import inspect
+import json
+import numbers
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from semilab.cache import memoize
+from semilab.fab import Beam, Box
+
+DEFAULT_RECIPE_PATH = Path(__file__).resolve().parent / "data" / "planar_recipe.json"
+
+# Mã vật liệu trong lưới voxel
+AIR, SI, SIO2, PR, PR_EXPOSED, N_DOPED, P_DOPED, METAL = range(8)
+
+# mã -> (tên, màu)
+MATERIALS = {
+    SI: ("Si Substrate", "lightgray"),
+    SIO2: ("SiO2", "#87CEEB"),
+    PR: ("Photoresist", "#FFB6C1"),
+    PR_EXPOSED: ("PR (đã chiếu)", "#DA70D6"),
+    N_DOPED: ("N-well", "yellow"),
+    P_DOPED: ("P-well", "#FFA07A"),
+    METAL: ("Metal", "#B0B0C0"),
+}
+MATERIAL_CODES = {"Si": SI, "SiO2": SIO2, "PR": PR, "PR_exposed": PR_EXPOSED,
+                  "N": N_DOPED, "P": P_DOPED, "Metal": METAL}
+
+MASK_COLOR = "black"
+MASK_THICKNESS = 0.2  # Bề dày mặt nạ khi vẽ (chỉ để hiển thị)
+
+
+class GridSpec(NamedTuple):
+    width: float
+    depth: float
+    height: float
+    resolution: float
+
+    @property
+    def shape(self):
+        return tuple(int(round(size / self.resolution)) for size in (self.width, self.depth, self.height))
+
+    def voxels(self, length):
+        """Độ dài vật lý -> số voxel (làm tròn)."""
+        return int(round(length / self.resolution))
+
+
+class Recipe(NamedTuple):
+    name: str
+    grid: GridSpec
+    masks: dict   # tên -> mảng bool (nx, ny), True = chắn sáng
+    steps: list   # các dict {"op": ..., tham số..., "label", "desc"}
+
+
+# ==============================================================================
+# ĐỌC CÔNG THỨC
+# ==============================================================================
+MAX_VOXELS = 10**8  # Giới hạn kích thước lưới (uint8: ~100 MB mỗi bản sao)
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def _rect_mask(shape, rects, res):
+    if not isinstance(rects, list) or not all(
+            isinstance(rect, list) and len(rect) == 4 and all(map(_is_number, rect)) for rect in rects):
+        raise ValueError("open/opaque phải là danh sách hình chữ nhật [x0, x1, y0, y1]")
+    mask = np.zeros(shape, dtype=bool)
+    for x0, x1, y0, y1 in rects:
+        mask[int(round(x0 / res)):int(round(x1 / res)), int(round(y0 / res)):int(round(y1 / res))] = True
+    return mask
+
+
+def build_mask(spec, grid, base_dir=None):
+    """Mặt nạ ``(nx, ny)`` từ khai báo trong công thức (``True`` = chắn sáng).
+
+    Mặt nạ ``file`` cần ``base_dir`` (thư mục chứa công thức); công thức không
+    đến từ file (ví dụ nội dung tải lên) không được đọc file trên máy chủ.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("mặt nạ phải là một object JSON")
+    shape = grid.shape[:2]
+    if "open" in spec:
+        return ~_rect_mask(shape, spec["open"], grid.resolution)
+    if "opaque" in spec:
+        return _rect_mask(shape, spec["opaque"], grid.resolution)
+    if "pattern" in spec:
+        lines = spec["pattern"]
+        if (not isinstance(lines, list) or not lines or not all(isinstance(row, str) for row in lines)
+                or not lines[0] or any(len(row) != len(lines[0]) for row in lines)):
+            raise ValueError("pattern phải là danh sách chuỗi khác rỗng, cùng độ dài")
+        # Dòng đầu của pattern là cạnh y lớn nhất (như khi nhìn từ trên xuống)
+        rows = np.array([[ch == "#" for ch in row] for row in lines], dtype=bool)
+        pattern = rows[::-1].T
+        ix = np.arange(shape[0]) * pattern.shape[0] // shape[0]
+        iy = np.arange(shape[1]) * pattern.shape[1] // shape[1]
+        return pattern[np.ix_(ix, iy)]
+    if "file" in spec:
+        if not isinstance(spec["file"], str):
+            raise ValueError("file của mặt nạ phải là đường dẫn (chuỗi)")
+        if base_dir is None:
+            raise ValueError(f"mặt nạ file {spec['file']!r} chỉ dùng được khi đọc công thức từ file")
+        try:
+            mask = np.load(Path(base_dir) / spec["file"]).astype(bool)
+        except (OSError, ValueError, EOFError) as exc:
+            raise ValueError(f"không đọc được mặt nạ {spec['file']!r}: {exc}") from exc
+        if mask.shape != shape:
+            raise ValueError(f"mặt nạ {spec['file']} có kích thước {mask.shape}, lưới cần {shape}")
+        return mask
+    raise ValueError("mặt nạ cần một trong các khóa: open, opaque, pattern, file")
+
+
+# Giá trị hợp lệ của các tham số không phải số
+_CHOICES = {"material": MATERIAL_CODES, "tone": ("positive", "negative"), "type": ("n", "p")}
+
+
+def _check_step(number, step, masks):
+    # Tham số của bước khớp chữ ký hàm _op_* tương ứng, kiểu và giá trị hợp lệ
+    if not isinstance(step, dict):
+        raise ValueError(f"bước {number}: cần một object JSON")
+    op = step.get("op")
+    if not isinstance(op, str) or op not in OPERATIONS:
+        raise ValueError(f"bước {number}: op {op!r} không hợp lệ (có: {', '.join(OPERATIONS)})")
+    for key in ("label", "desc"):
+        if not isinstance(step.get(key, ""), str):
+            raise ValueError(f"bước {number}: {key} phải là chuỗi")
+    params = {k: v for k, v in step.items() if k not in _STEP_KEYS}
+    try:
+        inspect.signature(OPERATIONS[op]).bind(None, None, **params)
+    except TypeError as exc:
+        raise ValueError(f"bước {number} ({op}): {exc}") from None
+    for name, value in params.items():
+        if name == "mask":
+            if not isinstance(value, str) or value not in masks:
+                raise ValueError(f"bước {number}: không có mặt nạ {value!r}")
+        elif name in _CHOICES:
+            if not isinstance(value, str) or value not in _CHOICES[name]:
+                raise ValueError(f"bước {number}: {name} {value!r} không hợp lệ (có: {', '.join(_CHOICES[name])})")
+        elif value is not None and (not _is_number(value) or value < 0):
+            raise ValueError(f"bước {number}: {name} phải là số >= 0")
+
+
+def parse_recipe(data, base_dir=None, resolution=None):
+    """Tạo ``Recipe`` từ dict (nội dung JSON); ``resolution`` ghi đè độ phân giải lưới."""
+    if not isinstance(data, dict):
+        raise ValueError("công thức phải là một object JSON")
+    for key in ("grid", "steps"):
+        if key not in data:
+            raise ValueError(f"công thức thiếu khóa {key!r}")
+    if not isinstance(data["grid"], dict) or not isinstance(data.get("masks", {}), dict):
+        raise ValueError("grid và masks phải là object JSON")
+    if not isinstance(data["steps"], list):
+        raise ValueError("steps phải là mảng JSON")
+    if set(data["grid"]) - set(GridSpec._fields) or {"width", "depth", "height"} - set(data["grid"]):
+        raise ValueError(f"grid cần width, depth, height (và resolution nếu muốn), có: {', '.join(map(str, data['grid']))}")
+    grid = GridSpec(**{"resolution": 0.1, **data["grid"]})
+    if resolution is not None:
+        grid = grid._replace(resolution=float(resolution))
+    if not all(_is_number(v) and v > 0 for v in grid):
+        raise ValueError("grid: width, depth, height, resolution phải là số > 0")
+    if min(grid.shape) < 1 or np.prod(grid.shape, dtype=float) > MAX_VOXELS:
+        raise ValueError(f"grid: lưới {grid.shape} phải có ít nhất 1 và tối đa {MAX_VOXELS:,} voxel")
+    masks = {name: build_mask(spec, grid, base_dir) for name, spec in data.get("masks", {}).items()}
+    steps = list(data["steps"])
+    if not steps:
+        raise ValueError("công thức cần ít nhất một bước")
+    for number, step in enumerate(steps):
+        _check_step(number, step, masks)
+    return Recipe(data.get("name", ""), grid, masks, steps)
+
+
+@memoize("recipe", maxsize=8)
+def recipe_from_json(text, base_dir=None, resolution=None):
+    """``Recipe`` từ nội dung JSON (có cache theo nội dung, ví dụ file người dùng tải lên)."""
+    return parse_recipe(json.loads(text), base_dir, resolution)
+
+
+def load_recipe(path=DEFAULT_RECIPE_PATH, resolution=None):
+    """Đọc công thức từ file; đường dẫn ``file`` của mặt nạ tính từ thư mục chứa file."""
+    path = Path(path)
+    return recipe_from_json(path.read_text(encoding="utf-8"), str(path.parent), resolution)
+
+
+# ==============================================================================
+# CÁC BƯỚC CÔNG NGHỆ (vector hóa trên cả lưới)
+# ==============================================================================
+def surface_index(grid):
+    """Chỉ số z ngay trên voxel rắn cao nhất của mỗi cột, mảng ``(nx, ny)``."""
+    solid = grid != AIR
+    nz = grid.shape[2]
+    return np.where(solid.any(axis=2), nz - np.argmax(solid[:, :, ::-1], axis=2), 0)
+
+
+def _z_between(grid, lo, hi):
+    # Vùng lo <= z < hi của từng cột (lo, hi là mảng (nx, ny))
+    z = np.arange(grid.shape[2])
+    return (z >= lo[..., None]) & (z < hi[..., None])
+
+
+def _fill_on_top(grid, thickness, material, columns=None):
+    top = surface_index(grid)
+    region = _z_between(grid, top, top + thickness)
+    if columns is not None:
+        region &= columns[..., None]
+    grid[region] = material
+
+
+def _from_top(grid, counted):
+    # Số voxel ``counted`` tính từ mặt trên xuống, tới và gồm cả z hiện tại
+    return np.cumsum(counted[:, :, ::-1], axis=2, dtype=np.int32)[:, :, ::-1]
+
+
+def _op_substrate(grid, spec, thickness):
+    grid[:, :, :spec.voxels(thickness)] = SI
+
+
+def _op_oxidize(grid, spec, thickness, consume=0.44):
+    """Oxy hóa nhiệt: phần ``consume`` của bề dày lấn xuống Si, phần còn lại mọc lên trên.
+
+    Chỉ các cột mà phía trên Si chỉ có SiO2 hoặc không khí mới bị oxy hóa.
+    """
+    n = spec.voxels(thickness)
+    n_down = int(round(n * consume))
+    is_si = (grid == SI) | (grid == N_DOPED) | (grid == P_DOPED)
+    si_top = surface_index(np.where(is_si, SI, AIR).astype(np.uint8))
+    z = np.arange(grid.shape[2])
+    above = z >= si_top[..., None]
+    blocked = (above & (grid != AIR) & (grid != SIO2)).any(axis=2)
+    columns = ~blocked & is_si.any(axis=2)
+    grid[_z_between(grid, si_top - n_down, si_top) & columns[..., None]] = SIO2
+    _fill_on_top(grid, n - n_down, SIO2, columns)
+
+
+def _op_spin_coat(grid, spec, thickness, material="PR"):
+    """Phủ quay: lớp phủ phẳng, mặt trên cao hơn điểm cao nhất của wafer ``thickness``."""
+    top = surface_index(grid)
+    level = np.full_like(top, top.max() + spec.voxels(thickness))
+    grid[_z_between(grid, top, level)] = MATERIAL_CODES[material]
+
+
+def _op_deposit(grid, spec, thickness, material="Metal"):
+    """Lắng đọng đều theo phương đứng lên mọi cột."""
+    _fill_on_top(grid, spec.voxels(thickness), MATERIAL_CODES[material])
+
+
+def _op_expose(grid, spec, mask):
+    """Chiếu sáng: PR ở các cột không bị mặt nạ che chuyển thành PR đã chiếu."""
+    grid[(grid == PR) & ~mask[..., None]] = PR_EXPOSED
+
+
+def _op_develop(grid, spec, tone="positive"):
+    """Hiện hình: PR dương tan phần đã chiếu, PR âm tan phần chưa chiếu."""
+    if tone == "positive":
+        grid[grid == PR_EXPOSED] = AIR
+    elif tone == "negative":
+        grid[grid == PR] = AIR
+        grid[grid == PR_EXPOSED] = PR
+    else:
+        raise ValueError("tone phải là 'positive' hoặc 'negative'")
+
+
+def _op_etch(grid, spec, material, depth=None):
+    """Ăn mòn dị hướng từ trên xuống: chỉ lấy đi ``material`` lộ ra (không bị lớp khác che)."""
+    target = grid == MATERIAL_CODES[material]
+    # Voxel "lộ" khi mọi voxel phía trên nó là không khí hoặc chính vật liệu bị ăn mòn
+    reach = np.logical_and.accumulate((target | (grid == AIR))[:, :, ::-1], axis=2)[:, :, ::-1]
+    removable = reach & target
+    if depth is not None:
+        removable &= _from_top(grid, removable) <= spec.voxels(depth)
+    grid[removable] = AIR
+
+
+def _op_strip(grid, spec):
+    """Bóc toàn bộ photoresist."""
+    grid[(grid == PR) | (grid == PR_EXPOSED)] = AIR
+
+
+def _op_implant(grid, spec, depth, type="n"):
+    """Cấy ion: ion đi ``depth`` vào vật liệu tính từ bề mặt; Si trong tầm đó bị pha tạp.
+
+    Oxide/PR dày hơn ``depth`` chặn hoàn toàn ion (đóng vai trò mặt nạ).
+    """
+    solid = grid != AIR
+    in_range = solid & (_from_top(grid, solid) <= spec.voxels(depth))
+    grid[in_range & (grid == SI)] = N_DOPED if type == "n" else P_DOPED
+
+
+OPERATIONS = {
+    "substrate": _op_substrate,
+    "oxidize": _op_oxidize,
+    "spin_coat": _op_spin_coat,
+    "deposit": _op_deposit,
+    "expose": _op_expose,
+    "develop": _op_develop,
+    "etch": _op_etch,
+    "strip": _op_strip,
+    "implant": _op_implant,
+}
+_STEP_KEYS = ("op", "label", "desc")
+
+
+def apply_step(grid, recipe, step):
+    """Áp dụng một bước của ``recipe`` lên ``grid`` (sửa tại chỗ)."""
+    params = {k: v for k, v in step.items() if k not in _STEP_KEYS}
+    if "mask" in params:
+        params["mask"] = recipe.masks[params["mask"]]
+    OPERATIONS[step["op"]](grid, recipe.grid, **params)
+    return grid
+
+
+def simulate(recipe, stop=None):
+    """Lưới sau khi chạy các bước ``0..stop`` (mặc định: toàn bộ công thức)."""
+    grid = np.zeros(recipe.grid.shape, dtype=np.uint8)
+    last = len(recipe.steps) - 1 if stop is None else stop
+    for step in recipe.steps[:last + 1]:
+        apply_step(grid, recipe, step)
+    return grid
+
+
+# ==============================================================================
+# CHẠY TĂNG DẦN + SNAPSHOT NÉN
+# ==============================================================================
+def _encode_diff(before, after):
+    # Chỉ lưu các voxel thay đổi: chỉ số (mã hóa hiệu số, rất dễ nén) + giá trị cũ/mới
+    before, after = before.reshape(-1), after.reshape(-1)
+    idx = np.flatnonzero(before != after)
+    deltas = np.diff(idx, prepend=0).astype(np.uint32)
+    payload = deltas.tobytes() + before[idx].tobytes() + after[idx].tobytes()
+    return len(idx), zlib.compress(payload, 1)
+
+
+def _apply_diff(grid, diff, forward=True):
+    n, payload = diff
+    raw = zlib.decompress(payload)
+    idx = np.cumsum(np.frombuffer(raw, dtype=np.uint32, count=n), dtype=np.int64)
+    values = np.frombuffer(raw, dtype=np.uint8, count=n, offset=4 * n + (n if forward else 0))
+    grid.reshape(-1)[idx] = values
+
+
+class RecipeRun:
+    """Chạy công thức tăng dần: bước k được tính từ trạng thái đã lưu của bước k-1.
+
+    Mỗi bước lưu một diff nén hai chiều (voxel thay đổi, giá trị cũ và mới) so
+    với bước trước; cứ ``keyframe_every`` bước lưu thêm một keyframe nén toàn lưới.
+    Lưới giải nén gần nhất được giữ làm "con trỏ", nên kéo thanh trượt sang bước
+    kề bên chỉ cần áp một diff (tiến hoặc lùi). Khi tổng dung lượng vượt
+    ``max_bytes``, các keyframe ít dùng nhất bị bỏ (diff luôn được giữ).
+    """
+
+    def __init__(self, recipe, keyframe_every=4, max_bytes=64 * 2**20):
+        self.recipe = recipe
+        self.keyframe_every = keyframe_every
+        self.max_bytes = max_bytes
+        self.steps_computed = 0
+        self._diffs = []
+        self._keyframes = OrderedDict()
+        self._cursor = (-1, np.zeros(recipe.grid.shape, dtype=np.uint8))
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.recipe.steps)
+
+    def grid(self, step):
+        """Lưới sau bước ``step`` (bản sao riêng, có thể sửa)."""
+        if not 0 <= step < len(self):
+            raise IndexError(f"bước {step} nằm ngoài 0..{len(self) - 1}")
+        with self._lock:
+            self._compute_until(step)
+            self._move_cursor(step)
+            return self._cursor[1].copy()
+
+    def _compute_until(self, step):
+        while len(self._diffs) <= step:
+            last = len(self._diffs) - 1
+            self._move_cursor(last)
+            before = self._cursor[1]
+            after = apply_step(before.copy(), self.recipe, self.recipe.steps[last + 1])
+            self._diffs.append(_encode_diff(before, after))
+            self._cursor = (last + 1, after)
+            self.steps_computed += 1
+            if (last + 1) % self.keyframe_every == 0:
+                self._keyframes[last + 1] = zlib.compress(after.tobytes(), 1)
+                self._evict()
+
+    def _move_cursor(self, step):
+        current, grid = self._cursor
+        if current == step:
+            return
+        # Bắt đầu từ con trỏ hoặc keyframe gần nhất phía trước, tùy cái nào ít diff hơn
+        start = max((k for k in self._keyframes if k <= step), default=None)
+        if start is not None and step - start < abs(step - current):
+            self._keyframes.move_to_end(start)
+            grid = np.frombuffer(zlib.decompress(self._keyframes[start]), dtype=np.uint8)
+            grid = grid.reshape(self.recipe.grid.shape).copy()
+            current = start
+        while current < step:
+            current += 1
+            _apply_diff(grid, self._diffs[current], forward=True)
+        while current > step:
+            _apply_diff(grid, self._diffs[current], forward=False)
+            current -= 1
+        self._cursor = (step, grid)
+
+    def _evict(self):
+        while self._keyframes and self.stored_bytes() > self.max_bytes:
+            self._keyframes.popitem(last=False)
+
+    def stored_bytes(self):
+        return sum(len(d[1]) for d in self._diffs) + sum(len(k) for k in self._keyframes.values())
+
+    def stats(self):
+        """Dung lượng snapshot đã nén so với lưu thô từng bước."""
+        return {
+            "steps": len(self._diffs),
+            "steps_computed": self.steps_computed,
+            "keyframes": len(self._keyframes),
+            "stored_bytes": self.stored_bytes(),
+            "raw_bytes": len(self._diffs) * int(np.prod(self.recipe.grid.shape)),
+        }
+
+
+@memoize("recipe_run", maxsize=4)
+def recipe_run(recipe_json, resolution=None):
+    """``RecipeRun`` dùng chung (giữa các lần rerun) cho một công thức và độ phân giải."""
+    return RecipeRun(recipe_from_json(recipe_json, resolution=resolution))
+
+
+# ==============================================================================
+# LƯỚI -> HÌNH HỘP (để dựng hình)
+# ==============================================================================
+def _merge_runs(pos, keys):
+    # Gộp các phần tử cùng khóa có ``pos`` liên tiếp: trả về (khóa, pos đầu, pos cuối + 1)
+    order = np.lexsort((pos,) + tuple(keys.T[::-1]))
+    pos, keys = pos[order], keys[order]
+    new = np.ones(len(pos), dtype=bool)
+    new[1:] = (keys[1:] != keys[:-1]).any(axis=1) | (pos[1:] != pos[:-1] + 1)
+    first = np.flatnonzero(new)
+    last = np.append(first[1:] - 1, len(pos) - 1)
+    return keys[first], pos[first], pos[last] + 1
+
+
+def voxel_boxes(grid):
+    """Phân rã lưới thành các hộp cùng vật liệu: mảng ``(n, 7)`` gồm x0 x1 y0 y1 z0 z1 mã.
+
+    Các đoạn liên tiếp theo z của mỗi cột được gộp theo x rồi theo y, nên cấu
+    trúc phẳng (mặt nạ hình chữ nhật) chỉ còn vài hộp dù lưới rất mịn.
+    """
+    nx, ny, nz = grid.shape
+    start = np.ones(grid.shape, dtype=bool)
+    start[:, :, 1:] = grid[:, :, 1:] != grid[:, :, :-1]
+    ix, iy, z0 = np.nonzero(start)
+    same_column = (ix[1:] == ix[:-1]) & (iy[1:] == iy[:-1])
+    z1 = np.append(np.where(same_column, z0[1:], nz), nz)
+    material = grid[ix, iy, z0].astype(np.int64)
+    solid = material != AIR
+    ix, iy, z0, z1, material = ix[solid], iy[solid], z0[solid], z1[solid], material[solid]
+    if not len(ix):
+        return np.zeros((0, 7), dtype=np.int64)
+
+    keys, x0, x1 = _merge_runs(ix, np.stack([iy, z0, z1, material], axis=1))
+    keys, y0, y1 = _merge_runs(keys[:, 0], np.column_stack([x0, x1, keys[:, 1:]]))
+    return np.column_stack([keys[:, 0], keys[:, 1], y0, y1, keys[:, 2], keys[:, 3], keys[:, 4]])
+
+
+def grid_boxes(grid, spec):
+    """Các ``Box`` (tọa độ vật lý) của lưới, tô màu theo ``MATERIALS``."""
+    res = spec.resolution
+    boxes = []
+    for x0, x1, y0, y1, z0, z1, code in voxel_boxes(grid).tolist():
+        name, color = MATERIALS[code]
+        boxes.append(Box(x0 * res, x1 * res, y0 * res, y1 * res, z0 * res, z1 * res, color, name))
+    return boxes
+
+
+# Kiểu tia minh họa cho các bước có nguồn chiếu/bắn: (màu, độ dày, tên, nét)
+BEAM_STYLES = {
+    "expose": ("purple", 5, "UV Light", "solid"),
+    "etch": ("green", 3, "Plasma Etch", "dash"),
+    "implant": ("orange", 4, "Ion Beam", "solid"),
+}
+
+
+def _active_mask(recipe, index):
+    # Mặt nạ của bước, hoặc của lần chiếu sáng gần nhất trước đó
+    for step in reversed(recipe.steps[:index + 1]):
+        if "mask" in step:
+            return recipe.masks[step["mask"]]
+    return None
+
+
+def step_decorations(recipe, index, grid, n_beams=5):
+    """Mặt nạ lơ lửng và tia minh họa của bước ``index``: ``(boxes, beams)``."""
+    step = recipe.steps[index]
+    spec = recipe.grid
+    res = spec.resolution
+    boxes, beams = [], []
+    top = surface_index(grid)
+    mask = _active_mask(recipe, index)
+
+    mask_z = (top.max() + spec.voxels(1.0)) * res
+    if step["op"] == "expose":
+        layer = np.where(mask, 1, AIR).astype(np.uint8)[..., None]
+        for x0, x1, y0, y1, *_ in voxel_boxes(layer).tolist():
+            boxes.append(Box(x0 * res, x1 * res, y0 * res, y1 * res, mask_z, mask_z + MASK_THICKNESS,
+                             MASK_COLOR, "Mask"))
+
+    if step["op"] in BEAM_STYLES:
+        color, width, name, dash = BEAM_STYLES[step["op"]]
+        iy = grid.shape[1] // 2
+        open_x = np.flatnonzero(~mask[:, iy]) if mask is not None else np.arange(grid.shape[0])
+        if len(open_x):
+            picks = open_x[np.linspace(0, len(open_x) - 1, n_beams + 2).round().astype(int)[1:-1]]
+            z_start = mask_z + 1.0
+            for ix in np.unique(picks).tolist():
+                beams.append(Beam((ix + 0.5) * res, iy * res, z_start, top[ix, iy] * res, color, width, name, dash))
+    return boxes, beams
@@ -0,0 +1,124 @@
+"""Đo thời gian từng lần rerun của giao diện (bật/tắt được, mặc định tắt).
+
+Mỗi lần Streamlit chạy lại script, giao diện tạo một ``RerunProfiler`` và bọc
+các bước nóng bằng ``span(tên, loại)``; loại là ``import`` (nạp module giao
+diện lần đầu), ``compute`` (mô hình), ``figure`` (dựng hình Plotly) hoặc
+``render`` (gửi phần tử lên trình duyệt).
+Phần thời gian không nằm trong span nào (CSS, ``st.markdown``...) được gộp
+vào ``other``. Khi tắt, ``span`` gần như không tốn chi phí.
+"""
+import cProfile
+import io
+import json
+import logging
+import pstats
+import time
+from contextlib import contextmanager, nullcontext
+from typing import NamedTuple
+
+CATEGORIES = ("import", "compute", "figure", "render")
+
+logger = logging.getLogger(__name__)
+
+
+class Span(NamedTuple):
+    name: str
+    category: str
+    start: float     # giây, tính từ đầu lần rerun
+    duration: float  # giây
+
+
+class RerunProfiler:
+    """Thu thập các span của một lần rerun; tùy chọn chạy cProfile cho cả lần đó."""
+
+    def __init__(self, enabled=False, profile=False):
+        self.enabled = enabled
+        self.spans = []
+        self.total = None
+        self._profile = None
+        self._t0 = time.perf_counter()
+        if enabled and profile:
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError:
+                # Một profiler khác đang chạy trên thread này (phiên khác, debugger...)
+                self._profile = None
+
+    @property
+    def profiling(self):
+        return self._profile is not None
+
+    def span(self, name, category="compute"):
+        if not self.enabled:
+            return nullcontext()
+        if category not in CATEGORIES:
+            raise ValueError(f"category phải là một trong {CATEGORIES}")
+        return self._span(name, category)
+
+    @contextmanager
+    def _span(self, name, category):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.spans.append(Span(name, category, start - self._t0, end - start))
+
+    def finish(self):
+        """Kết thúc lần rerun: dừng cProfile (nếu có) và trả về tổng thời gian (giây)."""
+        if self.total is None:
+            self.total = time.perf_counter() - self._t0
+            if self._profile is not None:
+                self._profile.disable()
+        return self.total
+
+    def totals(self):
+        """Thời gian theo loại, kèm ``other`` = tổng - các span và ``total``."""
+        total = self.finish()
+        result = dict.fromkeys(CATEGORIES, 0.0)
+        for span in self.spans:
+            result[span.category] += span.duration
+        result["other"] = max(total - sum(result.values()), 0.0)
+        result["total"] = total
+        return result
+
+    def profile_text(self, limit=25, sort="cumulative"):
+        """Bảng pstats của lần rerun (chuỗi rỗng nếu không bật cProfile)."""
+        if self._profile is None:
+            return ""
+        self.finish()
+        out = io.StringIO()
+        pstats.Stats(self._profile, stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def record(self, **context):
+        """Bản ghi có cấu trúc của lần rerun (dùng cho log JSON)."""
+        totals = self.totals()
+        return {
+            **context,
+            "total_ms": round(totals["total"] * 1000, 3),
+            "by_category_ms": {k: round(totals[k] * 1000, 3) for k in (*CATEGORIES, "other")},
+            "spans": [{"name": s.name, "category": s.category,
+                       "start_ms": round(s.start * 1000, 3), "ms": round(s.duration * 1000, 3)}
+                      for s in self.spans],
+        }
+
+    def log(self, **context):
+        """Ghi bản ghi của lần rerun ra logger ``semilab.profiling`` dạng một dòng JSON."""
+        if not self.enabled:
+            return None
+        record = self.record(**context)
+        _ensure_handler()
+        logger.info(json.dumps(record, ensure_ascii=False))
+        return record
+
+
+def _ensure_handler():
+    # Logger gốc mặc định chỉ in WARNING: gắn một handler riêng khi bật đo.
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
@@ -0,0 +1,269 @@
+"""Bảng mã màu và giải mã giá trị điện trở.
+
+Ngoài các bảng 4 vạch dùng cho giao diện, module có bộ giải mã / mã hóa 4, 5,
+6 vạch theo IEC 60062, tra giá trị chuẩn gần nhất trong dãy E6 - E192 (IEC
+60063) và kiểm tra cả BOM / cuộn linh kiện trong một lượt vector hóa.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from semilab.wiki import fold_accents
+
+
+# Tên vạch -> (giá trị, màu nền, màu chữ)
+COLORS = {
+    "Đen (0)": (0, "#000000", "white"), "Nâu (1)": (1, "#8B4513", "white"), "Đỏ (2)": (2, "#FF0000", "white"),
+    "Cam (3)": (3, "#FFA500", "black"), "Vàng (4)": (4, "#FFFF00", "black"), "Lục (5)": (5, "#008000", "white"),
+    "Lam (6)": (6, "#0000FF", "white"), "Tím (7)": (7, "#800080", "white"), "Xám (8)": (8, "#808080", "black"),
+    "Trắng (9)": (9, "#FFFFFF", "black")
+}
+MULTIPLIER_COLORS = {
+    "Đen (x1)": (1, "#000000"), "Nâu (x10)": (10, "#8B4513"), "Đỏ (x100)": (100, "#FF0000"),
+    "Cam (x1k)": (1000, "#FFA500"), "Vàng (x10k)": (10000, "#FFFF00"), "Lục (x100k)": (100000, "#008000"),
+    "Lam (x1M)": (1000000, "#0000FF"), "Vàng kim (x0.1)": (0.1, "#FFD700"), "Bạc (x0.01)": (0.01, "#C0C0C0")
+}
+TOLERANCE_COLORS = {
+    "Nâu (±1%)": (1, "#8B4513"), "Đỏ (±2%)": (2, "#FF0000"), "Vàng kim (±5%)": (5, "#FFD700"),
+    "Bạc (±10%)": (10, "#C0C0C0")
+}
+
+
+def resistance_from_digits(d1, d2, multiplier):
+    """R = (10*d1 + d2) * multiplier, nhận số hoặc mảng NumPy."""
+    d1 = np.asarray(d1)
+    d2 = np.asarray(d2)
+    return (d1 * 10 + d2) * np.asarray(multiplier, dtype=float)
+
+
+def decode_4band(b1, b2, b3, b4):
+    """Giải mã điện trở 4 vạch từ tên màu, trả về ``(R [Ohm], sai số [%])``."""
+    resistance = float(resistance_from_digits(COLORS[b1][0], COLORS[b2][0], MULTIPLIER_COLORS[b3][0]))
+    return resistance, TOLERANCE_COLORS[b4][0]
+
+
+def format_resistance(resistance):
+    """Định dạng giá trị điện trở với tiền tố k / M / G (chưa kèm ký hiệu Ω); NaN
+    (ví dụ ``nearest_standard`` ngoài bảng dãy chuẩn) cho ``"—"``."""
+    if resistance != resistance:
+        return "—"
+    if resistance < 1000:
+        return f"{resistance:,.2f}"
+    if resistance < 1000000:
+        return f"{resistance/1000:,.2f} k"
+    if resistance < 1000000000:
+        return f"{resistance/1000000:,.2f} M"
+    return f"{resistance/1000000000:,.2f} G"
+
+
+# ==============================================================================
+# BỘ GIẢI MÃ 4 / 5 / 6 VẠCH VÀ DÃY GIÁ TRỊ CHUẨN E6 - E192
+# ==============================================================================
+# Chỉ số màu 0..11; chỉ số 12 dành cho ô trống / tên không hợp lệ (mọi bảng = NaN)
+BAND_NAMES = ("Đen", "Nâu", "Đỏ", "Cam", "Vàng", "Lục", "Lam", "Tím", "Xám", "Trắng", "Vàng kim", "Bạc")
+BAND_HEX = ("#000000", "#8B4513", "#FF0000", "#FFA500", "#FFFF00", "#008000",
+            "#0000FF", "#800080", "#808080", "#FFFFFF", "#FFD700", "#C0C0C0")
+_ALIASES = (
+    ("black", "bk"), ("brown", "bn"), ("red", "rd"), ("orange", "og"), ("yellow", "ye"),
+    ("green", "gn", "xanh la"), ("blue", "bu", "xanh duong"), ("violet", "purple", "vt"),
+    ("grey", "gray", "gy"), ("white", "wh"), ("gold", "gd"), ("silver", "sr"),
+)
+_INVALID = len(BAND_NAMES)
+
+_NAN = np.nan
+BAND_DIGIT = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, _NAN, _NAN, _NAN])
+BAND_EXPONENT = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, -1, -2, _NAN])
+BAND_TOLERANCE = np.array([_NAN, 1, 2, _NAN, _NAN, 0.5, 0.25, 0.1, 0.05, _NAN, 5, 10, _NAN])   # %
+BAND_TEMPCO = np.array([250, 100, 50, 15, 25, 20, 10, 5, 1, _NAN, _NAN, _NAN, _NAN])           # ppm/K
+BAND_COUNTS = (4, 5, 6)
+
+
+def _fold(name):
+    return " ".join(fold_accents(name.split("(")[0]).split())
+
+
+_COLOR_LOOKUP = {_fold(name): i for i, name in enumerate(BAND_NAMES)}
+_COLOR_LOOKUP.update({alias: i for i, aliases in enumerate(_ALIASES) for alias in aliases})
+
+
+def color_index(name):
+    """Chỉ số màu từ tên: tiếng Việt (có/không dấu, cả nhãn ``"Nâu (1)"``),
+    tiếng Anh hoặc mã IEC 60062 (``BN``, ``GD``...). Không nhận ra -> ``ValueError``."""
+    try:
+        return _COLOR_LOOKUP[_fold(str(name))]
+    except KeyError:
+        raise ValueError(f"không nhận ra màu {name!r}") from None
+
+
+class ResistorCode(NamedTuple):
+    resistance: float   # Ohm
+    tolerance: float    # %
+    tempco: float       # ppm/K, NaN nếu không có vạch thứ 6
+
+
+def _decode_indices(idx):
+    # idx: (n, k) chỉ số màu, cùng số vạch k; màu sai vị trí cho kết quả NaN
+    n_bands = idx.shape[1]
+    n_digits = 2 if n_bands == 4 else 3
+    mantissa = BAND_DIGIT[idx[:, :n_digits]] @ (10.0 ** np.arange(n_digits - 1, -1, -1))
+    exponent = BAND_EXPONENT[idx[:, n_digits]]
+    # Chia cho 10^-e khi e < 0 để 47 x 0.1 ra đúng 4.7
+    scale = 10.0 ** np.abs(np.nan_to_num(exponent))
+    resistance = np.where(exponent < 0, mantissa / scale, mantissa * scale)
+    resistance[np.isnan(exponent)] = _NAN
+    tolerance = BAND_TOLERANCE[idx[:, n_digits + 1]]
+    tempco = BAND_TEMPCO[idx[:, 5]] if n_bands == 6 else np.full(len(idx), _NAN)
+    return resistance, tolerance, tempco
+
+
+def decode_bands(bands):
+    """Giải mã 4 vạch (2 số), 5 vạch (3 số) hoặc 6 vạch (3 số + hệ số nhiệt)."""
+    if len(bands) not in BAND_COUNTS:
+        raise ValueError(f"cần {BAND_COUNTS} vạch, nhận {len(bands)}")
+    resistance, tolerance, tempco = (float(a[0]) for a in _decode_indices(
+        np.array([[color_index(b) for b in bands]])))
+    if np.isnan(resistance) or np.isnan(tolerance) or (len(bands) == 6 and np.isnan(tempco)):
+        raise ValueError(f"tổ hợp vạch không hợp lệ: {list(bands)}")
+    return ResistorCode(resistance, tolerance, tempco)
+
+
+def encode_bands(resistance, n_bands=4, tolerance=None, tempco=None):
+    """Vạch màu cho giá trị ``resistance`` (làm tròn về 2 hoặc 3 chữ số có nghĩa).
+
+    Mặc định sai số 5% (4 vạch) / 1% (5, 6 vạch) và hệ số nhiệt 100 ppm/K.
+    """
+    if n_bands not in BAND_COUNTS:
+        raise ValueError(f"số vạch phải là một trong {BAND_COUNTS}")
+    if not resistance > 0:
+        raise ValueError("giá trị điện trở phải dương")
+    n_digits = 2 if n_bands == 4 else 3
+    exponent = int(np.floor(np.log10(resistance))) - (n_digits - 1)
+    mantissa = round(resistance / 10.0 ** exponent)
+    if mantissa >= 10 ** n_digits:
+        mantissa //= 10
+        exponent += 1
+    if not -2 <= exponent <= 9:
+        raise ValueError(f"{resistance:g} Ω nằm ngoài dải mã hóa được bằng {n_bands} vạch")
+
+    tolerance = (5 if n_bands == 4 else 1) if tolerance is None else tolerance
+    tol_idx = np.flatnonzero(BAND_TOLERANCE == tolerance)
+    if not len(tol_idx):
+        raise ValueError(f"không có vạch màu cho sai số {tolerance}%")
+    digits = [int(d) for d in f"{mantissa:0{n_digits}d}"]
+    bands = [BAND_NAMES[d] for d in digits]
+    bands += [BAND_NAMES[exponent if exponent >= 0 else 9 - exponent], BAND_NAMES[tol_idx[0]]]
+    if n_bands == 6:
+        tc_idx = np.flatnonzero(BAND_TEMPCO == (100 if tempco is None else tempco))
+        if not len(tc_idx):
+            raise ValueError(f"không có vạch màu cho hệ số nhiệt {tempco} ppm/K")
+        bands.append(BAND_NAMES[tc_idx[0]])
+    return tuple(bands)
+
+
+# Dãy chuẩn IEC 60063 dưới dạng phần định trị nguyên (2 chữ số cho E6-E24, 3 cho E48-E192)
+_E24 = np.array([10, 11, 12, 13, 15, 16, 18, 20, 22, 24, 27, 30, 33, 36, 39, 43, 47, 51, 56, 62, 68, 75, 82, 91])
+_E192 = np.round(100 * 10 ** (np.arange(192) / 192)).astype(int)
+_E192[185] = 920  # ngoại lệ của tiêu chuẩn (công thức cho 919)
+E_SERIES = {
+    "E6": _E24[::4], "E12": _E24[::2], "E24": _E24,
+    "E48": _E192[::4], "E96": _E192[::2], "E192": _E192,
+}
+SERIES_TOLERANCE = {"E6": 20, "E12": 10, "E24": 5, "E48": 2, "E96": 1, "E192": 0.5}  # %
+SERIES_DECADES = range(-2, 10)  # 0.01 Ω .. ~10 GΩ
+
+
+def _build_series_index(mantissas):
+    # Mọi giá trị của dãy qua các decade, đã sắp tăng dần, kèm log10 để tìm kiếm nhị phân và
+    # khoảng log10 hợp lệ (nửa bước dãy ra ngoài hai đầu bảng)
+    n_digits = len(str(mantissas[-1]))
+    values = []
+    for decade in SERIES_DECADES:
+        exponent = decade - (n_digits - 1)
+        values.append(mantissas / 10.0 ** -exponent if exponent < 0 else mantissas * 10.0 ** exponent)
+    values = np.concatenate(values)
+    logs = np.log10(values)
+    half_step = 0.5 / len(mantissas)
+    return values, logs, (logs[0] - half_step, logs[-1] + half_step)
+
+
+_SERIES_INDEX = {name: _build_series_index(m) for name, m in E_SERIES.items()}
+
+
+def nearest_standard(resistance, series="E24"):
+    """Giá trị chuẩn gần nhất (theo tỉ lệ, tức khoảng cách log) trong dãy ``series``.
+
+    Nhận số hoặc mảng; giá trị không dương hoặc nằm ngoài bảng (xa hơn nửa bước
+    dãy so với 0.01 Ω .. ~10 GΩ) cho NaN, không bị kẹp về giá trị đầu/cuối. Tìm
+    kiếm nhị phân trên bảng đã sắp sẵn nên mảng hàng triệu giá trị vẫn chỉ tốn
+    O(n log m).
+    """
+    try:
+        values, logs, (log_lo, log_hi) = _SERIES_INDEX[series]
+    except KeyError:
+        raise ValueError(f"dãy phải là một trong {tuple(E_SERIES)}") from None
+    r = np.asarray(resistance, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_r = np.log10(r)
+    pos = np.clip(np.searchsorted(logs, log_r), 1, len(logs) - 1)
+    pick = np.where(log_r - logs[pos - 1] <= logs[pos] - log_r, pos - 1, pos)
+    with np.errstate(invalid="ignore"):
+        out = np.where((log_r >= log_lo) & (log_r <= log_hi), values[pick], _NAN)
+    return float(out) if out.ndim == 0 else out
+
+
+def _band_code(name):
+    # -1 = ô trống (None, NaN từ bảng tính, chuỗi rỗng); tên lạ = _INVALID
+    if name is None or name != name or not str(name).strip():
+        return -1
+    return _COLOR_LOOKUP.get(_fold(str(name)), _INVALID)
+
+
+class BomCheck(NamedTuple):
+    n_bands: np.ndarray      # số vạch của từng dòng (0 nếu không có vạch nào)
+    resistance: np.ndarray   # Ohm, NaN nếu mã vạch sai
+    tolerance: np.ndarray    # %
+    tempco: np.ndarray       # ppm/K
+    valid: np.ndarray        # bool, mã vạch giải được
+    nearest: np.ndarray      # giá trị chuẩn gần nhất trong dãy
+    standard: np.ndarray     # bool, giá trị đúng bằng một giá trị chuẩn
+    in_tolerance: np.ndarray  # bool, giá trị đo nằm trong sai số (None nếu không có số đo)
+
+
+def check_bom(bands, measured=None, series="E24"):
+    """Kiểm tra cả cuộn/BOM trong một lượt vector hóa.
+
+    ``bands``: bảng ``(n, k)`` tên màu (k <= 6, dồn trái; ô trống/None = không
+    có vạch). Mỗi dòng có thể có 4, 5 hoặc 6 vạch. ``measured``: giá trị đo
+    (Ohm) để so với giá trị danh định ± sai số.
+    """
+    names = np.asarray(bands, dtype=object)
+    if names.ndim != 2 or names.shape[1] > max(BAND_COUNTS):
+        raise ValueError("bands phải là bảng (n, k) với k <= 6")
+    # Chỉ chuẩn hóa các tên khác nhau (thường vài chục), rồi ánh xạ cả bảng qua dict
+    flat = names.ravel().tolist()
+    codes = {name: _band_code(name) for name in set(flat)}
+    idx = np.fromiter(map(codes.__getitem__, flat), dtype=np.intp, count=len(flat)).reshape(names.shape)
+
+    n = len(idx)
+    present = idx >= 0
+    n_bands = present.sum(axis=1)
+    # Vạch phải dồn trái: không có ô trống nằm trước một vạch
+    packed = ~np.any(~present[:, :-1] & present[:, 1:], axis=1)
+    resistance = np.full(n, _NAN)
+    tolerance = np.full(n, _NAN)
+    tempco = np.full(n, _NAN)
+    for k in BAND_COUNTS:
+        rows = np.flatnonzero((n_bands == k) & packed)
+        if len(rows):
+            resistance[rows], tolerance[rows], tempco[rows] = _decode_indices(idx[rows, :k])
+
+    valid = ~(np.isnan(resistance) | np.isnan(tolerance)) & ((n_bands != 6) | ~np.isnan(tempco))
+    resistance[~valid] = tolerance[~valid] = tempco[~valid] = _NAN
+    nearest = nearest_standard(resistance, series)
+    standard = valid & np.isclose(resistance, nearest, rtol=1e-9)
+    in_tolerance = None
+    if measured is not None:
+        measured = np.asarray(measured, dtype=float)
+        with np.errstate(invalid="ignore"):
+            in_tolerance = np.abs(measured - resistance) <= resistance * tolerance / 100
+    return BomCheck(n_bands, resistance, tolerance, tempco, valid, nearest, standard, in_tolerance)
@@ -0,0 +1,82 @@
+"""Lấy mẫu thích nghi cho đường cong 1 chiều (thay cho lưới ``linspace`` cố định).
+
+Bắt đầu từ một lưới thô (cộng các điểm gãy đã biết, ví dụ Vds = Vgs - Vth),
+mỗi vòng tính thêm trung điểm của các đoạn còn "chưa đạt": nếu đường thẳng nối
+hai đầu đoạn lệch khỏi giá trị thật tại trung điểm quá ``tol`` (tính theo tỉ lệ
+với dải giá trị trục y) thì chia đôi đoạn đó. Sai số nội suy tuyến tính tỉ lệ
+với h^2 f'', nên điểm dồn về chỗ cong (khuỷu diode, chuyển vùng tuyến tính -
+bão hòa) còn vùng phẳng chỉ giữ vài điểm.
+"""
+import numpy as np
+
+
+def adaptive_sample(func, x_min, x_max, tol=1e-3, breakpoints=(), initial=17,
+                    max_points=2000, y_range=None):
+    """Lấy mẫu ``func`` (hàm vector hóa x -> y) trên ``[x_min, x_max]``.
+
+    - ``tol``: sai số nội suy tối đa, tính theo tỉ lệ với dải y (``1e-3`` ~ nhỏ
+      hơn một pixel trên đồ thị cao 500 px).
+    - ``breakpoints``: các x luôn được lấy mẫu (ranh giới vùng, điểm gãy).
+    - ``y_range``: ``(lo, hi)`` của khung nhìn; sai số được đo trên giá trị đã
+      kẹp vào khung, nên phần nằm ngoài đồ thị không bị lấy mẫu dày.
+    - ``max_points``: giới hạn cứng số điểm; khi chạm giới hạn chỉ chia các đoạn
+      sai số lớn nhất.
+
+    Trả về ``(x, y)`` đã sắp tăng dần.
+    """
+    if not x_max > x_min:
+        raise ValueError("cần x_max > x_min")
+    extra = [b for b in breakpoints if x_min < b < x_max]
+    x = np.union1d(np.linspace(x_min, x_max, max(initial, 2)), extra)
+    y = np.asarray(func(x), dtype=float)
+    min_width = (x_max - x_min) * 1e-9
+
+    def view(values):
+        return np.clip(values, *y_range) if y_range is not None else values
+
+    # Mỗi đoạn [x[k], x[k+1]] có một cờ "cần kiểm tra"; đoạn đã đạt không bị tính lại
+    active = np.ones(len(x) - 1, dtype=bool)
+    while active.any() and len(x) < max_points:
+        left = np.flatnonzero(active)
+        xm = 0.5 * (x[left] + x[left + 1])
+        ym = np.asarray(func(xm), dtype=float)
+
+        yv = view(y)
+        scale = (y_range[1] - y_range[0]) if y_range is not None else np.ptp(yv)
+        if scale <= 0:
+            break
+        err = np.abs(view(ym) - 0.5 * (yv[left] + yv[left + 1])) / scale
+        split = (err > tol) & (x[left + 1] - x[left] > min_width)
+
+        budget = max_points - len(x)
+        if split.sum() > budget:
+            # Hết ngân sách: chỉ chia các đoạn sai số lớn nhất rồi dừng
+            keep = np.argsort(err * split)[::-1][:budget]
+            split = np.zeros_like(split)
+            split[keep] = True
+            budget = 0
+        if not split.any():
+            break
+
+        # Chèn trung điểm; hai nửa mới của đoạn vừa chia được kiểm tra ở vòng sau
+        pos = left[split] + 1
+        x = np.insert(x, pos, xm[split])
+        y = np.insert(y, pos, ym[split])
+        was_split = np.zeros(len(active), dtype=bool)
+        was_split[left[split]] = True
+        active = np.repeat(was_split, np.where(was_split, 2, 1))
+        if budget == 0:
+            break
+    return x, y
+
+
+def interpolation_error(x, y, func, x_check, y_range=None):
+    """Sai số lớn nhất (theo tỉ lệ dải y) khi nội suy tuyến tính ``(x, y)`` so với ``func``."""
+    exact = np.asarray(func(x_check), dtype=float)
+    approx = np.interp(x_check, x, y)
+    if y_range is not None:
+        exact, approx = np.clip(exact, *y_range), np.clip(approx, *y_range)
+        scale = y_range[1] - y_range[0]
+    else:
+        scale = np.ptp(exact)
+    return float(np.max(np.abs(exact - approx)) / scale) if scale > 0 else 0.0
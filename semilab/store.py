@@ -0,0 +1,254 @@
+"""Kho kết quả mô phỏng lưu trên đĩa (dạng cột, NumPy memory-map).
+
+Mỗi lần chạy (run) là một bảng: các cột 1-D cùng độ dài, giống kết quả của
+``semilab.jobs`` (``v``/``i`` của diode, ``v_gs``/``v_ds``/``i_d`` của MOSFET,
+bảng chân trị). Run được định danh bằng băm SHA-256 của ``(kind, tham số)``
+(tham số của công việc ``semilab.jobs`` được điền giá trị mặc định trước khi
+băm) nên cùng bộ tham số chỉ lưu một lần và lần sau đọc lại thay vì tính::
+
+    <thư mục>/<key>/meta.json    kind, tham số, tên cột, số dòng, dung lượng
+    <thư mục>/<key>/<i>.npy      cột thứ i
+
+Cột được đọc bằng ``np.load(mmap_mode="r")`` (tức thì, không chép vào RAM).
+Khi tổng dung lượng vượt ``max_bytes``, các run lâu nhất chưa được dùng bị xóa
+(thời điểm dùng gần nhất là mtime của ``meta.json``). Ghi vào thư mục tạm rồi
+đổi tên, nên tiến trình khác không bao giờ thấy một run ghi dở.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from semilab.jobs import JOB_KINDS, job_params
+from semilab.cache import memoize
+
+DEFAULT_STORE_DIR = Path.home() / ".cache" / "semilab" / "runs"
+DEFAULT_MAX_BYTES = 256 * 2**20
+META_FILE = "meta.json"
+
+
+def _json_default(value):
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"tham số kiểu {type(value).__name__} không chuyển được sang JSON")
+
+
+def _normalize(value):
+    # Số nguyên (Python/NumPy, trừ bool) -> float để 25 và 25.0 cho cùng một khóa
+    if isinstance(value, (np.ndarray, np.generic)):
+        value = value.tolist()
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _job_params(kind, params):
+    # Công việc ``semilab.jobs``: điền giá trị mặc định theo chữ ký hàm (như ``memoize``)
+    return job_params(kind, params) if kind in JOB_KINDS else params
+
+
+def run_key(kind, params):
+    """Khóa của run: băm của ``kind`` và tham số đã chuẩn hóa (điền giá trị mặc định
+    của công việc, số nguyên thành float, JSON, khóa sắp xếp)."""
+    text = json.dumps([kind, _normalize(_job_params(kind, params))], sort_keys=True, separators=(",", ":"),
+                      default=_json_default)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:20]
+
+
+class StoredRun(NamedTuple):
+    key: str
+    kind: str
+    params: dict
+    columns: tuple   # tên cột, theo thứ tự lưu
+    rows: int
+    nbytes: int
+    created: float   # time.time()
+    path: Path
+
+    def load(self):
+        """Các cột dạng memory-map chỉ đọc: ``{tên: mảng}``."""
+        return {name: np.load(self.path / f"{i}.npy", mmap_mode="r") for i, name in enumerate(self.columns)}
+
+    def to_csv(self):
+        """Nội dung CSV (bytes, UTF-8) để tải về."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.columns)
+        writer.writerows(zip(*(col.tolist() for col in self.load().values())))
+        return buffer.getvalue().encode("utf-8")
+
+    def to_parquet(self):
+        """Nội dung Parquet (bytes) để tải về (cần ``pyarrow``)."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("Ghi Parquet cần cài pyarrow: pip install pyarrow") from exc
+        buffer = io.BytesIO()
+        pq.write_table(pa.table({name: np.asarray(col) for name, col in self.load().items()}), buffer)
+        return buffer.getvalue()
+
+
+class RunStore:
+    """Kho run trên đĩa, giới hạn dung lượng, an toàn khi dùng từ nhiều thread.
+
+    Chỉ mục (``meta.json`` của mọi run) được đọc một lần khi tạo; các run do
+    tiến trình khác ghi thêm sẽ thấy được sau ``refresh()``.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes phải > 0")
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = {}
+        self.refresh()
+
+    def refresh(self):
+        """Đọc lại chỉ mục từ đĩa (bỏ qua thư mục tạm và run hỏng)."""
+        index = {}
+        if self.root.is_dir():
+            for meta_path in self.root.glob(f"*/{META_FILE}"):
+                try:
+                    run = self._read_meta(meta_path.parent)
+                except (OSError, ValueError, KeyError):
+                    continue
+                index[run.key] = run
+        with self._lock:
+            self._index = index
+
+    @staticmethod
+    def _read_meta(path):
+        meta = json.loads((path / META_FILE).read_text(encoding="utf-8"))
+        return StoredRun(meta["key"], meta["kind"], meta["params"], tuple(meta["columns"]), meta["rows"],
+                         meta["nbytes"], meta["created"], path)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def total_bytes(self):
+        with self._lock:
+            return sum(run.nbytes for run in self._index.values())
+
+    def runs(self):
+        """Mọi run, mới dùng gần nhất trước."""
+        with self._lock:
+            runs = list(self._index.values())
+        return sorted(runs, key=self._accessed, reverse=True)
+
+    @staticmethod
+    def _accessed(run):
+        try:
+            return os.path.getmtime(run.path / META_FILE)
+        except OSError:
+            return 0.0
+
+    def get(self, kind, params):
+        """Run đã lưu của ``(kind, params)`` hoặc ``None``; đánh dấu là vừa được dùng."""
+        return self.get_key(run_key(kind, params))
+
+    def get_key(self, key):
+        with self._lock:
+            run = self._index.get(key)
+        if run is None:
+            return None
+        try:
+            os.utime(run.path / META_FILE)
+        except OSError:  # bị xóa bởi tiến trình khác
+            with self._lock:
+                self._index.pop(key, None)
+            return None
+        return run
+
+    def put(self, kind, params, columns):
+        """Lưu bảng ``columns`` (tên -> mảng 1-D cùng độ dài); trả về ``StoredRun``.
+
+        Nếu run đã có thì không ghi lại. Sau khi ghi, các run cũ bị xóa cho tới
+        khi tổng dung lượng không vượt ``max_bytes`` (run vừa ghi luôn được giữ).
+        """
+        key = run_key(kind, params)
+        existing = self.get_key(key)
+        if existing is not None:
+            return existing
+        arrays = {name: np.ascontiguousarray(col) for name, col in columns.items()}
+        lengths = {len(col) if col.ndim == 1 else -1 for col in arrays.values()}
+        if len(lengths) > 1 or -1 in lengths:
+            raise ValueError("mọi cột phải là mảng 1-D cùng độ dài")
+        if any(col.dtype.hasobject for col in arrays.values()):
+            raise ValueError("không lưu được cột kiểu object (dùng số hoặc chuỗi độ dài cố định)")
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".tmp-{key}-{uuid.uuid4().hex[:8]}"
+        tmp.mkdir()
+        try:
+            for i, col in enumerate(arrays.values()):
+                np.save(tmp / f"{i}.npy", col)
+            nbytes = sum(f.stat().st_size for f in tmp.iterdir())
+            meta = {"key": key, "kind": kind, "params": _job_params(kind, params), "columns": list(arrays),
+                    "rows": lengths.pop() if lengths else 0, "nbytes": nbytes, "created": time.time()}
+            (tmp / META_FILE).write_text(json.dumps(meta, default=_json_default), encoding="utf-8")
+            target = self.root / key
+            try:
+                os.replace(tmp, target)
+            except OSError:  # tiến trình khác vừa ghi cùng run
+                shutil.rmtree(tmp, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        run = self._read_meta(target)
+        with self._lock:
+            self._index[key] = run
+        self.evict(keep=key)
+        return run
+
+    def run(self, kind, params):
+        """Run của công việc ``semilab.jobs`` loại ``kind``: đọc lại nếu đã lưu, nếu chưa thì tính và lưu."""
+        params = job_params(kind, params)
+        run = self.get(kind, params)
+        if run is None:
+            run = self.put(kind, params, JOB_KINDS[kind](**params))
+        return run
+
+    def delete(self, key):
+        with self._lock:
+            run = self._index.pop(key, None)
+        if run is not None:
+            shutil.rmtree(run.path, ignore_errors=True)
+        return run is not None
+
+    def evict(self, keep=None):
+        """Xóa các run lâu nhất chưa dùng cho tới khi tổng dung lượng <= ``max_bytes``; trả về số run đã xóa."""
+        evicted = 0
+        total = self.total_bytes()
+        for run in reversed(self.runs()):
+            if total <= self.max_bytes:
+                break
+            if run.key == keep:
+                continue
+            if self.delete(run.key):
+                total -= run.nbytes
+                evicted += 1
+        return evicted
+
+
+@memoize("run_store", maxsize=4)
+def get_store(root=DEFAULT_STORE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """Kho dùng chung của tiến trình cho ``(root, max_bytes)``."""
+    return RunStore(root, max_bytes)
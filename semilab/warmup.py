@@ -0,0 +1,104 @@
+"""Khởi động nóng (warm-up) cache dùng chung ở một thread nền.
+
+Sau khi deploy, người dùng đầu tiên mở Module 3 / Module 5 phải chờ tính mô
+hình và dựng hình Plotly từ đầu. ``Warmup`` chạy trước các view mặc định đó
+trên một thread daemon: kết quả đi vào các cache ``memoize`` (dùng chung mọi
+phiên), nên lần xem đầu tiên đã là cache hit. Thread không chặn lần render
+trang đầu; tiến độ (số mục xong / tổng, thời gian, lỗi) đọc được qua
+``report()`` để hiện trên giao diện.
+"""
+import logging
+import threading
+import time
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupReport(NamedTuple):
+    done: int         # số mục đã làm nóng thành công
+    total: int
+    failed: tuple     # (tên mục, thông báo lỗi)
+    seconds: float    # thời gian đã chạy (hoặc tổng thời gian nếu đã xong)
+    running: bool
+
+    @property
+    def coverage(self):
+        return self.done / self.total if self.total else 0.0
+
+
+class Warmup:
+    """Chạy tuần tự các mục ``(tên, hàm)`` trên một thread daemon, ghi lại tiến độ.
+
+    ``sources`` là các hàm không đối số trả về danh sách mục; chúng được gọi
+    trong thread (thường kèm import module giao diện tương ứng), nên cả chi
+    phí import cũng được làm nóng. Lỗi của một mục được ghi lại, không dừng
+    các mục còn lại.
+    """
+
+    def __init__(self, sources, name="semilab-warmup"):
+        self.sources = list(sources)
+        self.name = name
+        self.tasks = []
+        self.done = 0
+        self.failed = []
+        self._start = None
+        self._end = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Khởi chạy thread nền (chỉ lần gọi đầu tiên có tác dụng)."""
+        with self._lock:
+            if self._thread is None:
+                self._start = time.perf_counter()
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        return self
+
+    def run(self):
+        """Chạy đồng bộ trên thread hiện tại; trả về ``WarmupReport`` khi xong."""
+        self._start = time.perf_counter()
+        self._run()
+        return self.report()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.report()
+
+    def _run(self):
+        for source in self.sources:
+            try:
+                tasks = list(source())
+            except Exception as exc:
+                self._record_failure(getattr(source, "__qualname__", repr(source)), exc)
+                continue
+            with self._lock:
+                self.tasks.extend(tasks)
+        for name, func in list(self.tasks):
+            try:
+                func()
+            except Exception as exc:
+                self._record_failure(name, exc)
+            else:
+                with self._lock:
+                    self.done += 1
+        self._end = time.perf_counter()
+        report = self.report()
+        logger.info("warm-up: %d/%d mục trong %.2f s (%d lỗi)", report.done, report.total,
+                    report.seconds, len(report.failed))
+
+    def _record_failure(self, name, exc):
+        logger.warning("warm-up %s lỗi: %s", name, exc)
+        with self._lock:
+            self.failed.append((name, f"{type(exc).__name__}: {exc}"))
+
+    def report(self):
+        with self._lock:
+            if self._start is None:
+                seconds = 0.0
+            else:
+                seconds = (self._end or time.perf_counter()) - self._start
+            running = self._end is None and self._start is not None
+            return WarmupReport(self.done, len(self.tasks), tuple(self.failed), seconds, running)
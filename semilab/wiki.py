@@ -0,0 +1,251 @@
+"""Dữ liệu Wiki bán dẫn và chỉ mục tìm kiếm toàn văn (inverted index).
+
+Nội dung wiki nằm trong các file JSON (mặc định ``semilab/data/wiki.json``).
+Chỉ mục được dựng một lần cho mỗi bộ dữ liệu và dùng chung giữa các lần rerun:
+
+- Từ khóa được bỏ dấu tiếng Việt (``"Vùng cấm"`` -> ``"vung cam"``) và viết thường.
+- Mỗi từ trong truy vấn phải xuất hiện trong bài (AND); từ cuối được so khớp
+  theo tiền tố để gợi ý ngay khi đang gõ.
+- Kết quả được xếp hạng theo TF-IDF, từ xuất hiện trong tiêu đề được cộng điểm.
+- Từ không có trong từ điển được sửa lỗi gõ bằng chỉ mục trigram + khoảng cách
+  chỉnh sửa (Damerau-Levenshtein), ví dụ ``"fremi"`` -> ``"fermi"``.
+"""
+import bisect
+import json
+import math
+import os
+import re
+import unicodedata
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from semilab.cache import memoize
+
+DEFAULT_WIKI_PATH = Path(__file__).resolve().parent / "data" / "wiki.json"
+TITLE_WEIGHT = 3  # Một lần xuất hiện trong tiêu đề tương đương 3 lần trong nội dung
+FUZZY_PENALTY = 0.5  # Hệ số điểm cho mỗi lỗi chỉnh sửa khi khớp gần đúng
+MAX_FUZZY_CANDIDATES = 64  # Số từ nhiều trigram chung nhất được tính khoảng cách
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class WikiEntry(NamedTuple):
+    title: str
+    content: str
+    tag: str
+
+
+def fold_accents(text):
+    """Bỏ dấu tiếng Việt và viết thường: ``"Đỗ Vùng Cấm"`` -> ``"do vung cam"``."""
+    text = text.replace("đ", "d").replace("Đ", "D")
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(fold_accents(text))
+
+
+def trigrams(token):
+    """Tập trigram của từ, có đệm ``$`` ở hai đầu (``"fermi"`` -> ``$$f, $fe, fer, ...``)."""
+    padded = f"$${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, max_distance):
+    """Khoảng cách Damerau-Levenshtein (hoán vị 2 ký tự kề nhau tính 1 lỗi) giữa
+    ``a`` và ``b``; trả về ``max_distance + 1`` nếu vượt ngưỡng.
+
+    Chỉ tính dải ``|i - j| <= max_distance`` của bảng quy hoạch động, vì các ô
+    ngoài dải chắc chắn vượt ngưỡng.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    limit = max_distance + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        ca = a[i - 1]
+        lo = max(1, i - max_distance)
+        hi = min(len(b), i + max_distance)
+        current = [limit] * (len(b) + 1)
+        if lo == 1:
+            current[0] = i
+        row_min = current[0] if lo == 1 else limit
+        for j in range(lo, hi + 1):
+            cb = b[j - 1]
+            cost = previous[j - 1] + (ca != cb)
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb and before[j - 2] + 1 < cost:
+                cost = before[j - 2] + 1
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return limit
+        before, previous = previous, current
+    return min(previous[-1], limit)
+
+
+def max_typos(token):
+    # Từ ngắn chỉ cho phép 1 lỗi để tránh khớp lung tung
+    if len(token) <= 1:
+        return 0
+    return 1 if len(token) <= 5 else 2
+
+
+def load_wiki(path=DEFAULT_WIKI_PATH):
+    """Đọc các bài wiki từ một file JSON hoặc mọi file ``*.json`` trong thư mục.
+
+    Mỗi file là một danh sách ``{"title", "content", "tag"}``.
+    """
+    path = Path(path)
+    files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+    entries = []
+    for file in files:
+        with open(file, encoding="utf-8") as f:
+            for item in json.load(f):
+                entries.append(WikiEntry(item["title"], item["content"], item.get("tag", "")))
+    return entries
+
+
+class WikiIndex:
+    """Chỉ mục ngược: từ (đã bỏ dấu) -> {số thứ tự bài: trọng số tần suất}."""
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.postings = {}
+        for doc_id, entry in enumerate(self.entries):
+            counts = {}
+            for token in tokenize(entry.title):
+                counts[token] = counts.get(token, 0) + TITLE_WEIGHT
+            for token in tokenize(entry.content):
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                self.postings.setdefault(token, {})[doc_id] = count
+        self.vocabulary = sorted(self.postings)
+        # Trigram -> mảng số thứ tự từ trong ``vocabulary`` (đếm trigram chung bằng bincount)
+        grams_of = {}
+        for term_id, term in enumerate(self.vocabulary):
+            for gram in trigrams(term):
+                grams_of.setdefault(gram, []).append(term_id)
+        self.trigram_index = {gram: np.array(ids, dtype=np.int32) for gram, ids in grams_of.items()}
+        self._term_lengths = np.array([len(term) for term in self.vocabulary], dtype=np.int32)
+        self.tags = sorted({entry.tag for entry in self.entries if entry.tag})
+        self._by_tag = {}
+        for doc_id, entry in enumerate(self.entries):
+            self._by_tag.setdefault(entry.tag, set()).add(doc_id)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def expand_prefix(self, prefix):
+        """Các từ trong từ điển bắt đầu bằng ``prefix`` (tìm nhị phân trên danh sách đã sắp)."""
+        lo = bisect.bisect_left(self.vocabulary, prefix)
+        hi = bisect.bisect_left(self.vocabulary, prefix + "\uffff")
+        return self.vocabulary[lo:hi]
+
+    def fuzzy_terms(self, token, max_distance=None):
+        """Các từ trong từ điển cách ``token`` không quá ``max_distance`` lỗi chỉnh sửa.
+
+        Trả về danh sách ``(từ, khoảng cách)``, gần nhất trước. Chỉ những từ có đủ
+        trigram chung mới được tính khoảng cách, nên không phải duyệt cả từ điển.
+        """
+        if max_distance is None:
+            max_distance = max_typos(token)
+        if max_distance <= 0:
+            return []
+        grams = trigrams(token)
+        lists = [self.trigram_index[gram] for gram in grams if gram in self.trigram_index]
+        if not lists:
+            return []
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.vocabulary))
+        # Mỗi lỗi chỉnh sửa làm mất tối đa 3 trigram (hoán vị: 4); độ dài chênh tối đa max_distance
+        min_shared = max(1, len(grams) - 4 * max_distance)
+        ok = (shared >= min_shared) & (np.abs(self._term_lengths - len(token)) <= max_distance)
+        term_ids = np.flatnonzero(ok)
+        if len(term_ids) > MAX_FUZZY_CANDIDATES:
+            top = np.argpartition(-shared[term_ids], MAX_FUZZY_CANDIDATES)[:MAX_FUZZY_CANDIDATES]
+            term_ids = term_ids[top]
+        matches = []
+        for term_id in term_ids.tolist():
+            term = self.vocabulary[term_id]
+            if term != token:
+                distance = edit_distance(token, term, max_distance)
+                if distance <= max_distance:
+                    matches.append((term, distance))
+        matches.sort(key=lambda item: (item[1], -len(self.postings[item[0]]), item[0]))
+        return matches
+
+    def correct_query(self, query):
+        """Truy vấn sau khi sửa lỗi gõ (đã bỏ dấu), hoặc ``None`` nếu không cần sửa."""
+        tokens = tokenize(query)
+        corrected = []
+        for pos, token in enumerate(tokens):
+            known = self.expand_prefix(token) if pos == len(tokens) - 1 else token in self.postings
+            if not known:
+                fuzzy = self.fuzzy_terms(token)
+                if fuzzy:
+                    token = fuzzy[0][0]
+            corrected.append(token)
+        return " ".join(corrected) if corrected != tokens else None
+
+    def _idf(self, token):
+        return math.log(1 + len(self.entries) / len(self.postings[token]))
+
+    def search(self, query, tag=None, limit=None, fuzzy=True):
+        """Trả về danh sách ``(điểm, WikiEntry)`` đã xếp hạng.
+
+        Truy vấn rỗng trả về mọi bài (theo thứ tự gốc), có lọc theo ``tag``.
+        Với ``fuzzy=True``, từ không khớp chính xác/tiền tố được thay bằng các từ
+        gần đúng (điểm nhân ``FUZZY_PENALTY`` cho mỗi lỗi).
+        """
+        tokens = tokenize(query)
+        allowed = self._by_tag.get(tag, set()) if tag else None
+        if not tokens:
+            doc_ids = sorted(allowed) if allowed is not None else range(len(self.entries))
+            hits = [(0.0, self.entries[doc_id]) for doc_id in doc_ids]
+            return hits[:limit] if limit else hits
+
+        scores = None
+        for pos, token in enumerate(tokens):
+            # Từ cuối cùng: so khớp tiền tố (người dùng có thể đang gõ dở)
+            candidates = self.expand_prefix(token) if pos == len(tokens) - 1 else (
+                [token] if token in self.postings else [])
+            candidates = [(cand, 0) for cand in candidates]
+            if not candidates and fuzzy:
+                candidates = self.fuzzy_terms(token)
+            token_scores = {}
+            for cand, distance in candidates:
+                weight = self._idf(cand) * FUZZY_PENALTY ** distance
+                for doc_id, count in self.postings[cand].items():
+                    if allowed is None or doc_id in allowed:
+                        token_scores[doc_id] = max(token_scores.get(doc_id, 0.0), (1 + math.log(count)) * weight)
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {doc_id: s + token_scores[doc_id] for doc_id, s in scores.items() if doc_id in token_scores}
+            if not scores:
+                return []
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit:
+            ranked = ranked[:limit]
+        return [(score, self.entries[doc_id]) for doc_id, score in ranked]
+
+
+@memoize("wiki_index", maxsize=4)
+def _build_index(path, mtime):
+    return WikiIndex(load_wiki(path))
+
+
+def get_wiki_index(path=DEFAULT_WIKI_PATH):
+    """Chỉ mục của bộ dữ liệu ``path``, dựng lại chỉ khi file thay đổi."""
+    path = Path(path)
+    files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+    mtime = max((os.path.getmtime(f) for f in files), default=0.0)
+    return _build_index(str(path), mtime)
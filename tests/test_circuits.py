@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from semilab.circuits import solve_diode_resistor
+
+pytest.importorskip("scipy")  # method="lambertw" làm lời giải tham chiếu
+
+V_FORWARD = np.linspace(0.0, 50.0, 501)
+V_REVERSE = np.linspace(-1000.0, 0.0, 1001)  # gồm cả Vs << -10 V
+RESISTANCES = [1e-3, 1e-1, 1.0, 1e3, 1e6, 1e9]  # R -> 0 và R lớn
+
+
+def _check_against_lambertw(v_source, r, **kwargs):
+    newton = solve_diode_resistor(v_source, r, method="newton", **kwargs)
+    exact = solve_diode_resistor(v_source, r, method="lambertw", **kwargs)
+    assert newton.converged.all()
+    np.testing.assert_allclose(newton.v_d, exact.v_d, rtol=0, atol=1e-9)
+    # i = (Vs - Vd)/R: sai số làm tròn của Vs - Vd bị khuếch đại 1/R khi R nhỏ
+    tol = 1e-6 * np.abs(exact.i_d) + 1e-12 + 1e-9 * (np.abs(v_source) + 1.0) / r
+    assert np.all(np.abs(newton.i_d - exact.i_d) <= tol)
+    return newton
+
+
+@pytest.mark.parametrize("r", RESISTANCES)
+def test_newton_matches_lambertw_forward(r):
+    _check_against_lambertw(V_FORWARD, r)
+
+
+@pytest.mark.parametrize("r", RESISTANCES)
+def test_newton_matches_lambertw_deep_reverse(r):
+    sol = _check_against_lambertw(V_REVERSE, r)
+    # Phân cực ngược sâu: dòng ~ -Is nên Vd ~ Vs + R·Is, không kẹt ở -max_step·max_iter
+    deep = V_REVERSE < -1.0
+    np.testing.assert_allclose(sol.v_d[deep], V_REVERSE[deep] + r * 1e-12, rtol=0, atol=1e-9)
+
+
+def test_newton_matches_lambertw_random_batch():
+    rng = np.random.default_rng(0)
+    n = 100_000
+    _check_against_lambertw(rng.uniform(-1000, 100, n), 10 ** rng.uniform(-3, 9, n),
+                            temp_c=rng.uniform(-50, 150, n), n=rng.uniform(1.0, 2.0, n))
+
+
+def test_newton_convergence_stats():
+    v_source = np.concatenate([V_REVERSE, V_FORWARD])
+    stats = solve_diode_resistor(v_source, 1000.0).stats()
+    assert stats["method"] == "newton"
+    assert stats["size"] == v_source.size
+    assert stats["converged"] == 1.0
+    assert stats["max_iterations"] <= 10
+    assert stats["mean_iterations"] < 3
+    assert stats["max_residual"] < 1e-12
+
+
+def test_forward_q_point():
+    sol = solve_diode_resistor(5.0, 1000.0)
+    assert 0.5 < sol.v_d < 0.7
+    assert sol.i_d == pytest.approx((5.0 - sol.v_d) / 1000.0)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        solve_diode_resistor(5.0, 0.0)
+    with pytest.raises(ValueError):
+        solve_diode_resistor(5.0, 1000.0, method="bisect")
@@ -0,0 +1,69 @@
+"""Giao diện Streamlit, mỗi module của ứng dụng nằm trong một file riêng.
+
+``semiconductor_lab.py`` chỉ dựng khung trang (CSS, sidebar, footer) rồi gọi
+``render`` cho module đang chọn. Module được import ở lần chọn đầu tiên và giữ
+trong ``sys.modules`` cho cả tiến trình, nên thư viện nặng (pandas, Plotly) và
+bảng tĩnh của nó không được nạp cho tới khi cần và không nạp lại mỗi rerun.
+
+Các module nặng trong ``WARMUP_MODULES`` khai báo ``warmup_tasks()`` - các view
+mặc định được ``start_warmup`` tính sẵn ở thread nền khi tiến trình khởi động.
+"""
+import functools
+import importlib
+import sys
+import threading
+import time
+
+from semilab.warmup import Warmup
+
+MODULES = {
+    "1. Tra cứu & Tính toán (Basic Calc)": "ui.basic_calc",
+    "2. Cổng Logic (Logic Gates)": "ui.logic_gates",
+    "3. Đặc tuyến V-A (I-V Plotter)": "ui.iv_plotter",
+    "4. Wiki Bán dẫn (Semiconductor Wiki)": "ui.wiki",
+    "5. Quy trình Fab (Fabrication)": "ui.fab",
+    "6. Kho kết quả (Run Store)": "ui.runs",
+}
+DEFAULT_MODULE = next(iter(MODULES))
+WARMUP_MODULES = ("3. Đặc tuyến V-A (I-V Plotter)", "5. Quy trình Fab (Fabrication)")
+
+_LOAD_SECONDS = {}
+_WARMUP = None
+_WARMUP_LOCK = threading.Lock()
+
+
+def load(label):
+    """Module giao diện ứng với ``label``; lần đầu import và ghi lại thời gian import."""
+    name = MODULES[label]
+    fresh = name not in sys.modules
+    start = time.perf_counter()
+    # Luôn qua import_module: nếu thread warm-up đang import dở module này thì
+    # chờ nó xong, thay vì trả về module mới khởi tạo một phần từ sys.modules
+    module = importlib.import_module(name)
+    if fresh:
+        _LOAD_SECONDS.setdefault(name, time.perf_counter() - start)
+    return module
+
+
+def load_times():
+    """Thời gian import lần đầu (giây) của các module đã nạp trong tiến trình này."""
+    return dict(_LOAD_SECONDS)
+
+
+def render(label, profiler):
+    with profiler.span(f"load.{MODULES[label].rsplit('.', 1)[-1]}", "import"):
+        module = load(label)
+    module.render(profiler)
+
+
+def _warmup_tasks(label):
+    return load(label).warmup_tasks()
+
+
+def start_warmup():
+    """Khởi chạy (một lần mỗi tiến trình) thread làm nóng cache; trả về ``Warmup`` để xem tiến độ."""
+    global _WARMUP
+    with _WARMUP_LOCK:
+        if _WARMUP is None:
+            _WARMUP = Warmup(functools.partial(_warmup_tasks, label) for label in WARMUP_MODULES).start()
+        return _WARMUP
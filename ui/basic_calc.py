@@ -0,0 +1,243 @@
+"""Module 1: tra cứu vạch màu điện trở, định luật Ohm, đổi bước sóng - năng lượng photon."""
+import io
+
+import numpy as np
+import streamlit as st
+
+from semilab import (
+    BAND_COUNTS,
+    BAND_NAMES,
+    E_SERIES,
+    check_bom,
+    decode_bands,
+    encode_bands,
+    format_resistance,
+    nearest_standard,
+    ohm_current,
+    ohm_resistance,
+    ohm_voltage,
+    photon_energy_ev,
+    photon_wavelength_nm,
+)
+from semilab.cache import memoize
+from semilab.resistor import BAND_EXPONENT, BAND_HEX, BAND_TEMPCO, BAND_TOLERANCE, SERIES_TOLERANCE, color_index
+
+BOM_PREVIEW_ROWS = 1000  # Số dòng BOM tối đa hiển thị trên trang (file tải về có đủ)
+
+# Bảng chọn vạch dựng một lần khi module được nạp (chỉ số màu, xem semilab.resistor)
+DIGIT_PLACES = ("Số hàng đơn vị", "Số hàng chục", "Số hàng trăm")
+DIGIT_CHOICES = list(range(10))
+MULTIPLIER_CHOICES = list(range(10)) + [10, 11]
+TOLERANCE_CHOICES = [int(i) for i in np.flatnonzero(~np.isnan(BAND_TOLERANCE))]
+TEMPCO_CHOICES = [int(i) for i in np.flatnonzero(~np.isnan(BAND_TEMPCO))]
+# Mặc định 1 kΩ: Nâu-Đen-Đỏ-Vàng kim / Nâu-Đen-Đen-Nâu-Nâu (+ Nâu 100 ppm/K)
+DEFAULT_BANDS = {4: (1, 0, 2, 10), 5: (1, 0, 0, 1, 1), 6: (1, 0, 0, 1, 1, 1)}
+_PREFIXES = {0: "", 3: "k", 6: "M", 9: "G"}
+
+
+def _digit_label(i):
+    return f"{BAND_NAMES[i]} ({i})"
+
+
+def _multiplier_label(i):
+    exponent = int(BAND_EXPONENT[i])
+    if exponent < 0:
+        return f"{BAND_NAMES[i]} (x{10.0 ** exponent:g})"
+    return f"{BAND_NAMES[i]} (x{10 ** (exponent % 3)}{_PREFIXES[exponent - exponent % 3]})"
+
+
+def _tolerance_label(i):
+    return f"{BAND_NAMES[i]} (±{BAND_TOLERANCE[i]:g}%)"
+
+
+def _tempco_label(i):
+    return f"{BAND_NAMES[i]} ({BAND_TEMPCO[i]:g} ppm/K)"
+
+
+def _band_stripes(bands, n_digits):
+    # Thân điện trở với các vạch; khoảng trống rộng trước vạch sai số
+    spans = "".join(
+        f'<span style="display:inline-block; width:30px; height:80px; background-color:{BAND_HEX[i]}; '
+        f'margin-right:{40 if pos == n_digits else 15}px;"></span>'
+        for pos, i in enumerate(bands))
+    return ('<div style="background: linear-gradient(to bottom, #d2b48c, #f5deb3); padding: 20px; '
+            'border-radius: 50px; text-align: center; width: 100%; border: 2px solid #8b4513;">'
+            f"{spans}</div>")
+
+
+@memoize("bom", maxsize=2)
+def check_bom_csv(data, series):
+    """Đọc BOM (CSV) và thêm các cột kết quả của ``check_bom``."""
+    import pandas as pd  # chỉ nạp khi người dùng tải BOM lên
+
+    table = pd.read_csv(io.BytesIO(data))
+    columns = {str(c).strip().lower(): c for c in table.columns}
+    if "bands" in columns:
+        bands = table[columns["bands"]].fillna("").astype(str).str.split(r"\s*-\s*", expand=True)
+    else:
+        band_cols = [c for key, c in columns.items() if key.startswith(("band", "vạch", "vach"))]
+        if not band_cols:
+            raise ValueError("không tìm thấy cột 'bands' hoặc band1..band6")
+        bands = table[band_cols]
+    measured = pd.to_numeric(table[columns["measured"]], errors="coerce") if "measured" in columns else None
+
+    result = check_bom(bands.to_numpy(dtype=object), None if measured is None else measured.to_numpy(), series)
+    out = table.assign(**{
+        "R (Ω)": result.resistance,
+        "Sai số (%)": result.tolerance,
+        "TCR (ppm/K)": result.tempco,
+        "Hợp lệ": result.valid,
+        f"Chuẩn {series}": result.standard,
+        "Giá trị chuẩn gần nhất": result.nearest,
+    })
+    if result.in_tolerance is not None:
+        out["Đạt (đo)"] = result.in_tolerance
+    return out
+
+
+# ==============================================================================
+# MODULE 1: TRA CỨU & TÍNH TOÁN CƠ BẢN
+# ==============================================================================
+def render(profiler):
+    st.markdown('<div class="module-header"><h3>🛠️ Module 1: Tra cứu & Tính toán Linh kiện Cơ bản</h3></div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    Trong ngành điện tử, kỹ năng cơ bản nhất là đọc giá trị linh kiện và hiểu các định luật vật lý nền tảng.
+    Module này giúp bạn thực hành những kỹ năng "nhập môn" đó.
+    """)
+    
+    tab1, tab2, tab3 = st.tabs(["📟 Đọc Điện Trở (Color Code)", "⚡ Định luật Ohm", "🔄 Chuyển đổi Đơn vị"])
+    
+    # --- TAB 1: ĐIỆN TRỞ ---
+    with tab1:
+        st.subheader("Máy tính Vạch màu Điện trở (4 / 5 / 6 vạch)")
+        
+        n_bands = st.radio("Số vạch:", BAND_COUNTS, horizontal=True)
+        n_digits = 2 if n_bands == 4 else 3
+
+        # Mỗi vị trí vạch: (nhãn, các màu được phép, cách hiển thị)
+        roles = [(f"Vạch {k + 1} ({DIGIT_PLACES[n_digits - k - 1]})", DIGIT_CHOICES, _digit_label)
+                 for k in range(n_digits)]
+        roles.append((f"Vạch {n_digits + 1} (Hệ số nhân)", MULTIPLIER_CHOICES, _multiplier_label))
+        roles.append((f"Vạch {n_digits + 2} (Sai số)", TOLERANCE_CHOICES, _tolerance_label))
+        if n_bands == 6:
+            roles.append(("Vạch 6 (Hệ số nhiệt)", TEMPCO_CHOICES, _tempco_label))
+
+        bands = []
+        for pos, (col, (label, choices, fmt)) in enumerate(zip(st.columns(n_bands), roles)):
+            with col:
+                default = choices.index(DEFAULT_BANDS[n_bands][pos])
+                bands.append(st.selectbox(label, choices, index=default, format_func=fmt,
+                                          key=f"band{n_bands}_{pos}"))
+
+        # Tính toán
+        code = decode_bands([BAND_NAMES[i] for i in bands])
+        
+        # Hiển thị kết quả
+        st.markdown("#### Kết quả:")
+        
+        # Vẽ hình minh họa bằng HTML/CSS
+        st.markdown(_band_stripes(bands, n_digits), unsafe_allow_html=True)
+        
+        res_formatted = format_resistance(code.resistance)
+        tempco_text = f", {code.tempco:g} ppm/K" if n_bands == 6 else ""
+        st.metric("Giá trị Điện trở:", f"{res_formatted}Ω ±{code.tolerance:g}%{tempco_text}")
+        member = next((name for name in E_SERIES if nearest_standard(code.resistance, name) == code.resistance), None)
+        nearest = nearest_standard(code.resistance, 'E192')
+        if member:
+            st.caption(f"✅ Giá trị chuẩn thuộc dãy {member} (và các dãy lớn hơn).")
+        elif np.isnan(nearest):
+            st.caption("⚠️ Giá trị nằm ngoài bảng dãy chuẩn (0.01 Ω .. ~10 GΩ).")
+        else:
+            st.caption(f"⚠️ Không thuộc dãy chuẩn nào; gần nhất trong E192: "
+                       f"{format_resistance(nearest)}Ω.")
+
+        # --- GIÁ TRỊ -> VẠCH MÀU ---
+        st.markdown("#### Giá trị → Vạch màu:")
+        col_target, col_series = st.columns(2)
+        target = col_target.number_input("Giá trị cần tìm (Ω):", min_value=0.1, value=4600.0, step=100.0)
+        series = col_series.selectbox("Dãy chuẩn:", list(E_SERIES), index=2)
+        snapped = nearest_standard(target, series)
+        tolerance = SERIES_TOLERANCE[series]
+        try:
+            if np.isnan(snapped):
+                raise ValueError(f"giá trị nằm ngoài bảng dãy {series} (0.01 Ω .. ~10 GΩ)")
+            target_bands = encode_bands(snapped, n_bands, tolerance if tolerance in BAND_TOLERANCE else None)
+        except ValueError as exc:
+            st.error(f"Không mã hóa được: {exc}")
+        else:
+            encoded = decode_bands(target_bands)
+            st.markdown(_band_stripes([color_index(b) for b in target_bands], n_digits), unsafe_allow_html=True)
+            st.metric(f"Giá trị chuẩn gần nhất ({series}):", f"{format_resistance(snapped)}Ω",
+                      f"{(snapped / target - 1) * 100:+.2f}% so với giá trị cần tìm", delta_color="off")
+            st.write("Vạch màu: **" + " - ".join(target_bands) + "**")
+            if encoded.resistance != snapped:
+                st.warning(f"{n_bands} vạch chỉ có {n_digits} chữ số có nghĩa: giá trị được làm tròn thành "
+                           f"{format_resistance(encoded.resistance)}Ω. Dùng 5 hoặc 6 vạch cho dãy {series}.")
+
+        # --- KIỂM TRA BOM / CUỘN LINH KIỆN ---
+        st.markdown("#### Kiểm tra BOM / cuộn linh kiện:")
+        bom_file = st.file_uploader(
+            "File CSV: các cột band1..band6 (hoặc một cột 'bands' dạng Nâu-Đen-Đỏ-Vàng kim), "
+            "tùy chọn cột 'measured' (giá trị đo, Ω)", type=["csv"])
+        if bom_file is not None:
+            try:
+                with profiler.span("m1.bom", "compute"):
+                    bom = check_bom_csv(bom_file.getvalue(), series)
+            except ValueError as exc:
+                st.error(f"Lỗi đọc BOM: {exc}")
+            else:
+                c_total, c_valid, c_std, c_tol = st.columns(4)
+                c_total.metric("Số linh kiện", f"{len(bom):,}")
+                c_valid.metric("Mã vạch hợp lệ", f"{bom['Hợp lệ'].mean():.2%}")
+                c_std.metric(f"Thuộc dãy {series}", f"{bom[f'Chuẩn {series}'].mean():.2%}")
+                if "Đạt (đo)" in bom:
+                    c_tol.metric("Đạt sai số (đo)", f"{bom['Đạt (đo)'].mean():.2%}")
+                with profiler.span("m1.bom", "render"):
+                    if len(bom) > BOM_PREVIEW_ROWS:
+                        st.caption(f"Hiển thị {BOM_PREVIEW_ROWS:,} / {len(bom):,} dòng; tải file để xem đầy đủ.")
+                    st.dataframe(bom.head(BOM_PREVIEW_ROWS), hide_index=True)
+                    st.download_button("⬇️ Tải kết quả kiểm tra (CSV)", lambda: bom.to_csv(index=False),
+                                       file_name="bom_checked.csv", mime="text/csv")
+
+    # --- TAB 2: ĐỊNH LUẬT OHM ---
+    with tab2:
+        st.subheader("Tính toán Định luật Ohm")
+        st.latex(r"V = I \times R")
+        st.write("Nhập 2 giá trị bất kỳ để tính giá trị còn lại.")
+        
+        c1, c2, c3 = st.columns(3)
+        v_in = c1.number_input("Điện áp V (Volts)", min_value=0.0, step=0.1, value=0.0)
+        i_in = c2.number_input("Dòng điện I (Ampe)", min_value=0.0, step=0.01, value=0.0)
+        r_in = c3.number_input("Điện trở R (Ohm)", min_value=0.0, step=1.0, value=0.0)
+        
+        result_text = ""
+        if v_in == 0 and i_in > 0 and r_in > 0:
+            result_text = f"Điện áp V = {ohm_voltage(i_in, r_in):.2f} V"
+        elif i_in == 0 and v_in > 0 and r_in > 0:
+            result_text = f"Dòng điện I = {ohm_current(v_in, r_in):.4f} A"
+        elif r_in == 0 and v_in > 0 and i_in > 0:
+            result_text = f"Điện trở R = {ohm_resistance(v_in, i_in):.2f} Ω"
+        elif v_in > 0 and i_in > 0 and r_in > 0:
+            result_text = "Bạn đã nhập cả 3 số liệu. Hãy để trống (bằng 0) giá trị cần tìm."
+        else:
+            result_text = "Vui lòng nhập ít nhất 2 giá trị > 0."
+            
+        st.info(f"👉 **Kết quả:** {result_text}")
+
+    # --- TAB 3: CHUYỂN ĐỔI ĐƠN VỊ ---
+    with tab3:
+        st.subheader("Chuyển đổi năng lượng Photon")
+        st.markdown("Trong vật lý bán dẫn, chúng ta thường xuyên chuyển đổi giữa bước sóng ánh sáng (nm) và năng lượng dải cấm (eV).")
+        st.latex(r"E (eV) = \frac{1240}{\lambda (nm)}")
+        
+        col_u1, col_u2 = st.columns(2)
+        with col_u1:
+            nm_val = st.number_input("Nhập bước sóng (nm):", value=550.0)
+            ev_result = photon_energy_ev(nm_val)
+            st.write(f"Năng lượng tương ứng: **{ev_result:.2f} eV**")
+            
+        with col_u2:
+            ev_val = st.number_input("Nhập năng lượng (eV):", value=1.12) # Si Gap
+            nm_result = photon_wavelength_nm(ev_val)
+            st.write(f"Bước sóng tương ứng: **{nm_result:.2f} nm**")
@@ -0,0 +1,87 @@
+"""Module 5: mô phỏng quy trình Fab 3D chạy theo file công thức (recipe)."""
+import functools
+import json
+
+import streamlit as st
+
+from semilab.figures import recipe_animation_figure, recipe_step_figure
+from semilab.process import DEFAULT_RECIPE_PATH, recipe_from_json, recipe_run
+
+FAB_RESOLUTIONS = [0.2, 0.1, 0.05]  # Kích thước voxel của mô phỏng Fab (đơn vị như recipe)
+FAB_DEFAULT_RESOLUTION = 0.1
+
+
+# ==============================================================================
+# MODULE 5: QUY TRÌNH FAB
+# ==============================================================================
+def render(profiler):
+    st.markdown('<div class="module-header"><h3>🏭 Module 5: Mô phỏng Quy trình Sản xuất Chip 3D</h3></div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="concept-box">
+    Từ hạt cát (Silicon) đến con chip trong máy tính là một hành trình kỳ diệu.
+    Tại đây, chúng ta mô phỏng <b>Quy trình Planar</b> - nền tảng của công nghệ chế tạo IC hiện đại dưới góc nhìn 3D.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Công thức (recipe): mặc định là quy trình Planar 8 bước, có thể tải file JSON riêng
+    with st.expander("📄 Công thức quy trình (Recipe)"):
+        st.markdown("Mỗi bước là một phép toán trên lưới voxel: `substrate`, `oxidize`, `spin_coat`, `deposit`, "
+                    "`expose` (qua mặt nạ), `develop`, `etch`, `strip`, `implant`.")
+        recipe_file = st.file_uploader("Tải recipe JSON:", type="json")
+        recipe_bytes = recipe_file.getvalue() if recipe_file is not None else DEFAULT_RECIPE_PATH.read_bytes()
+        # Mặc định dùng độ phân giải recipe tự khai báo (grid.resolution), nếu có
+        declared = _declared_resolution(recipe_bytes)
+        options = sorted({*FAB_RESOLUTIONS, declared} - {None}, reverse=True)
+        fab_resolution = st.select_slider("Kích thước voxel (mặc định theo recipe):", options=options,
+                                          value=declared or FAB_DEFAULT_RESOLUTION)
+    try:
+        recipe_text = recipe_bytes.decode("utf-8")
+        recipe = recipe_from_json(recipe_text, resolution=fab_resolution)
+    except ValueError as exc:
+        st.error(f"Lỗi recipe: {exc}. Dùng công thức mặc định.")
+        recipe_text = DEFAULT_RECIPE_PATH.read_text(encoding="utf-8")
+        recipe = recipe_from_json(recipe_text, resolution=fab_resolution)
+    steps_data = recipe.steps
+    
+    fab_view = st.radio("Chế độ xem:", ["Từng bước", "Phát hoạt ảnh (Playback)"], horizontal=True)
+    
+    if fab_view == "Từng bước":
+        # Timeline điều khiển
+        step = st.select_slider("Quy trình dòng chảy (Process Flow):", options=list(range(len(steps_data))), format_func=lambda x: steps_data[x].get("label", steps_data[x]["op"]))
+        
+        st.info(f"👉 **Bước {step}: {steps_data[step].get('label', steps_data[step]['op'])}** - {steps_data[step].get('desc', '')}")
+        
+        # Mỗi bước được tính từ trạng thái đã lưu của bước trước (không chạy lại từ đầu)
+        with profiler.span("m5.fab_3d", "compute"):
+            fig_fab = recipe_step_figure(recipe_text, step, fab_resolution)
+    else:
+        # Toàn bộ các bước thành frame Plotly: trình duyệt tự phát, không cần rerun
+        with profiler.span("m5.fab_animation", "compute"):
+            fig_fab = recipe_animation_figure(recipe_text, fab_resolution)
+    
+    # Hiển thị
+    with profiler.span("m5.fab_3d", "render"):
+        st.plotly_chart(fig_fab, use_container_width=True)
+    
+    snap = recipe_run(recipe_text, fab_resolution).stats()
+    st.caption(f"Snapshot: {snap['steps']} bước, {snap['keyframes']} keyframe, "
+               f"{snap['stored_bytes'] / 1024:,.0f} kB nén (lưu thô: {snap['raw_bytes'] / 2**20:,.1f} MB)")
+
+
+def _declared_resolution(recipe_bytes):
+    try:
+        resolution = json.loads(recipe_bytes)["grid"]["resolution"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    valid = isinstance(resolution, (int, float)) and not isinstance(resolution, bool) and resolution > 0
+    return float(resolution) if valid else None
+
+
+def warmup_tasks():
+    """Mọi bước của recipe mặc định ở chế độ "Từng bước" (độ phân giải mặc định)."""
+    recipe_text = DEFAULT_RECIPE_PATH.read_text(encoding="utf-8")
+    n_steps = len(recipe_from_json(recipe_text, resolution=FAB_DEFAULT_RESOLUTION).steps)
+    return [(f"recipe_step_figure[{step}]",
+             functools.partial(recipe_step_figure, recipe_text, step, FAB_DEFAULT_RESOLUTION))
+            for step in range(n_steps)]
@@ -0,0 +1,356 @@
+"""Module 3: đặc tuyến V-A của Diode và MOSFET (đường cong, quét tham số, Monte Carlo)."""
+import functools
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from semilab import (
+    CARRIER_MATERIALS,
+    DIODE_MATERIALS,
+    diode_sweep_grid,
+    mosfet_id,
+    solve_fermi_level,
+    thermal_voltage,
+)
+from semilab.figures import (
+    diode_figure,
+    diode_sweep_figure,
+    fermi_map_figure,
+    fermi_temperature_figure,
+    load_line_figure,
+    mc_histogram_figure,
+    mc_percentile_figure,
+    junction_cv_figure,
+    junction_figure,
+    mosfet_figure,
+    sweep_labels,
+)
+from semilab.montecarlo import diode_yield, mosfet_yield
+from semilab.pn_junction import abrupt_depletion, pn_junction_sweep
+from ui.runs import save_button
+
+SWEEP_RESOLUTIONS = [400, 2_000, 10_000, 100_000]  # Số điểm V mỗi đường khi quét diode
+MC_DEVICE_COUNTS = [10_000, 100_000, 1_000_000]  # Số linh kiện ảo của Monte Carlo
+JUNCTION_NODES = [1_000, 10_000, 100_000]  # Số nút lưới của bộ giải Poisson
+JUNCTION_BIAS_POINTS = 23  # Số điểm phân cực mỗi lần quét
+DOPING_LEVELS = [10.0 ** k for k in range(14, 20)]  # cm^-3
+# Giá trị mặc định của các widget (cũng là các view được làm nóng cache khi khởi động)
+DIODE_DEFAULTS = (25, 1.0)  # (nhiệt độ °C, hệ số n)
+LOAD_LINE_DEFAULTS = (5.0, 1000.0)  # (Vs, R)
+MOSFET_DEFAULTS = (0.7, 1.0, 0.0)  # (Vth, K, λ)
+CARRIER_DOPING_LEVELS = [10.0 ** (k / 2) for k in range(24, 41)]  # 1e12 .. 1e20 cm^-3
+FERMI_MAP_RESOLUTIONS = [100, 300, 1_000]  # Cạnh lưới bản đồ (pha tạp × nhiệt độ)
+FERMI_MAP_QUANTITIES = {"E_F - E_i": "e_f", "Electron n": "n", "Lỗ trống p": "p", "Tỉ lệ ion hóa": "ionized"}
+
+
+def _mc_clipped_caption(mc):
+    # Điểm vượt trần histogram (1e12) làm các phân vị trên của đường cong bị chặn
+    if mc.clipped:
+        st.caption(f"⚠️ {mc.clipped:,} điểm của đường cong phân vị vượt 1e12 và bị chặn ở trần histogram; "
+                   "các phân vị trên tại những điểm đó chỉ là cận dưới.")
+
+
+# ==============================================================================
+# MODULE 3: ĐẶC TUYẾN V-A
+# ==============================================================================
+def render(profiler):
+    st.markdown('<div class="module-header"><h3>📈 Module 3: Đặc tuyến V-A (I-V Characteristic)</h3></div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="concept-box">
+    Để hiểu một linh kiện bán dẫn (Diode, Transistor), ta không nhìn hình dáng, mà nhìn vào <b>Đặc tuyến I-V</b> của nó.
+    Biểu đồ này cho biết dòng điện ($I$) chạy qua linh kiện thay đổi thế nào khi điện áp ($V$) thay đổi.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    comp_type = st.selectbox("Chọn linh kiện mô phỏng:",
+                             ["PN Junction Diode", "MOSFET (Simplified)", "Tiếp giáp PN (Poisson 1D)",
+                              "Hạt dẫn & Mức Fermi"])
+    
+    if comp_type == "PN Junction Diode":
+        st.subheader("Mô phỏng Diode (Phương trình Shockley)")
+        st.latex(r"I = I_S \left( e^{\frac{V}{n V_T}} - 1 \right)")
+        
+        diode_mode = st.radio("Chế độ mô phỏng:", ["Một đường cong", "Quét tham số (Sweep)", "Monte Carlo (Yield)"], horizontal=True)
+        
+        col_input, col_plot = st.columns([1, 2])
+        if diode_mode == "Một đường cong":
+            with col_input:
+                st.write("**Thông số vật lý:**")
+                temp_c = st.slider("Nhiệt độ (°C):", -50, 150, DIODE_DEFAULTS[0])
+                n_val = st.slider("Hệ số lý tưởng (n):", 1.0, 2.0, DIODE_DEFAULTS[1], 0.1)
+                material = st.radio("Vật liệu:", list(DIODE_MATERIALS))
+            
+                # Tính toán tham số
+                Vt = thermal_voltage(temp_c)
+            
+                # Dòng bão hòa ngược (Is) giả định thay đổi theo vật liệu
+                Is = DIODE_MATERIALS[material]["Is"]
+                v_threshold_disp = DIODE_MATERIALS[material]["v_on"]
+                
+                st.markdown(f"""
+                - **$V_T$ (Thermal Voltage):** {Vt*1000:.2f} mV
+                - **$I_S$:** {Is} A
+                - **Ngưỡng dẫn dự kiến:** ~{v_threshold_disp} V
+                """)
+
+            with col_plot:
+                # Đường cong và hình được cache theo (nhiệt độ, n, vật liệu)
+                with profiler.span("m3.diode", "figure"):
+                    fig_diode = diode_figure(temp_c, n_val, material)
+                with profiler.span("m3.diode", "render"):
+                    st.plotly_chart(fig_diode, use_container_width=True)
+                save_button("diode", {"temp_c": temp_c, "n": n_val, "material": material}, key="save_diode")
+            
+            # --- MẠCH DIODE NỐI TIẾP ĐIỆN TRỞ (ĐƯỜNG TẢI) ---
+            with st.expander("🔌 Mạch Diode nối tiếp điện trở - Tìm điểm làm việc Q (Load-line)"):
+                st.latex(r"V_S = I \cdot R + V_D, \quad I = I_S \left( e^{\frac{V_D}{n V_T}} - 1 \right)")
+                c_vs, c_r = st.columns(2)
+                v_source = c_vs.number_input("Nguồn Vs (V):", value=LOAD_LINE_DEFAULTS[0], step=0.5)
+                r_load = c_r.number_input("Điện trở R (Ω):", min_value=1.0, value=LOAD_LINE_DEFAULTS[1], step=100.0)
+                
+                with profiler.span("m3.load_line", "figure"):
+                    fig_q, q_point = load_line_figure(temp_c, n_val, material, v_source, r_load)
+                q_stats = q_point.stats()
+                c_vd, c_id, c_it = st.columns(3)
+                c_vd.metric("Vd (V)", f"{float(q_point.v_d):.4f}")
+                c_id.metric("I (mA)", f"{float(q_point.i_d)*1000:.4f}")
+                c_it.metric("Số vòng lặp Newton", q_stats["max_iterations"])
+                with profiler.span("m3.load_line", "render"):
+                    st.plotly_chart(fig_q, use_container_width=True)
+        
+        elif diode_mode == "Quét tham số (Sweep)":
+            with col_input:
+                st.write("**Lưới tham số:**")
+                t_range = st.slider("Dải nhiệt độ (°C):", -50, 150, (0, 100))
+                t_steps = st.slider("Số mức nhiệt độ:", 1, 10, 5)
+                n_range = st.slider("Dải hệ số lý tưởng (n):", 1.0, 2.0, (1.0, 2.0), 0.1)
+                n_steps = st.slider("Số mức n:", 1, 5, 3)
+                sweep_materials = st.multiselect("Vật liệu:", list(DIODE_MATERIALS), default=list(DIODE_MATERIALS))
+                sweep_view = st.radio("Hiển thị:", ["Họ đường cong", "Heatmap"])
+                sweep_points = st.select_slider("Số điểm V mỗi đường:", options=SWEEP_RESOLUTIONS,
+                                                format_func=lambda p: f"{p:,}")
+                
+            with col_plot:
+                if not sweep_materials:
+                    st.warning("Hãy chọn ít nhất một vật liệu.")
+                else:
+                    # Toàn bộ lưới (T x n x vật liệu x V) được tính trong một lần gọi
+                    temps = tuple(np.linspace(t_range[0], t_range[1], t_steps).round(2).tolist())
+                    ns = tuple(np.linspace(n_range[0], n_range[1], n_steps).round(2).tolist())
+                    with profiler.span("m3.diode_sweep", "figure"):
+                        fig = diode_sweep_figure(temps, ns, tuple(sweep_materials),
+                                                 view="heatmap" if sweep_view == "Heatmap" else "family",
+                                                 points=sweep_points)
+                    with profiler.span("m3.diode_sweep", "render"):
+                        st.plotly_chart(fig, use_container_width=True)
+
+                    # Dữ liệu đầy đủ độ phân giải nằm ở server; CSV chỉ được tạo khi bấm tải
+                    def sweep_csv(temps=temps, ns=ns, materials=tuple(sweep_materials), points=sweep_points):
+                        v_grid, i_grid = diode_sweep_grid(temps, ns, materials, points=points)
+                        table = pd.DataFrame(i_grid.reshape(-1, points).T, columns=sweep_labels(temps, ns, materials))
+                        table.insert(0, "V", v_grid)
+                        return table.to_csv(index=False).encode("utf-8")
+
+                    n_curves = len(temps) * len(ns) * len(sweep_materials)
+                    st.download_button(f"⬇️ Tải dữ liệu đầy đủ ({n_curves} đường × {sweep_points:,} điểm, CSV)",
+                                       sweep_csv, file_name="diode_sweep.csv", mime="text/csv")
+        
+        else:
+            with col_input:
+                st.write("**Phân bố tham số:**")
+                mc_material = st.radio("Vật liệu:", list(DIODE_MATERIALS))
+                mc_devices = st.select_slider("Số linh kiện:", options=MC_DEVICE_COUNTS, value=100_000,
+                                              format_func=lambda n: f"{n:,}")
+                is_sigma = st.slider("Độ tản Is (σ của ln Is):", 0.0, 1.5, 0.5, 0.05)
+                n_mean = st.slider("Hệ số n (trung bình):", 1.0, 2.0, 1.0, 0.05)
+                n_sigma = st.slider("σ(n):", 0.0, 0.2, 0.02, 0.01)
+                t_mean = st.slider("Nhiệt độ trung bình (°C):", -50, 150, 25)
+                t_sigma = st.slider("σ nhiệt độ (°C):", 0, 30, 5)
+                st.write("**Giới hạn spec:**")
+                vf_tol = st.slider("Vf @ 1 mA: ± (%) quanh giá trị danh định", 1, 30, 5)
+                leak_mult = st.slider("Dòng rò tối đa (× Is danh định):", 1.0, 10.0, 3.0, 0.5)
+            
+            is_nom = DIODE_MATERIALS[mc_material]["Is"]
+            vf_nom = n_mean * thermal_voltage(t_mean) * math.log1p(1e-3 / is_nom)
+            vf_spec = (round(vf_nom * (1 - vf_tol / 100), 6), round(vf_nom * (1 + vf_tol / 100), 6))
+            
+            with col_plot:
+                # Lấy mẫu theo lô (bộ nhớ không phụ thuộc số linh kiện), kết quả có cache
+                with profiler.span("m3.monte_carlo", "compute"):
+                    mc = diode_yield(mc_devices, is_nom, is_sigma, n_mean, n_sigma, t_mean, t_sigma,
+                                     vf_spec, is_nom * leak_mult)
+                spec_yield = mc.spec_yield()
+                c_y, c_vf, c_lk, c_t = st.columns(4)
+                c_y.metric("Yield", f"{mc.yield_:.2%}")
+                c_vf.metric("Đạt Vf", f"{spec_yield['v_f']:.2%}")
+                c_lk.metric("Đạt dòng rò", f"{spec_yield['i_leak']:.2%}")
+                c_t.metric("Thời gian tính", f"{mc.seconds:.2f} s")
+                with profiler.span("m3.monte_carlo", "figure"):
+                    fig_hist = mc_histogram_figure(mc, "v_f", f"Phân bố Vf @ 1 mA ({mc.n_devices:,} linh kiện)", "Vf (V)")
+                    fig_pct = mc_percentile_figure(mc, "Đường cong phân vị I-V", "Điện áp V (Volt)",
+                                                   "Dòng điện I (Ampe)", log_y=True)
+                with profiler.span("m3.monte_carlo", "render"):
+                    st.plotly_chart(fig_hist, use_container_width=True)
+                    st.plotly_chart(fig_pct, use_container_width=True)
+                    st.dataframe(pd.DataFrame(mc.summary()).T, use_container_width=True)
+                    _mc_clipped_caption(mc)
+
+    elif comp_type == "MOSFET (Simplified)":
+        st.subheader("Mô phỏng N-MOSFET (Vùng bão hòa)")
+        st.latex(r"I_D = \frac{1}{2} \mu_n C_{ox} \frac{W}{L} (V_{GS} - V_{th})^2")
+        
+        mos_mode = st.radio("Chế độ mô phỏng:", ["Họ đặc tuyến", "Monte Carlo (Yield)"], horizontal=True)
+        
+        col_input, col_plot = st.columns([1, 2])
+        with col_input:
+            v_th = st.slider("Điện áp ngưỡng Vth (V):", 0.5, 2.0, MOSFET_DEFAULTS[0])
+            k_n = st.slider("Hệ số K (mA/V^2):", 0.1, 5.0, MOSFET_DEFAULTS[1])
+            lambda_n = st.slider("Điều biến chiều dài kênh λ (1/V):", 0.0, 0.2, MOSFET_DEFAULTS[2], 0.01)
+            if mos_mode == "Họ đặc tuyến":
+                st.info("Kéo thanh trượt Vgs bên dưới biểu đồ để xem đường cong thay đổi.")
+            else:
+                st.write("**Phân bố tham số:**")
+                mc_devices = st.select_slider("Số linh kiện:", options=MC_DEVICE_COUNTS, value=100_000,
+                                              format_func=lambda n: f"{n:,}")
+                vth_sigma_mv = st.slider("σ(Vth) (mV):", 0, 100, 30)
+                k_sigma_pct = st.slider("σ(K) (%):", 0, 20, 5)
+                t_mean = st.slider("Nhiệt độ trung bình (°C):", -50, 150, 25)
+                t_sigma = st.slider("σ nhiệt độ (°C):", 0, 40, 0)
+                st.write("**Giới hạn spec (Vgs = Vds = 3 V):**")
+                ion_min_pct = st.slider("Ion tối thiểu (% danh định):", 50, 100, 90)
+                vth_window_mv = st.slider("Cửa sổ Vth: ± (mV)", 10, 200, 50)
+
+        with col_plot:
+            if mos_mode == "Họ đặc tuyến":
+                with profiler.span("m3.mosfet", "figure"):
+                    fig_mos = mosfet_figure(v_th, k_n, lambda_n)
+                with profiler.span("m3.mosfet", "render"):
+                    st.plotly_chart(fig_mos, use_container_width=True)
+                save_button("mosfet", {"v_th": v_th, "k_n": k_n, "lambda_": lambda_n}, key="save_mosfet")
+            else:
+                ion_nom = float(mosfet_id(3.0, 3.0, v_th, k_n, lambda_n))
+                with profiler.span("m3.monte_carlo", "compute"):
+                    mc = mosfet_yield(mc_devices, v_th, vth_sigma_mv / 1000, k_n, k_n * k_sigma_pct / 100, lambda_n,
+                                      t_mean, t_sigma, (round(ion_nom * ion_min_pct / 100, 9), None),
+                                      (v_th - vth_window_mv / 1000, v_th + vth_window_mv / 1000))
+                spec_yield = mc.spec_yield()
+                c_y, c_on, c_vt, c_t = st.columns(4)
+                c_y.metric("Yield", f"{mc.yield_:.2%}")
+                c_on.metric("Đạt Ion", f"{spec_yield['i_on']:.2%}")
+                c_vt.metric("Đạt Vth", f"{spec_yield['v_th']:.2%}")
+                c_t.metric("Thời gian tính", f"{mc.seconds:.2f} s")
+                with profiler.span("m3.monte_carlo", "figure"):
+                    fig_hist = mc_histogram_figure(mc, "i_on", f"Phân bố Ion ({mc.n_devices:,} linh kiện)", "Ion (mA)")
+                    fig_pct = mc_percentile_figure(mc, "Đường cong phân vị Id(Vds) tại Vgs = 3 V", "Vds (Volt)", "Id (mA)")
+                with profiler.span("m3.monte_carlo", "render"):
+                    st.plotly_chart(fig_hist, use_container_width=True)
+                    st.plotly_chart(fig_pct, use_container_width=True)
+                    st.dataframe(pd.DataFrame(mc.summary()).T, use_container_width=True)
+                    _mc_clipped_caption(mc)
+
+    elif comp_type == "Tiếp giáp PN (Poisson 1D)":
+        st.subheader("Tĩnh điện Tiếp giáp PN (Phương trình Poisson)")
+        st.latex(r"\frac{d^2\psi}{dx^2} = -\frac{q}{\varepsilon}\left(p - n + N_D - N_A\right)")
+        
+        col_input, col_plot = st.columns([1, 2])
+        with col_input:
+            jn_material = st.radio("Vật liệu:", list(DIODE_MATERIALS), key="jn_material")
+            jn_profile = st.radio("Phân bố pha tạp:", ["Đột ngột (Abrupt)", "Tuyến tính (Linear graded)"])
+            na = st.select_slider("Pha tạp phía P, N_A (cm⁻³):", options=DOPING_LEVELS, value=1e16,
+                                  format_func=lambda v: f"{v:.0e}")
+            nd = st.select_slider("Pha tạp phía N, N_D (cm⁻³):", options=DOPING_LEVELS, value=1e17,
+                                  format_func=lambda v: f"{v:.0e}")
+            length_um = st.slider("Chiều dài linh kiện (µm):", 0.5, 20.0, 4.0, 0.5)
+            nodes = st.select_slider("Số nút lưới:", options=JUNCTION_NODES, value=10_000,
+                                     format_func=lambda n: f"{n:,}")
+            v_lo, v_hi = st.slider("Dải điện áp quét (V):", -20.0, 0.6, (-5.0, 0.5), 0.1)
+            jn_temp = st.slider("Nhiệt độ (°C):", -50, 150, 27, key="jn_temp")
+
+        profile = "abrupt" if jn_profile.startswith("Đột ngột") else "graded"
+        biases = tuple(np.round(np.linspace(v_lo, v_hi, JUNCTION_BIAS_POINTS), 6))
+        args = (profile, na, nd, length_um, nodes, biases, jn_material, float(jn_temp))
+        with col_plot:
+            with profiler.span("m3.junction", "compute"):
+                sol = pn_junction_sweep(*args)
+            k = st.select_slider("Điện áp hiển thị (V):", options=range(len(biases)),
+                                 value=int(np.argmin(np.abs(np.asarray(biases)))),
+                                 format_func=lambda i: f"{biases[i]:+.2f}")
+            x_p, x_n = (edge[k] for edge in sol.depletion_edges())
+            c_bi, c_w, c_e, c_c = st.columns(4)
+            c_bi.metric("Thế tiếp xúc V_bi", f"{sol.v_bi:.3f} V")
+            c_w.metric("Bề rộng vùng nghèo W", f"{(x_n - x_p) * 1e4:.3f} µm")
+            c_e.metric("|E| cực đại", f"{np.abs(sol.field()[k]).max() / 1e3:.1f} kV/cm")
+            c_c.metric("Điện dung C", f"{sol.capacitance()[k] * 1e9:.2f} nF/cm²")
+            if profile == "abrupt":
+                _, w_ana, _, _, e_ana = abrupt_depletion(na, nd, biases[k], jn_material, jn_temp)
+                st.caption(f"Gần đúng vùng nghèo (giải tích): W = {w_ana * 1e4:.3f} µm, "
+                           f"|E|max = {e_ana / 1e3:.1f} kV/cm.")
+            st.caption(f"Newton: {sol.iterations.sum()} vòng cho {len(biases)} điểm phân cực "
+                       f"(tối đa {sol.iterations.max()}/điểm), {sol.seconds:.2f} s trên {nodes:,} nút.")
+            if not sol.converged.all():
+                st.warning("Một số điểm phân cực chưa hội tụ; hãy giảm dải điện áp thuận hoặc tăng số nút lưới.")
+            with profiler.span("m3.junction", "figure"):
+                fig_jn = junction_figure(*args, k)
+                fig_cv = junction_cv_figure(*args)
+            with profiler.span("m3.junction", "render"):
+                st.plotly_chart(fig_jn, use_container_width=True)
+                st.plotly_chart(fig_cv, use_container_width=True)
+
+    elif comp_type == "Hạt dẫn & Mức Fermi":
+        st.subheader("Thống kê hạt dẫn và Mức Fermi")
+        st.latex(r"n = N_c\,\mathcal{F}_{1/2}\!\left(\frac{E_F - E_c}{kT}\right),\quad "
+                 r"p = N_v\,\mathcal{F}_{1/2}\!\left(\frac{E_v - E_F}{kT}\right),\quad "
+                 r"n + N_A^- = p + N_D^+")
+
+        col_input, col_plot = st.columns([1, 2])
+        with col_input:
+            fl_material = st.radio("Vật liệu:", list(CARRIER_MATERIALS), key="fl_material")
+            n_type = st.radio("Loại pha tạp:", ["N (donor)", "P (acceptor)"], horizontal=True).startswith("N")
+            doping = st.select_slider("Nồng độ pha tạp (cm⁻³):", options=CARRIER_DOPING_LEVELS, value=1e16,
+                                      format_func=lambda v: f"{v:.1e}")
+            temp_k = st.slider("Nhiệt độ (K):", 50, 800, 300, key="fl_temp")
+            ionization = st.checkbox("Ion hóa không hoàn toàn (đóng băng hạt dẫn)", value=True)
+
+        with col_plot:
+            with profiler.span("m3.fermi", "compute"):
+                point = solve_fermi_level(doping if n_type else 0.0, 0.0 if n_type else doping, temp_k,
+                                          fl_material, ionization)
+            ionized = point.donors_ionized if n_type else point.acceptors_ionized
+            c_ef, c_n, c_p, c_ion = st.columns(4)
+            c_ef.metric("E_F - E_i", f"{float(point.e_f - point.e_i):+.3f} eV")
+            c_n.metric("Electron n", f"{float(point.n):.2e} cm⁻³")
+            c_p.metric("Lỗ trống p", f"{float(point.p):.2e} cm⁻³")
+            c_ion.metric("Ion hóa", f"{float(ionized / doping):.1%}")
+            st.caption(f"E_g = {float(point.e_g):.3f} eV, E_F - E_v = {float(point.e_f):.3f} eV, "
+                       f"n_i = {float(point.n_i):.2e} cm⁻³.")
+            with profiler.span("m3.fermi", "figure"):
+                fig_t = fermi_temperature_figure(fl_material, n_type, doping, ionization=ionization)
+            with profiler.span("m3.fermi", "render"):
+                st.plotly_chart(fig_t, use_container_width=True)
+
+        st.markdown("##### Bản đồ pha tạp × nhiệt độ")
+        col_q, col_d, col_t, col_r = st.columns(4)
+        quantity = col_q.selectbox("Đại lượng:", list(FERMI_MAP_QUANTITIES))
+        log_doping = col_d.slider("log10 pha tạp (cm⁻³):", 10.0, 21.0, (12.0, 20.0), 0.5)
+        temp_range = col_t.slider("Dải nhiệt độ (K):", 20, 1000, (50, 600), 10)
+        resolution = col_r.select_slider("Độ phân giải:", options=FERMI_MAP_RESOLUTIONS, value=300,
+                                         format_func=lambda n: f"{n}×{n}")
+        with profiler.span("m3.fermi_map", "figure"):
+            fig_map = fermi_map_figure(fl_material, n_type, log_doping, tuple(map(float, temp_range)), resolution,
+                                       FERMI_MAP_QUANTITIES[quantity], ionization)
+        with profiler.span("m3.fermi_map", "render"):
+            st.plotly_chart(fig_map, use_container_width=True)
+
+
+def warmup_tasks():
+    """View mặc định của module (đường cong diode cho cả hai vật liệu, đường tải, họ MOSFET)."""
+    tasks = []
+    for material in DIODE_MATERIALS:
+        tasks.append((f"diode_figure[{material}]", functools.partial(diode_figure, *DIODE_DEFAULTS, material)))
+        tasks.append((f"load_line_figure[{material}]",
+                      functools.partial(load_line_figure, *DIODE_DEFAULTS, material, *LOAD_LINE_DEFAULTS)))
+    tasks.append(("mosfet_figure", functools.partial(mosfet_figure, *MOSFET_DEFAULTS)))
+    return tasks
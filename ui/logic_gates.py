@@ -0,0 +1,128 @@
+"""Module 2: cổng logic, netlist tổ hợp và mô phỏng theo thời gian (event-driven)."""
+import pandas as pd
+import streamlit as st
+
+from semilab.eventsim import EXAMPLE_SEQUENTIAL_NETLIST, find_glitches, simulate_text
+from semilab.figures import waveform_figure
+from semilab.logic import EXAMPLE_NETLIST, GATES, Netlist, evaluate_gate, netlist_truth_table
+from ui.runs import save_button
+
+TRUTH_TABLE_ROWS = 1024  # Số dòng bảng chân trị tối đa gửi lên trình duyệt
+
+
+# ==============================================================================
+# MODULE 2: CỔNG LOGIC
+# ==============================================================================
+def render(profiler):
+    st.markdown('<div class="module-header"><h3>⚙️ Module 2: Mô phỏng Cổng Logic</h3></div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="concept-box">
+    <b>Digital Logic</b> là nền tảng của mọi con chip xử lý. Từ hàng tỷ cổng logic nhỏ bé này, chúng ta xây dựng nên CPU, GPU.
+    Module này giúp bạn hình dung cách tín hiệu 0 và 1 được xử lý.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col_ctrl, col_viz = st.columns([1, 2])
+    
+    with col_ctrl:
+        gate_type = st.selectbox("Chọn cổng logic:", ["AND", "OR", "NOT", "NAND", "NOR", "XOR"])
+        st.write("**Trạng thái đầu vào:**")
+        
+        # Input A
+        input_a = st.toggle("Input A (1=ON, 0=OFF)", value=False)
+        val_a = 1 if input_a else 0
+        
+        # Input B (Ẩn nếu là cổng NOT)
+        if gate_type != "NOT":
+            input_b = st.toggle("Input B (1=ON, 0=OFF)", value=False)
+            val_b = 1 if input_b else 0
+        else:
+            val_b = None
+            st.write("Input B: Không dùng cho cổng NOT")
+
+        # Logic xử lý
+        output = evaluate_gate(gate_type, val_a) if gate_type == "NOT" else evaluate_gate(gate_type, val_a, val_b)
+        formula = GATES[gate_type][3]
+            
+    with col_viz:
+        st.markdown("### Kết quả Mô phỏng")
+        
+        # Vẽ minh họa đơn giản
+        viz_col1, viz_col2, viz_col3 = st.columns([1,1,1])
+        
+        with viz_col1:
+            st.markdown(f"<div style='text-align:center; padding:20px; background-color:{'#28a745' if val_a else '#dc3545'}; color:white; border-radius:10px;'>Input A<br><h1>{val_a}</h1></div>", unsafe_allow_html=True)
+            if gate_type != "NOT":
+                st.markdown("<br>", unsafe_allow_html=True)
+                st.markdown(f"<div style='text-align:center; padding:20px; background-color:{'#28a745' if val_b else '#dc3545'}; color:white; border-radius:10px;'>Input B<br><h1>{val_b}</h1></div>", unsafe_allow_html=True)
+        
+        with viz_col2:
+            st.markdown(f"<div style='display:flex; align-items:center; justify-content:center; height:100%; font-size:30px;'>➡ <b>{gate_type}</b> ➡</div>", unsafe_allow_html=True)
+            
+        with viz_col3:
+            st.markdown(f"<div style='text-align:center; padding:40px; background-color:{'#28a745' if output else '#dc3545'}; color:white; border-radius:50%; border: 4px solid #333;'>Output Y<br><h1>{output}</h1></div>", unsafe_allow_html=True)
+            
+        st.markdown("---")
+        st.markdown(f"**Biểu thức Boolean:** :large_blue_circle: **{formula}**")
+        
+        # Bảng chân trị (sinh tự động từ mạch một cổng)
+        with st.expander(f"Xem Bảng Chân Trị (Truth Table) của {gate_type}"):
+            with profiler.span("m2.truth_table", "compute"):
+                df = pd.DataFrame(Netlist.single_gate(gate_type).truth_table())
+            with profiler.span("m2.truth_table", "render"):
+                st.table(df)
+
+    # --- MẠCH TỔ HỢP NHIỀU CỔNG (NETLIST) ---
+    st.markdown("---")
+    with st.expander("🧩 Mô phỏng mạch tổ hợp nhiều cổng (Netlist)"):
+        st.markdown("Mỗi dòng khai báo một cổng dạng `Y = LOẠI(A, B, ...)` với các loại: " + ", ".join(GATES)
+                    + ". Bảng chân trị cho **toàn bộ 2^N tổ hợp đầu vào** được tính song song theo bit.")
+        netlist_text = st.text_area("Netlist:", value=EXAMPLE_NETLIST, height=220)
+        try:
+            with profiler.span("m2.netlist", "compute"):
+                netlist, truth = netlist_truth_table(netlist_text)
+        except ValueError as exc:
+            st.error(f"Lỗi netlist: {exc}")
+        else:
+            n_rows = len(next(iter(truth.values()))) if truth else 0
+            c_in, c_gate, c_depth = st.columns(3)
+            c_in.metric("Số đầu vào (2^N tổ hợp)", f"{len(netlist.inputs)} ({n_rows:,})")
+            c_gate.metric("Số cổng", len(netlist.gates))
+            c_depth.metric("Số mức logic", netlist.depth)
+            if n_rows > TRUTH_TABLE_ROWS:
+                st.caption(f"Hiển thị {TRUTH_TABLE_ROWS:,} dòng đầu tiên / {n_rows:,} dòng.")
+            with profiler.span("m2.netlist", "render"):
+                st.dataframe(pd.DataFrame({net: col[:TRUTH_TABLE_ROWS] for net, col in truth.items()}), hide_index=True)
+            save_button("logic", {"netlist": netlist_text}, key="save_netlist")
+
+    # --- MÔ PHỎNG THEO THỜI GIAN (EVENT-DRIVEN) ---
+    with st.expander("⏱️ Mô phỏng theo thời gian: độ trễ cổng, Flip-flop và dạng sóng"):
+        st.markdown("Khai báo độ trễ của cổng bằng `@ d` và phần tử nhớ `Q = DFF(D, CLK)` hoặc `Q = DLATCH(D, EN)`. "
+                    "Đầu vào `CLK` (nếu có) nhận xung clock, các đầu vào khác nhận giá trị ngẫu nhiên.")
+        seq_text = st.text_area("Netlist tuần tự:", value=EXAMPLE_SEQUENTIAL_NETLIST, height=200)
+        c_clk, c_in, c_end, c_mode = st.columns(4)
+        clock_period = c_clk.number_input("Chu kỳ clock:", min_value=1.0, value=10.0)
+        input_period = c_in.number_input("Chu kỳ đổi đầu vào:", min_value=1.0, value=7.0)
+        sim_end = c_end.number_input("Thời gian mô phỏng:", min_value=10.0, value=100.0, step=10.0)
+        delay_mode = c_mode.radio("Mô hình trễ:", ["Transport", "Inertial"])
+        try:
+            with profiler.span("m2.event_sim", "compute"):
+                seq_netlist, sim_result, (cp_delay, cp_path) = simulate_text(
+                    seq_text, clock_period, input_period, sim_end, inertial=delay_mode == "Inertial")
+        except ValueError as exc:
+            st.error(f"Lỗi netlist: {exc}")
+        else:
+            # Xung hẹp hơn độ trễ đường tới hạn trên net nội bộ/đầu ra được coi là glitch
+            glitch_count = sum(len(find_glitches(wave, cp_delay)) for net, wave in sim_result.waveforms.items()
+                               if net not in seq_netlist.inputs)
+            c_ev, c_eps, c_gl, c_cp = st.columns(4)
+            c_ev.metric("Số sự kiện", f"{sim_result.events:,}")
+            c_eps.metric("Sự kiện / giây", f"{sim_result.events_per_second:,.0f}")
+            c_gl.metric("Số glitch", glitch_count)
+            c_cp.metric("Đường trễ tới hạn", f"{cp_delay:g}")
+            st.caption("Critical path: " + " → ".join(cp_path))
+            with profiler.span("m2.waveform", "figure"):
+                fig_wave = waveform_figure(sim_result.waveforms, sim_end)
+            with profiler.span("m2.waveform", "render"):
+                st.plotly_chart(fig_wave, use_container_width=True)
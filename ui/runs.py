@@ -0,0 +1,78 @@
+"""Module 6: kho kết quả mô phỏng đã lưu trên đĩa (xem lại, tải về, xóa)."""
+import importlib.util
+import json
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from semilab.store import get_store
+
+PREVIEW_ROWS = 1000  # Số dòng xem trước gửi lên trình duyệt
+
+
+def save_button(kind, params, key):
+    """Nút lưu kết quả hiện tại (công việc ``semilab.jobs`` loại ``kind``) vào kho; dùng trong các module khác."""
+    if st.button("💾 Lưu vào kho kết quả", key=key):
+        store = get_store()
+        existed = store.get(kind, params) is not None
+        run = store.run(kind, params)
+        st.success(f"{'Đã có sẵn' if existed else 'Đã lưu'} run `{run.key}` ({run.rows:,} dòng) - "
+                   f"xem lại và tải về ở Module 6.")
+
+
+# ==============================================================================
+# MODULE 6: KHO KẾT QUẢ
+# ==============================================================================
+def render(profiler):
+    st.markdown('<div class="module-header"><h3>🗄️ Module 6: Kho kết quả mô phỏng (Run Store)</h3></div>', unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="concept-box">
+    Kết quả được lưu bằng nút <b>💾 Lưu vào kho kết quả</b> ở Module 2 và 3 nằm trên đĩa dưới dạng cột (NumPy),
+    mỗi bộ tham số chỉ lưu một lần. Lần sau chạy lại cùng tham số, kết quả được đọc lại ngay thay vì tính lại.
+    </div>
+    """, unsafe_allow_html=True)
+
+    store = get_store()
+    # Thứ tự theo thời điểm tạo (ổn định giữa các rerun, khác thứ tự LRU của kho)
+    runs = sorted(store.runs(), key=lambda run: run.created, reverse=True)
+    c_runs, c_size, c_dir = st.columns([1, 1, 2])
+    c_runs.metric("Số run", len(runs))
+    c_size.metric("Dung lượng", f"{store.total_bytes() / 2**20:.1f} / {store.max_bytes / 2**20:.0f} MB")
+    c_dir.caption(f"Thư mục: `{store.root}`. Khi vượt giới hạn, các run lâu nhất chưa dùng bị xóa.")
+    if not runs:
+        st.info("Kho đang trống.")
+        return
+
+    st.dataframe(pd.DataFrame([{
+        "Key": run.key, "Loại": run.kind, "Tham số": json.dumps(run.params, ensure_ascii=False),
+        "Số dòng": run.rows, "kB": run.nbytes / 1024,
+        "Tạo lúc": datetime.fromtimestamp(run.created).strftime("%Y-%m-%d %H:%M:%S"),
+    } for run in runs]), hide_index=True, use_container_width=True)
+
+    by_key = {run.key: run for run in runs}
+    key = st.selectbox("Xem run:", list(by_key), format_func=lambda k: f"{by_key[k].kind} - {k}")
+    run = store.get_key(key)
+    if run is None:
+        st.warning("Run này vừa bị xóa.")
+        return
+    with profiler.span("m6.load", "compute"):
+        columns = run.load()
+    st.json(run.params)
+    if run.rows > PREVIEW_ROWS:
+        st.caption(f"Hiển thị {PREVIEW_ROWS:,} dòng đầu tiên / {run.rows:,} dòng.")
+    with profiler.span("m6.load", "render"):
+        st.dataframe(pd.DataFrame({name: col[:PREVIEW_ROWS] for name, col in columns.items()}), hide_index=True)
+
+    c_csv, c_parquet, c_delete = st.columns(3)
+    with c_csv:
+        st.download_button("⬇️ Tải CSV", run.to_csv, file_name=f"{run.kind}_{run.key}.csv", mime="text/csv")
+    with c_parquet:
+        if importlib.util.find_spec("pyarrow") is not None:
+            st.download_button("⬇️ Tải Parquet", run.to_parquet, file_name=f"{run.kind}_{run.key}.parquet",
+                               mime="application/octet-stream")
+    with c_delete:
+        if st.button("🗑️ Xóa run này", key="delete_run"):
+            store.delete(run.key)
+            st.rerun()
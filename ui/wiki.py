@@ -0,0 +1,41 @@
+"""Module 4: wiki bán dẫn với tìm kiếm gần đúng."""
+import streamlit as st
+
+from semilab.wiki import get_wiki_index
+
+WIKI_MAX_RESULTS = 50    # Số bài wiki tối đa hiển thị cho một lần tìm kiếm
+
+
+# ==============================================================================
+# MODULE 4: WIKI BÁN DẪN
+# ==============================================================================
+def render(profiler):
+    st.markdown('<div class="module-header"><h3>📚 Module 4: Wiki Bán dẫn Cá nhân</h3></div>', unsafe_allow_html=True)
+    
+    st.write("Tổng hợp các thuật ngữ và kiến thức cốt lõi mà một sinh viên Vi mạch cần nhớ.")
+    
+    # Tìm kiếm (chỉ mục được dựng một lần và dùng chung giữa các lần rerun)
+    with profiler.span("m4.index", "compute"):
+        wiki_index = get_wiki_index()
+    col_search, col_tag = st.columns([3, 1])
+    search_term = col_search.text_input("🔍 Tìm kiếm thuật ngữ (ví dụ: Doping, Fermi, vung cam, fremi):")
+    tag_filter = col_tag.selectbox("Chủ đề:", ["Tất cả"] + wiki_index.tags)
+    
+    with profiler.span("m4.search", "compute"):
+        results = wiki_index.search(search_term, tag=None if tag_filter == "Tất cả" else tag_filter)
+        corrected = wiki_index.correct_query(search_term) if search_term else None
+    if search_term and not results:
+        st.warning("Không tìm thấy thuật ngữ phù hợp.")
+    elif corrected:
+        st.caption(f"🔎 Hiển thị kết quả gần đúng cho: **{corrected}**")
+    elif len(results) > WIKI_MAX_RESULTS:
+        st.caption(f"Hiển thị {WIKI_MAX_RESULTS} / {len(results)} kết quả phù hợp nhất.")
+    
+    # Hiển thị wiki
+    with profiler.span("m4.articles", "render"):
+        cols = st.columns(2)
+        for idx, (_, entry) in enumerate(results[:WIKI_MAX_RESULTS]):
+            with cols[idx % 2]:
+                with st.expander(f"📖 {entry.title}", expanded=True):
+                    st.badge(entry.tag)
+                    st.markdown(entry.content)